@@ -1,11 +1,23 @@
 from datetime import datetime, timedelta
-from collections import Counter
+import hmac
 import streamlit as st
-import requests
-import plotly.graph_objects as go
-import pandas as pd
 import os
+import dataflow
+import graphql_enrichment
+import perf_metrics
+import profile_capture
+import readme_enrichment
+import repo_export
+import search_profiles
+import snapshot_diff
 import snapshot_utils
+import static_report
+import trends
+
+# requests, pandas, plotly and numpy are imported where they are first used: pandas is only needed
+# for the snapshot fallback (inside snapshot_utils), plotly only once the stats section renders and
+# numpy (search index, topic matrix, near-duplicates) once the views are built, so keeping them out
+# of module import keeps container cold starts short (see profile_imports.py).
 
 # Bundled CSV fallback under snapshots/ (filename reflects date added to this repo)
 SNAPSHOTS_DIR = "snapshots"
@@ -15,91 +27,111 @@ SNAPSHOT_CSV_PATH = os.path.join(SNAPSHOTS_DIR, SNAPSHOT_CSV_FILENAME)
 # Set page configuration FIRST - must be the very first Streamlit command
 st.set_page_config(layout="wide")
 
-# Import after set_page_config: the module imports Streamlit/plotly and avoids init-order issues
+# Admin-only diagnostics, both gated on the ADMIN_SECRET secret:
+# ?debug=<ADMIN_SECRET> shows the per-phase timing panel for this run (spans are recorded for the
+# run even when LOWCODE_METRICS is off); ?profile=<ADMIN_SECRET> runs this execution under cProfile
+# and offers the result as a download.
+try:
+    _admin_secret = st.secrets.get("ADMIN_SECRET")
+except Exception:
+    _admin_secret = None
+
+
+def _admin_param(name):
+    value = st.query_params.get(name)
+    return bool(_admin_secret and value) and hmac.compare_digest(str(value), str(_admin_secret))
+
+
+show_debug_panel = _admin_param("debug")
+profile_capture.stop_unfinished()  # a rerun cut short by st.stop(), a rerun request or an error
+_profiler = profile_capture.start() if _admin_param("profile") else None
+perf_metrics.begin_run(force=show_debug_panel)
+
+# Import after set_page_config: the module imports Streamlit and avoids init-order issues
 # on Streamlit Cloud. Module is named keyword_analysis (not "analysis") to avoid clashing with
 # Streamlit's multipage/script registry keys.
-from keyword_analysis import display_analysis
+from keyword_analysis import render_analysis
 
 # GitHub API endpoint for searching repositories
-GITHUB_API_URL = "https://api.github.com/search/repositories"
-
-# Function to fetch repositories. Only repos with stars > 50 and updated in the last year are shown
-# Returns (repos, data_from_live_api).
+GITHUB_API_URL = f"{snapshot_utils.GITHUB_API_BASE}/search/repositories"
+# Seconds a page load may sleep for a GitHub rate limit to reset; beyond that the crawl stops and the
+# snapshot is shown, and enrichment skips the remaining repos. take_snapshot.py, which nobody waits
+# on, sleeps through resets instead
+FETCH_MAX_RATE_LIMIT_WAIT = 0
+
+# Function to fetch repositories: every query of every search profile (search_profiles.toml), crawled
+# concurrently under one rate-limit budget. Returns (repos, data_from_live_api); each repo lists the
+# profiles it belongs to in repo["profiles"].
 # Pass *github_token* so search requests use the GitHub API with auth — on Streamlit Cloud the
 # shared egress IP hits the anonymous search rate limit (60/h) almost immediately; without a
 # token the app falls back to bundled CSV and auto-snapshot is skipped.
 def fetch_low_code_repos(
-    # Quoted phrases match GitHub search *literally*, so only repos whose name/description/
-    # README/topics contain one of these exact forms are returned. This avoids matches
-    # coming from unrelated tokens like "low-level" + "code(s)".
-    query='"low-code" OR "lowcode" OR "low code"',
+    profiles=None,
     sort="stars",
     order="desc",
     per_page=100,
     max_pages=10,
     github_token=None,
 ):
-    query += " stars:>=" + "50" + " pushed:>=" + (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
-    all_repos = []
-    api_failed = False
+    import requests
+    from github_rate_limit import RateLimitExhausted
 
+    profiles = profiles or search_profiles.load_profiles()
     headers = {"Accept": "application/vnd.github+json"}
     if github_token:
         headers["Authorization"] = f"Bearer {github_token}"
 
-    for page in range(1, max_pages + 1):
-        params = {
-            "q": query,
-            "sort": sort,
-            "order": order,
-            "per_page": per_page,
-            "page": page
-        }
-        try:
-            response = requests.get(GITHUB_API_URL, params=params, headers=headers, timeout=10)
-            if response.status_code == 200:
-                repos = response.json()["items"]
-                if not repos:
-                    break
-                all_repos.extend(repos)
-            else:
-                st.error(f"Error fetching data from GitHub API: {response.status_code}")
-                api_failed = True
+    # Runs in worker threads: errors are collected and shown once the crawls are done
+    def crawl_query(query, gate):
+        repos, stats = [], {"requests": 0, "error": None}
+        for page in range(1, max_pages + 1):
+            params = {
+                "q": query,
+                "sort": sort,
+                "order": order,
+                "per_page": per_page,
+                "page": page
+            }
+            try:
+                gate.wait()
+                stats["requests"] += 1
+                with perf_metrics.span("fetch.api_page"):
+                    response = requests.get(GITHUB_API_URL, params=params, headers=headers, timeout=10)
+                gate.update(response)
+            except RateLimitExhausted as e:
+                stats["error"] = f"GitHub API rate limit exhausted: {e}"
+                break
+            except requests.exceptions.RequestException as e:
+                stats["error"] = f"GitHub API request failed: {str(e)}"
+                break
+            if response.status_code != 200:
+                stats["error"] = f"Error fetching data from GitHub API: {response.status_code}"
+                break
+            items = response.json()["items"]
+            if not items:
                 break
-        except requests.exceptions.RequestException as e:
-            st.error(f"GitHub API request failed: {str(e)}")
-            api_failed = True
-            break
+            repos.extend(items)
+        return repos, stats
+
+    all_repos, crawls = search_profiles.crawl_profiles(profiles, crawl_query, max_wait=FETCH_MAX_RATE_LIMIT_WAIT)
+    perf_metrics.incr("api_calls", sum(stats["requests"] for stats in crawls.values()))
+    errors = sorted({stats["error"] for stats in crawls.values() if stats["error"]})
+    for error in errors:
+        st.error(error)
+    # A profile with a failed search would be missing repos: use the snapshot for all of them
+    api_failed = bool(errors)
 
     loaded_from_snapshot = False
     # If API failed or returned no data, load from bundled snapshot CSV
     if api_failed or not all_repos:
         loaded_from_snapshot = True
+        perf_metrics.incr("snapshot_fallbacks")
         try:
             if os.path.exists(SNAPSHOT_CSV_PATH):
                 st.warning(
                     f"⚠️ GitHub API is unavailable. Loading data from {SNAPSHOT_CSV_PATH} instead."
                 )
-                df = pd.read_csv(SNAPSHOT_CSV_PATH, encoding='utf-8')
-                
-                # Convert CSV data back to GitHub API format
-                all_repos = []
-                for _, row in df.iterrows():
-                    repo_data = {
-                        "name": row["Name"],
-                        "stargazers_count": row["Stars⭐"],
-                        "pushed_at": row["Last Updated"] + "T00:00:00Z",
-                        "created_at": row["First Commit"] + "T00:00:00Z",
-                        "html_url": row["URL"],
-                        "forks": row["Forks"],
-                        "open_issues": row["Issues"],
-                        "language": row["Language"] if row["Language"] and row["Language"] != "No language" else None,
-                        "license": {"name": row["License"]} if row["License"] != "No license" else None,
-                        "description": row["Description"] if row["Description"] != "No description" else None,
-                        "topics": row["Topics"].split(",") if pd.notna(row["Topics"]) and row["Topics"] else []
-                    }
-                    all_repos.append(repo_data)
-                
+                all_repos = snapshot_utils.load_snapshot_repos(SNAPSHOT_CSV_PATH)
                 st.info(f"✅ Loaded {len(all_repos)} repositories from snapshot data.")
             else:
                 st.error(
@@ -112,83 +144,132 @@ def fetch_low_code_repos(
     return all_repos, data_from_live_api
 
 
+@st.cache_resource(show_spinner="Building search index...", max_entries=4)
+def get_search_index(dataset_version, _repos):
+    """Search index shared by all sessions that loaded the same dataset (keyed on its version)."""
+    from search_index import SearchIndex
+
+    return SearchIndex(_repos)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def get_topic_matrix(dataset_version, _repos):
+    """Repo x topic matrix shared by all sessions that loaded the same dataset (keyed on its version)."""
+    import topic_analytics
+
+    return topic_analytics.build_topic_matrix(_repos)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def get_duplicate_clusters(dataset_version, _repos):
+    """html_url -> near-duplicate cluster number, shared by all sessions that loaded the same dataset."""
+    import near_duplicates
+
+    return near_duplicates.cluster_ids(_repos, near_duplicates.find_clusters(_repos))
+
+
+# Topics matching the search query itself: nearly every repo has one, so they would top every pair
+SEARCH_TOPICS = frozenset({"low-code", "lowcode", "low-code-platform", "no-code", "nocode"})
+
+
+@st.cache_data(show_spinner=False)
+def snapshot_growth(old_path, new_path, mtimes):
+    """Growth table between two snapshot files; *mtimes* is part of the cache key."""
+    return trends.snapshot_growth(old_path, new_path)
+
+
+@st.cache_data(show_spinner=False)
+def snapshot_changes(old_path, new_path, mtimes):
+    """Change records between two snapshot files; *mtimes* is part of the cache key."""
+    return list(snapshot_diff.diff_snapshots(old_path, new_path))
+
+
+@st.cache_data(show_spinner="Loading snapshot...", max_entries=2)
+def load_shared_snapshot(marker_mtime, path):
+    """Repos of the snapshot announced by the reload marker; *marker_mtime* is part of the cache key."""
+    return snapshot_utils.load_snapshot_repos(path)
+
+
 # Fetch repositories
 try:
     _github_token = st.secrets.get("GITHUB_TOKEN")
 except Exception:
     _github_token = None
 
-if 'repos' not in st.session_state:
-    st.session_state.repos, st.session_state.data_from_live_api = fetch_low_code_repos(
-        github_token=_github_token
-    )
+# Snapshots refreshed out of band (take_snapshot.py --daemon): sessions load the newest one instead
+# of crawling GitHub, and drop their data to load it again whenever the daemon signals a refresh.
+# The marker expires when the daemon stops refreshing, and sessions crawl again.
+_reload_marker = snapshot_utils.reload_marker()
+if _reload_marker and st.session_state.get('reload_marker') != _reload_marker[0]:
+    if 'reload_marker' in st.session_state:
+        perf_metrics.incr("snapshot_reloads")
+    for key in ('repos', 'data_from_live_api', 'repos_version', 'readmes_enriched'):
+        st.session_state.pop(key, None)
+    st.session_state.reload_marker = _reload_marker[0]
 
-# List of excluded repositories
-excluded_repos = {
-    "JeecgBoot", "supervision", "amis", "APIJSON", "awesome-lowcode", "LoRA", "activepieces", 
-    "gop", "pycaret", "viztracer", "joint", "mometa", "asmjit", "NullAway", 
-    "self-hosted-ai-starter-kit", "sparrow", "smart-admin", "tracecat", "dooringx", 
-    "Genie.jl", "instill-core", "metarank", "dataprep", "hyperlight", "go-streams",
-    "dashpress", "lowcode-demo", "diboot", "steedos-platform", "opsli-boot", 
-    "PiML-Toolbox", "marsview", "openDataV", 
-    "Awesome-CVPR2024-CVPR2021-CVPR2020-Low-Level-Vision", "dart_native", 
-    "low-level-programming", "vue-component-creater-ui", "ovine", "vlife", "beelzebub",
-    "mtbird", "Awesome-CVPR2024-Low-Level-Vision", "create-chart", "crusher",
-    "yuzi-generator", "pc-Dooring", "citrus", "Conduit", "react-admin-firebase",
-    "apex", "fire-hpp", "awesome-lowcode", "karamel", "flowpipe", "fast-trade", "pd",
-    "MetaLowCode", "vue-low-code", "css-text-portrait-builder", "awesome-low-code",
-    "langwatch", "web-builder", "awesome-nocode-lowcode", "LLFlow", "AS-Editor",
-    "mfish-nocode", "naas", "Awesome-ECCV2024-ECCV2020-Low-Level-Vision", "dataCompare",
-    "AIVoiceChat", "illa", "praxis-ide", "low-level-design", "HuggingFists", "dagr",
-    "pddon-win", "all-classification-templetes-for-ML", "node-red-dashboard", "Palu",
-    "Liuma-platform", "crudapi-admin-web", "Awesome-ICCV2023-Low-Level-Vision", "pocketblocks",
-    "plugins", "LLFormer", "vue-admin", "Low-Code", "FTC-Skystone-Dark-Angels-Romania-2020",
-    "WrldTmpl8", "daas-start-kit", "Meta3D", "css-selector-tool", "corebos", "wave-apps",
-    "self-hosted", "Automation-workflow", "banglanmt", "Nalu", "no-code-architects-toolkit",
-    "MasteringMCU2", "Liuma-engine", "lowcode-tools", "Diff-Plugin", "mfish-nocode-view",
-    "backroad", "zcbor", "powerfx-samples", "MemoryNet", "igop", "underTheHoodOfExecutables",
-    "StringReloads", "lowcode-b", "EigenTrajectory", "pluto", "pixiebrix-extension", "dozer",
-    "vite-vue3-lowcode",
-    "qLDPC", "Visio", "Hack-SQL", "cow-Low-code", "LoRA-Pro", "OTE-GAN", "opsli-ui", "three-editor",
-    "lowcode-code-generator-demo", "QuadPrior", "UIGO", "SoRA", "grid-form", "CcView", "verus",
-    "fastgraphml", "arcane.cpp", "lowcode-engine-ext", "Liuma-platform", "lowcode-plugins", "turbo",
-    "DegAE_DegradationAutoencoder", "www-project-top-10-low-code-no-code-security-risks", "lowcode-materials",
-    "Vibration-Based-Fault-Diagnosis-with-Low-Delay", "alignment-attribution-code", "VideoUIKit-Web-React",
-    "ReGitLint", "pandas-gpt", "yao-knowledge", "snac", "relora", "mettle", "Tenon", "noncode-projects-2024", "EvLight",
-
-    # snapshot-2026-04-19 audit: propaganda/search noise, awesome lists, Chinese-only descriptions
-    "china-dictatorship", "china-dictatroship-7", "cihna-dictattorshrip-8", ".github",
-    "awesome-n8n-templates", "awesome-saas", "TopAutomationTools",
-    "Juggle", "app-platform", "bga-god-assistant-config", "flowlong", "form-create",
-    "form-create-designer", "jeelowcode", "jvs", "nebulajs-cloud", "nop-chaos",
-    "pageplug", "qiaoqiaoyun", "react-visual-design", "v6.dooring.public",
-}
-
-# Filter out excluded repositories
-st.session_state.repos = [repo for repo in st.session_state.repos if repo['name'] not in excluded_repos]
+if 'repos' not in st.session_state:
+    with perf_metrics.span("fetch"):
+        if _reload_marker:
+            st.session_state.repos = load_shared_snapshot(*_reload_marker)
+            st.session_state.data_from_live_api = False
+            st.session_state.snapshot_taken = True  # snapshots are the daemon's job
+        else:
+            st.session_state.repos, st.session_state.data_from_live_api = fetch_low_code_repos(
+                github_token=_github_token
+            )
+    # Profile membership and exclusions follow the current search_profiles.toml, whatever the source
+    # (a fresh crawl, a snapshot taken under an older profile file, the bundled CSV)
+    with perf_metrics.span("exclusion_filter"):
+        st.session_state.repos = search_profiles.apply_profiles(
+            st.session_state.repos, search_profiles.load_profiles())
+else:
+    perf_metrics.incr("session_cache_hits")
+
+# Optional (LOWCODE_README_ENRICHMENT=1): the category analysis also reads a README excerpt per repo.
+# READMEs are cached on disk, so later sessions only send conditional requests for changed repos.
+if readme_enrichment.ENABLED and 'readmes_enriched' not in st.session_state:
+    with perf_metrics.span("readme_enrichment"):
+        readme_enrichment.enrich_repos(st.session_state.repos, token=_github_token,
+                                       max_wait=FETCH_MAX_RATE_LIMIT_WAIT)
+    st.session_state.readmes_enriched = True
+# Keys the session's derived artifacts and the shared caches: a digest of every field the views read,
+# so a reload that only changes stars, forks or activity dates still invalidates them
+if 'repos_version' not in st.session_state:
+    st.session_state.repos_version = static_report.view_digest(st.session_state.repos)
+# Derived artifacts (filtered list, table rows, figures, analyses) are memoized per session and only
+# recomputed when one of their inputs changes; see dataflow.dashboard_flow() for the graph.
+if 'dataflow' not in st.session_state:
+    st.session_state.dataflow = dataflow.dashboard_flow(get_search_index, get_duplicate_clusters)
+flow = st.session_state.dataflow
 
 # Default "Repository Table" filters (must match slider defaults below): min stars 50, last commit
 # within the last year. Snapshots should store this visible list, not the raw post-search list.
 if "today" not in st.session_state:
     st.session_state.today = datetime.today()
-_one_year_ago = st.session_state.today - timedelta(days=365)
-repos_for_default_table_view = [
-    repo
-    for repo in st.session_state.repos
-    if repo["stargazers_count"] >= 50
-    and datetime.strptime(repo["pushed_at"].split("T")[0], "%Y-%m-%d").date()
-    >= _one_year_ago.date()
-]
+flow.set("today", st.session_state.today)
 
 # Auto-snapshot: persist the current live list when no recent snapshot exists.
 # If a GITHUB_TOKEN secret is configured the snapshot is also committed to the
 # repo so it survives Streamlit Cloud restarts (ephemeral filesystem).
 if not st.session_state.get('snapshot_taken'):
     if st.session_state.get('data_from_live_api'):
+        # Every profile's repos: the snapshot stores the whole crawl with its profile memberships
+        repos_for_default_table_view = static_report.default_view(st.session_state.repos, st.session_state.today)
+        # Optional (LOWCODE_GRAPHQL_ENRICHMENT=1): store release / contributor / commit metrics with the snapshot
+        if graphql_enrichment.ENABLED and snapshot_utils.should_take_snapshot():
+            with perf_metrics.span("graphql_enrichment"):
+                graphql_enrichment.enrich_metrics(repos_for_default_table_view, token=_github_token,
+                                                  max_wait=FETCH_MAX_RATE_LIMIT_WAIT)
         saved_path = snapshot_utils.auto_snapshot(repos_for_default_table_view)
         st.session_state.snapshot_taken = True
         if saved_path:
             filename = os.path.basename(saved_path)
+            try:
+                default_profile = search_profiles.load_profiles()[0].name
+                static_report.generate_report(
+                    search_profiles.members(st.session_state.repos, default_profile), source=saved_path)
+            except Exception as e:  # the live view still works without a report
+                st.warning(f"Snapshot saved but the static report could not be generated ({e})")
             try:
                 gh_token = st.secrets.get("GITHUB_TOKEN")
             except Exception:
@@ -233,8 +314,6 @@ if not st.session_state.get('snapshot_taken'):
             "requests (recommended on Streamlit Cloud)."
         )
 
-repos = st.session_state.repos
-
 
 # Display the table
 st.title("Dashboard of Open-Source Low-Code Tools in GitHub")
@@ -248,6 +327,9 @@ st.markdown("""
 - [Repository Table](#repository-table)
 - [Selection Method](#selection-method)
 - [Global Statistics](#global-statistics)
+- [Topics](#topics)
+- [Trending](#trending)
+- [Snapshot Changes](#snapshot-changes)
 - [Low-code tools also mixing other related topics](#repository-analysis)
     - [Low-code and No-Code tools](#analysis-for-no-code)
     - [Low-code and Modeling tools](#analysis-for-modeling)
@@ -257,7 +339,12 @@ st.markdown("""
 
 st.markdown("<a name='quick-notes'></a>", unsafe_allow_html=True)
 st.write("## Quick notes:")
+profiles = search_profiles.load_profiles()
+if len(profiles) > 1:
+    st.write("- Pick a *Profile* to switch between the ecosystems covered by this dashboard.")
 st.write("- Use the sliders to filter the repositories. Click on a column header to sort the table.")
+st.write("- Use the search box to find tools by name, description or topic; matches are ranked by relevance.")
+st.write("- Tick *Collapse near-duplicates* to hide likely forks and mirrors of a listed tool.")
 st.write("- Hover over the table to search for specific reports or export the table as a CSV file.")
 st.write("- A few global stats are also available at the bottom of the page.")
 st.write("- Suggest improvements via the [GitHub repository of this dashboard](https://github.com/jcabot/oss-lowcode-tools)")
@@ -266,6 +353,26 @@ st.write("- Suggest improvements via the [GitHub repository of this dashboard](h
 st.markdown("<a name='repository-filters'></a>", unsafe_allow_html=True)
 st.write("## Repository Filters")
 
+# Search profiles (search_profiles.toml) are crawled together and every session holds the repos of all
+# of them, so switching profiles only changes which repos the dashboard shows. ?search_profile=<name>
+# picks the initial profile, e.g. to link to one ecosystem's dashboard (not ?profile=, which is the
+# admin profiler switch).
+if len(profiles) > 1:
+    profile_names = [p.name for p in profiles]
+    requested_profile = st.query_params.get("search_profile")
+    profile = st.selectbox(
+        "Profile", profile_names,
+        index=profile_names.index(requested_profile) if requested_profile in profile_names else 0,
+        format_func={p.name: p.title for p in profiles}.get, key="search_profile",
+    )
+    dataset_version = f"{st.session_state.repos_version}:{profile}"
+    repos = search_profiles.members(st.session_state.repos, profile)
+else:
+    dataset_version = st.session_state.repos_version
+    repos = st.session_state.repos
+flow.set("dataset_version", dataset_version)
+flow.set("repos", repos, key=dataset_version)
+
 # Add star filter slider
 min_stars = st.slider("Minimum Stars", min_value=50, max_value=100000, value=50, step=50)
 
@@ -285,48 +392,76 @@ min_date = st.slider(
     step=timedelta(days=1)
 )
 
+search_query = st.text_input("Search", placeholder="Name, description or topic, e.g. workflow automation")
+collapse_duplicates = st.checkbox(
+    "Collapse near-duplicates",
+    help="Show only the most-starred repository of each group of likely forks, mirrors and clones",
+)
+
 # Same subset as the main repository table (slider filters). Analysis sections must use this list,
 # not the full session list, so keyword breakdowns match what the table shows.
 filtered_repos = []
+# Default filter state: serve the pre-rendered report if it was built from this session's data
+report = None
+if repos and min_stars == 50 and min_date == one_year_ago and not search_query.strip() and not collapse_duplicates:
+    report = static_report.load_report_for(flow.get("default_view_digest"))
+    if report:
+        perf_metrics.incr("static_report_hits")
+flow.set("min_stars", min_stars)
+flow.set("min_date", min_date)
+flow.set("search_query", search_query)
+flow.set("collapse_duplicates", collapse_duplicates)
 if repos:
-    filtered_repos = [
-        repo
-        for repo in repos
-        if repo["stargazers_count"] >= min_stars
-        and datetime.strptime(repo["pushed_at"].split("T")[0], "%Y-%m-%d").date()
-        >= min_date.date()
-    ]
+    filtered_repos = flow.get("filtered")  # search results best match first
+    hidden_duplicates = flow.get("hidden_duplicates")
 
 
 if repos:
+    import plotly.graph_objects as go
+    import topic_analytics
+
     # Create a table with repository information. Only repos with stars >= min_stars and last commit >= min_date are shown
-    table_data = []
-  
-    for repo in filtered_repos:
-        table_data.append({
-            "Name": repo["name"],
-            "Stars⭐": repo['stargazers_count'],
-            "Last Updated": repo['pushed_at'].split('T')[0],
-            "First Commit": repo['created_at'].split('T')[0],
-            "URL": repo['html_url'],
-            "Forks": repo['forks'],
-            "Issues": repo['open_issues'],
-            "Language": repo['language'],
-            "License": repo['license']['name'] if repo['license'] else "No license",
-            "Description": (repo["description"] or "No description")[:200],
-            "Topics": repo['topics']
-        })
-    
-    st.write(f"Showing {len(table_data)} repositories")
-    st.dataframe(
-        table_data,
-        column_config={
-            "URL": st.column_config.LinkColumn("URL")
-        },
-        use_container_width=True,
-        height=(len(table_data)+1)*35+3,
-        hide_index=True
-    )
+    if report:
+        table_data = report["table"]
+    else:
+        table_data = flow.get("table_rows")
+
+    if search_query.strip():
+        st.write(f"Showing {len(table_data)} repositories matching \"{search_query.strip()}\", best match first")
+    else:
+        st.write(f"Showing {len(table_data)} repositories")
+    if hidden_duplicates:
+        st.caption(f"{hidden_duplicates} near-duplicates hidden")
+    with perf_metrics.span("dataframe_render"):
+        st.dataframe(
+            table_data,
+            column_config={
+                "URL": st.column_config.LinkColumn("URL")
+            },
+            use_container_width=True,
+            height=(len(table_data)+1)*35+3,
+            hide_index=True
+        )
+
+    # Server-side export of the table's repos plus their category flags. It is only built when asked
+    # for, so ordinary reruns don't carry it; the same export is streamed by data_api.py's /v1/export.
+    export_cols = st.columns([1, 1, 3])
+    with export_cols[0]:
+        export_format = st.selectbox(
+            "Export format", list(repo_export.FORMATS), key="export_format", label_visibility="collapsed",
+            format_func={"csv": "CSV", "jsonl": "JSON Lines", "parquet": "Parquet"}.get,
+        )
+    with export_cols[1]:
+        prepare_export = st.button("Prepare export", key="prepare_export")
+    if prepare_export:
+        with perf_metrics.span("export"):
+            export_file = repo_export.export_buffer(filtered_repos, export_format)
+        mime, extension = repo_export.FORMATS[export_format]
+        with export_cols[2]:
+            st.download_button(
+                f"Download {len(filtered_repos)} repositories (.{extension})", export_file,
+                file_name=f"lowcode-repos.{extension}", mime=mime, key="download_export",
+            )
 
     st.markdown("<a name='selection-method'></a>", unsafe_allow_html=True)
     st.subheader("Selection method")
@@ -353,78 +488,138 @@ if repos:
     st.markdown("<a name='global-statistics'></a>", unsafe_allow_html=True)
     st.subheader("Some global stats")
 
-    # Create a list of first commit dates
-    first_commit_dates = [datetime.strptime(repo['created_at'].split('T')[0], '%Y-%m-%d').date() for repo in
-                          filtered_repos]
-
-    # Grouping the data by year
-    years = [date.year for date in first_commit_dates]
-    year_counts = Counter(years)
+    if report:
+        year_bar_chart = report["figures"]["first_commit_years"]
+        star_box_plot = report["figures"]["stars"]
+        language_bar_chart = report["figures"]["languages"]
+    else:
+        year_bar_chart = flow.get("stats.first_commit_years")
+        star_box_plot = flow.get("stats.stars")
+        language_bar_chart = flow.get("stats.languages")
 
-    # Plotting the distribution of first commit dates by year
-    year_bar_chart = go.Figure(
-        data=[
-            go.Bar(
-                x=list(year_counts.keys()),
-                y=list(year_counts.values()),
+    cols = st.columns(2)
+    with perf_metrics.span("stats.render"):
+        with cols[0]:
+            st.plotly_chart(year_bar_chart, use_container_width=True)
+            st.plotly_chart(language_bar_chart, use_container_width=True)
+        with cols[1]:
+            st.plotly_chart(star_box_plot, use_container_width=True)
+
+    scatter_axis = st.radio("Stars against", ["age", "last_push"], horizontal=True,
+                            format_func={"age": "Repository age", "last_push": "Time since last push"}.get)
+    # Older report bundles predate the scatter, so fall back to drawing it from the filtered repos
+    stars_scatter = report["figures"].get(f"stars_vs_{scatter_axis}") if report else None
+    if stars_scatter is None:
+        stars_scatter = flow.get(f"stats.stars_vs_{scatter_axis}")
+    st.plotly_chart(stars_scatter, use_container_width=True)
+
+    st.markdown("<a name='topics'></a>", unsafe_allow_html=True)
+    st.subheader("Topics")
+    with perf_metrics.span("topics"):
+        topic_matrix = get_topic_matrix(dataset_version, repos)
+        if len(filtered_repos) != len(repos):
+            topic_matrix = topic_matrix.subset(filtered_repos)
+        popular_topics = topic_analytics.top_topics(topic_matrix, n=20)
+        common_pairs = topic_analytics.top_pairs(topic_matrix, n=15, exclude=SEARCH_TOPICS)
+    st.caption(f"GitHub topics of the {len(filtered_repos)} repositories in the table above.")
+    topic_cols = st.columns(2)
+    with topic_cols[0]:
+        topic_bar_chart = go.Figure(
+            data=[go.Bar(x=[c for _, c in popular_topics][::-1], y=[t for t, _ in popular_topics][::-1],
+                         orientation="h")]
+        )
+        topic_bar_chart.update_layout(
+            title="Most Used Topics",
+            xaxis_title="Number of Repositories",
+            height=600,
+        )
+        st.plotly_chart(topic_bar_chart, use_container_width=True)
+    with topic_cols[1]:
+        st.write("**Topics most often used together**")
+        st.dataframe(
+            [{"Topic": a, "Together with": b, "Repositories": n} for a, b, n in common_pairs],
+            use_container_width=True,
+            hide_index=True,
+        )
+        topic_choices = [t for t, _ in popular_topics if t not in SEARCH_TOPICS]
+        if topic_choices:
+            chosen_topic = st.selectbox("Related topics for", topic_choices)
+            with perf_metrics.span("topics.related"):
+                related = topic_analytics.related_topics(topic_matrix, chosen_topic, n=10)
+            st.dataframe(
+                [{"Topic": t, "Shared repositories": n, "Similarity": round(j, 2)} for t, n, j in related],
+                use_container_width=True,
+                hide_index=True,
             )
-        ]
-    )
-    year_bar_chart.update_layout(
-        title="Distribution of First Commit Dates by Year",
-        xaxis_title="Year of First Commit",
-        yaxis_title="Number of Repositories",
-        xaxis=dict(tickangle=45)
-    )
-
-    # Create a list of star counts
-    star_counts = [repo['stargazers_count'] for repo in filtered_repos]
 
-    # Plotting the distribution of repositories by star count using a boxplot
-    star_box_plot = go.Figure(
-        data=[
-            go.Box(
-                x=star_counts,
-                boxpoints="outliers",  # Show only outliers as points
-                jitter=0.5,
+    st.markdown("<a name='trending'></a>", unsafe_allow_html=True)
+    st.subheader("Trending")
+    snapshots = snapshot_utils.list_snapshots()
+    if len(snapshots) < 2:
+        st.info("Trending needs at least two dated snapshots in snapshots/.")
+    else:
+        snapshot_paths = dict(snapshots)
+        snapshot_dates = list(snapshot_paths)
+        trend_cols = st.columns(2)
+        with trend_cols[0]:
+            trend_from = st.selectbox("From snapshot", snapshot_dates[:-1], index=len(snapshot_dates) - 2)
+        with trend_cols[1]:
+            later_dates = [d for d in snapshot_dates if d > trend_from]
+            trend_to = st.selectbox("To snapshot", later_dates, index=len(later_dates) - 1)
+        with perf_metrics.span("trending"):
+            old_path, new_path = snapshot_paths[trend_from], snapshot_paths[trend_to]
+            growth = snapshot_growth(
+                old_path, new_path, (os.path.getmtime(old_path), os.path.getmtime(new_path))
             )
-        ]
-    )
-    star_box_plot.update_layout(
-        title="Distribution of Repositories by Star Count",
-        xaxis_title="",
-        yaxis_title="Number of Stars",
-        xaxis=dict(showticklabels=False)
-    )
-
-    # Create a list of languages from filtered_repos
-    languages = [repo['language'] for repo in filtered_repos if repo['language']]
-
-    # Count the occurrences of each language
-    language_counts = Counter(languages)
-
-    # Plotting the aggregation of repositories by language
-    language_bar_chart = go.Figure(
-        data=[
-            go.Bar(
-                x=list(language_counts.keys()),
-                y=list(language_counts.values()),
+            # Same subset as the repository table above
+            table_urls = {trends.url_key_str(repo["html_url"]) for repo in filtered_repos}
+            growth = growth[trends.url_key(growth["URL"]).isin(table_urls)]
+            rising, declining = trends.rank_trending(growth, n=10)
+        st.caption(
+            f"Growth over {(trend_to - trend_from).days} days for the {len(growth)} repositories of the "
+            "table above that appear in both snapshots."
+        )
+        trend_columns = {
+            "Name": "Name", "URL": "URL", "stars_old": "Stars before", "stars_new": "Stars after",
+            "stars_per_day": "Stars/day", "star_growth_pct": "Stars %", "forks_per_day": "Forks/day",
+            "issues_per_day": "Issues/day",
+        }
+        for title, frame in (("Fastest rising", rising), ("Slowest growing / declining", declining)):
+            st.write(f"**{title}**")
+            st.dataframe(
+                frame[list(trend_columns)].rename(columns=trend_columns).round(2),
+                column_config={"URL": st.column_config.LinkColumn("URL")},
+                use_container_width=True,
+                hide_index=True,
             )
-        ]
-    )
-    language_bar_chart.update_layout(
-        title="Aggregation of Repositories by Language",
-        xaxis_title="Programming Language",
-        yaxis_title="Number of Repositories",
-        xaxis=dict(tickangle=45)
-    )
 
-    cols = st.columns(2)
-    with cols[0]:
-        st.plotly_chart(year_bar_chart, use_container_width=True)
-        st.plotly_chart(language_bar_chart, use_container_width=True)
-    with cols[1]:
-        st.plotly_chart(star_box_plot, use_container_width=True)
+        # Whole snapshots, not just the table: removed repos are by definition not in it
+        st.markdown("<a name='snapshot-changes'></a>", unsafe_allow_html=True)
+        st.subheader("Snapshot Changes")
+        with perf_metrics.span("snapshot_diff"):
+            changes = snapshot_changes(
+                old_path, new_path, (os.path.getmtime(old_path), os.path.getmtime(new_path))
+            )
+        st.caption(
+            f"Everything that changed between the {trend_from} and {trend_to} snapshots. "
+            "The same changelog is available as JSON lines from `python snapshot_diff.py --format jsonl`."
+        )
+        change_labels = {"added": "New", "removed": "Dropped", "renamed": "Renamed / moved",
+                         "stars": "Star jumps"}
+        by_kind = {kind: [c for c in changes if c["change"] == kind] for kind in change_labels}
+        change_cols = st.columns(len(change_labels))
+        for col, (kind, label) in zip(change_cols, change_labels.items()):
+            col.metric(label, len(by_kind[kind]))
+        for kind, label in change_labels.items():
+            if by_kind[kind]:
+                with st.expander(f"{label} ({len(by_kind[kind])})"):
+                    st.dataframe(
+                        [{k: v for k, v in c.items() if k != "change"} for c in by_kind[kind]],
+                        column_config={"url": st.column_config.LinkColumn("url"),
+                                       "old_url": st.column_config.LinkColumn("old_url")},
+                        use_container_width=True,
+                        hide_index=True,
+                    )
 
     # Keyword breakdowns use *only* filtered_repos — the same objects as the dataframe above
     # for this run (same slider values). Nested here so analysis never runs without the table.
@@ -436,8 +631,33 @@ if repos:
     )
     for keyword in ["no-code", "modeling", "uml", "ai"]:
         st.write(f"### Analysis for '{keyword}'")
-        display_analysis(filtered_repos, keyword)
+        if report:
+            render_analysis(keyword, report["analysis"][keyword]["figure"], report["analysis"][keyword]["rows"])
+        else:
+            render_analysis(keyword, *flow.get(f"analysis.{keyword}"))
         st.markdown("---")
 
 else:
     st.write("No repositories found or there was an error fetching data.")
+
+# Close the timing run; the admin panel itself is rendered outside it.
+_metrics_run = perf_metrics.end_run()
+if show_debug_panel and _metrics_run:
+    with st.expander("⏱️ Performance (admin)", expanded=True):
+        st.write("**This run** (spans in completion order, counters)")
+        st.dataframe(_metrics_run["spans"], hide_index=True, use_container_width=True)
+        st.json(_metrics_run["counters"])
+        st.write("**This process** (aggregated since start, Prometheus format)")
+        st.code(perf_metrics.prometheus_text(), language="text")
+
+if _profiler is not None:
+    _capture = profile_capture.finish(_profiler)
+    with st.expander("🔬 Profile of this rerun (admin)", expanded=True):
+        st.download_button(
+            "Download profile (.prof)",
+            _capture.prof_bytes,
+            file_name=_capture.file_name,
+            mime="application/octet-stream",
+        )
+        st.caption("Open with `python -m pstats <file>` or `snakeviz <file>`.")
+        st.code(_capture.summary, language="text")
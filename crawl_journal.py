@@ -0,0 +1,91 @@
+"""
+crawl_journal.py – Page-level checkpoints for the search crawl in take_snapshot.py.
+
+Each successfully fetched search page is appended (and fsynced) to a JSONL
+journal as soon as it arrives, so a crawl that stops at page 7 can be rerun
+and only requests pages 7 onwards. One journal exists per crawl identity
+(query incl. its date cutoff, sort, order, page size), under
+LOWCODE_CRAWL_JOURNAL (default .cache/crawl/):
+
+    <key>.jsonl     {"crawl": {...}}                                   first line
+                    {"page": 1, "total_count": 812, "items": [...]}     one line per page
+
+A line cut short by a crash is ignored on load. The journal is discarded once
+the snapshot built from it has been published; journals of abandoned crawls
+are pruned after JOURNAL_MAX_AGE seconds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+
+JOURNAL_DIR = os.environ.get(
+    "LOWCODE_CRAWL_JOURNAL",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "crawl"),
+)
+JOURNAL_MAX_AGE = 2 * 24 * 3600
+
+
+class CrawlJournal:
+    """Fetched pages of one crawl, loaded from and appended to its journal file."""
+
+    def __init__(self, crawl: dict, directory: str | None = None):
+        self.crawl = crawl
+        self.directory = directory or JOURNAL_DIR
+        key = hashlib.blake2b(json.dumps(crawl, sort_keys=True).encode(), digest_size=10).hexdigest()
+        self.path = os.path.join(self.directory, f"{key}.jsonl")
+        self.pages: dict[int, dict] = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # torn last line: everything before it is intact
+                    if "page" in entry:
+                        self.pages[entry["page"]] = entry
+        except OSError:
+            pass
+
+    def page(self, number: int) -> dict | None:
+        """The journaled page *number* ({"page", "total_count", "items"}), or None."""
+        return self.pages.get(number)
+
+    def record(self, number: int, total_count: int, items: list[dict]):
+        """Append page *number*; it is on disk when this returns."""
+        entry = {"page": number, "total_count": total_count, "items": items}
+        os.makedirs(self.directory, exist_ok=True)
+        new_file = not os.path.exists(self.path)
+        with open(self.path, "a", encoding="utf-8") as f:
+            if new_file:
+                f.write(json.dumps({"crawl": self.crawl}) + "\n")
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.pages[number] = entry
+
+    def discard(self):
+        """Delete the journal (after its snapshot was published)."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        self.pages = {}
+
+
+def prune(directory: str | None = None, max_age: float = JOURNAL_MAX_AGE) -> int:
+    """Remove journals not written to for *max_age* seconds; returns how many were removed."""
+    directory = directory or JOURNAL_DIR
+    if not os.path.isdir(directory):
+        return 0
+    removed = 0
+    cutoff = time.time() - max_age
+    for fname in os.listdir(directory):
+        path = os.path.join(directory, fname)
+        if fname.endswith(".jsonl") and os.path.getmtime(path) < cutoff:
+            os.remove(path)
+            removed += 1
+    return removed
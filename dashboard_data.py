@@ -0,0 +1,108 @@
+"""
+dashboard_data.py – Pure data helpers behind the dashboard views.
+
+Nothing here calls Streamlit, so the slider filtering, table rows and stats
+aggregations used by app.py can be benchmarked and tested on their own.
+Repos are dicts in GitHub Search API format.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from datetime import date, datetime
+
+# Upper bound on the points sent to the browser by the stars scatter; beyond it, points are binned
+SCATTER_MAX_POINTS = 5000
+# x axis of the stars scatter -> the date field it measures days since
+SCATTER_AXES = {"age": "created_at", "last_push": "pushed_at"}
+
+
+def filter_repos(repos: list[dict], min_stars: int, min_date: date | datetime) -> list[dict]:
+    """Repos with at least *min_stars* stars and a last push on or after *min_date*."""
+    # ISO dates sort lexicographically, so comparing the YYYY-MM-DD prefix avoids a
+    # strptime call per repo on every slider move.
+    cutoff = min_date.strftime("%Y-%m-%d")
+    return [
+        repo
+        for repo in repos
+        if repo["stargazers_count"] >= min_stars and repo["pushed_at"][:10] >= cutoff
+    ]
+
+
+def table_rows(repos: list[dict]) -> list[dict]:
+    """Rows of the main repository table."""
+    return [
+        {
+            "Name": repo["name"],
+            "Stars⭐": repo['stargazers_count'],
+            "Last Updated": repo['pushed_at'].split('T')[0],
+            "First Commit": repo['created_at'].split('T')[0],
+            "URL": repo['html_url'],
+            "Forks": repo['forks'],
+            "Issues": repo['open_issues'],
+            "Language": repo['language'],
+            "License": repo['license']['name'] if repo['license'] else "No license",
+            "Description": (repo["description"] or "No description")[:200],
+            "Topics": repo['topics'],
+        }
+        for repo in repos
+    ]
+
+
+def first_commit_year_counts(repos: list[dict]) -> Counter:
+    """Number of repos per year of first commit."""
+    return Counter(int(repo['created_at'][:4]) for repo in repos)
+
+
+def language_counts(repos: list[dict]) -> Counter:
+    """Number of repos per primary language (repos without a language are skipped)."""
+    return Counter(repo['language'] for repo in repos if repo['language'])
+
+
+def star_counts(repos: list[dict]) -> list[int]:
+    """Star count of every repo, in table order."""
+    return [repo['stargazers_count'] for repo in repos]
+
+
+def _grid_cell(values, grid: int):
+    import numpy as np
+
+    lo, hi = values.min(), values.max()
+    return np.minimum(((values - lo) / (hi - lo or 1) * grid).astype(np.int64), grid - 1)
+
+
+def scatter_points(repos: list[dict], today: date | datetime, axis: str = "age",
+                   max_points: int = SCATTER_MAX_POINTS) -> dict:
+    """Points of the stars scatter: days since the *axis* date (see SCATTER_AXES) against stars.
+
+    Up to *max_points* repos are returned as they are. Larger lists are binned on a
+    log-log grid of at most *max_points* cells and each non-empty cell is represented
+    by its most-starred repo, so the outline of the cloud and its outliers survive
+    while the payload stays bounded. Returns lists "days", "stars", "names" and
+    "count" (repos per point), plus "total" (len(repos)).
+    """
+    import numpy as np
+
+    n = len(repos)
+    field = SCATTER_AXES[axis]
+    stars = np.fromiter((repo["stargazers_count"] for repo in repos), dtype=np.int64, count=n)
+    dates = np.array([repo[field][:10] for repo in repos], dtype="datetime64[D]")
+    # Clamped to 1 so that pushes from today still have a place on the log axis
+    days = np.maximum((np.datetime64(today.strftime("%Y-%m-%d")) - dates).astype(np.int64), 1)
+    keep = np.arange(n)
+    count = np.ones(n, dtype=np.int64)
+    if n > max_points:
+        grid = math.isqrt(max_points)
+        cells = (_grid_cell(np.log10(days), grid) * grid
+                 + _grid_cell(np.log10(np.maximum(stars, 1)), grid))
+        order = np.lexsort((-stars, cells))  # by cell, most stars first within a cell
+        _, first, count = np.unique(cells[order], return_index=True, return_counts=True)
+        keep = order[first]
+    return {
+        "days": days[keep].tolist(),
+        "stars": stars[keep].tolist(),
+        "names": [repos[i]["name"] for i in keep.tolist()],
+        "count": count.tolist(),
+        "total": n,
+    }
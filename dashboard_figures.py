@@ -0,0 +1,182 @@
+"""
+dashboard_figures.py – Plotly figures of the dashboard's stats and analysis sections.
+
+Shared by app.py (live rendering) and static_report.py (pre-rendered bundle),
+so both draw exactly the same charts. Inputs are the aggregates computed by
+dashboard_data / keyword_analysis; plotly is imported on first use.
+"""
+
+from __future__ import annotations
+
+
+def first_commit_year_chart(year_counts: dict):
+    """Bar chart of repos per year of first commit."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=list(year_counts.keys()),
+                y=list(year_counts.values()),
+            )
+        ]
+    )
+    fig.update_layout(
+        title="Distribution of First Commit Dates by Year",
+        xaxis_title="Year of First Commit",
+        yaxis_title="Number of Repositories",
+        xaxis=dict(tickangle=45)
+    )
+    return fig
+
+
+def star_box_plot(stats: dict):
+    """Box plot of star counts from precomputed statistics (quantile_sketch.box_stats() format).
+
+    Only the five box numbers and the capped outliers are sent to the browser,
+    so the figure is the same size for a hundred repos or a million.
+    """
+    import plotly.graph_objects as go
+
+    data = []
+    if stats["count"]:
+        data.append(go.Box(
+            x=["Stars"],
+            q1=[stats["q1"]],
+            median=[stats["median"]],
+            q3=[stats["q3"]],
+            lowerfence=[stats["lowerfence"]],
+            upperfence=[stats["upperfence"]],
+            boxpoints=False,
+            name="Stars",
+        ))
+    if stats["outliers"]:
+        data.append(go.Scatter(
+            x=["Stars"] * len(stats["outliers"]),
+            y=stats["outliers"],
+            mode="markers",
+            marker=dict(size=5, opacity=0.6),
+            hovertemplate="%{y} stars<extra></extra>",
+            name="Outliers",
+        ))
+    fig = go.Figure(data=data)
+    fig.update_layout(
+        title="Distribution of Repositories by Star Count",
+        xaxis_title="",
+        yaxis_title="Number of Stars",
+        xaxis=dict(showticklabels=False),
+        showlegend=False,
+    )
+    notes = []
+    if not stats["exact"]:
+        notes.append(f"quartiles estimated from a t-digest of {stats['count']} repositories")
+    if len(stats["outliers"]) < stats["outliers_total"]:
+        notes.append(f"{len(stats['outliers'])} most extreme of {stats['outliers_total']} outliers shown")
+    if notes:
+        fig.add_annotation(
+            text="; ".join(notes).capitalize(),
+            xref="paper", yref="paper", x=0, y=1.02, showarrow=False, xanchor="left", yanchor="bottom",
+        )
+    return fig
+
+
+def language_bar_chart(language_counts: dict):
+    """Bar chart of repos per primary language."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=list(language_counts.keys()),
+                y=list(language_counts.values()),
+            )
+        ]
+    )
+    fig.update_layout(
+        title="Aggregation of Repositories by Language",
+        xaxis_title="Programming Language",
+        yaxis_title="Number of Repositories",
+        xaxis=dict(tickangle=45)
+    )
+    return fig
+
+
+_SCATTER_X_TITLES = {
+    "age": ("Stars vs. Repository Age", "Days since first commit"),
+    "last_push": ("Stars vs. Time Since Last Push", "Days since last push"),
+}
+
+
+def stars_scatter(points: dict, axis: str = "age"):
+    """WebGL scatter of stars against days since first commit or last push (log axes).
+
+    *points* comes from dashboard_data.scatter_points(); when it was binned, the
+    colour shows how many repos each point stands for.
+    """
+    import plotly.graph_objects as go
+
+    title, x_title = _SCATTER_X_TITLES[axis]
+    binned = len(points["days"]) < points["total"]
+    fig = go.Figure(
+        data=[
+            go.Scattergl(
+                x=points["days"],
+                y=points["stars"],
+                mode="markers",
+                customdata=list(zip(points["names"], points["count"])),
+                hovertemplate=(
+                    "<b>%{customdata[0]}</b><br>%{y} stars<br>%{x} days"
+                    + ("<br>most starred of %{customdata[1]} repos" if binned else "")
+                    + "<extra></extra>"
+                ),
+                marker=dict(
+                    size=5,
+                    opacity=0.7,
+                    color=points["count"] if binned else None,
+                    colorscale="Viridis" if binned else None,
+                    showscale=binned,
+                    colorbar=dict(title="Repos") if binned else None,
+                ),
+            )
+        ]
+    )
+    fig.update_layout(
+        title=title,
+        xaxis_title=x_title,
+        yaxis_title="Number of Stars",
+        xaxis_type="log",
+        yaxis_type="log",
+    )
+    if binned:
+        fig.add_annotation(
+            text=f"{len(points['days'])} of {points['total']} repositories shown, binned on a log grid",
+            xref="paper", yref="paper", x=0, y=1.02, showarrow=False, xanchor="left", yanchor="bottom",
+        )
+    return fig
+
+
+def category_pie(category: str, n_match: int, n_analyzed: int):
+    """Share of analysed repos mentioning *category* (Repository Analysis section)."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=[go.Pie(
+        labels=[f'Mentions {category}', f'No {category} mention'],
+        values=[n_match, n_analyzed - n_match],
+        hole=0.3,
+        marker_colors=['#2ecc71', '#e74c3c']
+    )])
+
+    fig.update_layout(
+        title=f'Distribution of {category} mentions in Low-Code Tools',
+        showlegend=True,
+        width=700,
+        height=500,
+        annotations=[{
+            'text': f'Total: {n_analyzed}',
+            'x': 0.5,
+            'y': 0.5,
+            'font_size': 20,
+            'showarrow': False
+        }]
+    )
+    return fig
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+data_api.py – Read-only HTTP API over the curated low-code repository list.
+
+Serves the latest snapshot in snapshots/ — the data the dashboard saves and
+falls back to, with the same search profile membership and exclusions
+(search_profiles.apply_profiles) the dashboard applies on load — so other
+teams can poll it instead of scraping the dashboard or re-running GitHub
+searches against our token quota. A new or rewritten snapshot, or an edited
+search_profiles.toml, is picked up automatically.
+
+Endpoints:
+    GET /v1/repos      filtered, paginated repo list
+    GET /v1/export     the whole filtered list as a CSV / JSONL / Parquet download, streamed
+    GET /v1/dataset    dataset version, source snapshot, size and categories
+
+/v1/repos parameters (defaults match the dashboard sliders):
+    min_stars=50                minimum stars
+    min_date=YYYY-MM-DD         last commit on or after (default: one year ago)
+    category=no-code|modeling|uml|ai   only repos in that Repository Analysis category
+    profile=<name>              search profile (default: the first, as in the dashboard)
+    q=...                       full-text search (search_index.py), best match first
+    page=1, per_page=100        pagination (per_page <= 1000), with a GitHub-style Link header
+
+Every item carries "categories", the analysis categories it belongs to, and
+"profiles", the search profiles it belongs to.
+
+/v1/export takes the same filters (no pagination) plus format=csv|jsonl|parquet
+and streams repo_export.py's rows, with one "Mentions <category>" column per
+category, in chunks as they are produced; nothing is cached.
+
+Caching:
+    - strong ETag per dataset version and query; If-None-Match -> 304 with no
+      body (cheap polling)
+    - gzip when the client sends Accept-Encoding: gzip (the ETag differs per encoding)
+    - encoded responses are memoized per dataset version
+
+Usage:
+    python data_api.py --port 8800
+    curl -s --compressed 'http://127.0.0.1:8800/v1/repos?min_stars=1000&category=ai'
+    curl -s -o lowcode.parquet 'http://127.0.0.1:8800/v1/export?format=parquet&min_stars=100'
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import repo_export
+import search_profiles
+import snapshot_utils
+from keyword_analysis import KEYWORD_SETS, categorize_repos
+from search_index import SearchIndex
+from static_report import view_digest
+
+DEFAULT_MIN_STARS = 50
+DEFAULT_PER_PAGE = 100
+MAX_PER_PAGE = 1000
+# Seconds between checks for a newer snapshot
+RELOAD_INTERVAL = 5.0
+# Responses memoized per dataset version
+RESPONSE_CACHE_SIZE = 256
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _item(repo: dict, categories: list[str]) -> dict:
+    item = {
+        "name": repo["name"],
+        "url": repo["html_url"],
+        "stars": repo["stargazers_count"],
+        "forks": repo["forks"],
+        "open_issues": repo["open_issues"],
+        "last_commit": repo["pushed_at"][:10],
+        "first_commit": repo["created_at"][:10],
+        "language": repo["language"],
+        "license": repo["license"]["name"] if repo["license"] else None,
+        "description": repo["description"],
+        "topics": repo["topics"],
+        "categories": categories,
+        "profiles": repo["profiles"],
+    }
+    # Snapshots written with graphql_enrichment carry release / contributor / commit metrics
+    for key in snapshot_utils.METRIC_COLUMNS.values():
+        if key in repo:
+            item[key] = repo[key]
+    return item
+
+
+class Dataset:
+    """One loaded snapshot with its profile membership, category flags and search index."""
+
+    def __init__(self, repos: list[dict], source: str | None = None,
+                 profiles: list[search_profiles.SearchProfile] | None = None):
+        profiles = profiles or search_profiles.load_profiles()
+        self.profiles = [profile.name for profile in profiles]
+        self.repos = repos = search_profiles.apply_profiles(repos, profiles)
+        self.source = source
+        # Membership isn't among the digested fields, but a profile edit changes what /v1/repos returns
+        memberships = hashlib.blake2b(json.dumps([repo["profiles"] for repo in repos]).encode(), digest_size=4)
+        self.version = f"{view_digest(repos)}-{memberships.hexdigest()}"
+        # Classification doesn't depend on which other repos are in the list, so it's done once
+        members = {category: {r["html_url"] for r in categorize_repos(repos, category)[0]}
+                   for category in KEYWORD_SETS}
+        self.categories = [[c for c in KEYWORD_SETS if repo["html_url"] in members[c]] for repo in repos]
+        self._index = None
+        self._index_lock = threading.Lock()
+
+    @property
+    def index(self) -> SearchIndex:
+        with self._index_lock:
+            if self._index is None:
+                self._index = SearchIndex(self.repos)
+            return self._index
+
+    def query(self, min_stars: int, min_date: date, category: str | None, q: str | None,
+              profile: str | None = None) -> list[int]:
+        """Positions of the matching repos of *profile* (default: the first), in stars or search rank order."""
+        positions = [int(p) for p in self.index.search(q)[0]] if q else range(len(self.repos))
+        cutoff = min_date.strftime("%Y-%m-%d")
+        profile = profile or self.profiles[0]
+        return [
+            p for p in positions
+            if self.repos[p]["stargazers_count"] >= min_stars and self.repos[p]["pushed_at"][:10] >= cutoff
+            and (category is None or category in self.categories[p]) and profile in self.repos[p]["profiles"]
+        ]
+
+    def page(self, positions: list[int], page: int, per_page: int) -> list[dict]:
+        start = (page - 1) * per_page
+        return [_item(self.repos[p], self.categories[p]) for p in positions[start:start + per_page]]
+
+
+class DataStore:
+    """Current Dataset, reloaded when the snapshot it came from changes."""
+
+    def __init__(self, snapshot_path: str | None = None, snapshots_dir: str | None = None):
+        self.snapshot_path = snapshot_path
+        self.snapshots_dir = snapshots_dir
+        self._lock = threading.Lock()
+        self._dataset: Dataset | None = None
+        self._loaded_key = None
+        self._checked_at = 0.0
+        self._responses: OrderedDict = OrderedDict()
+
+    def _latest_snapshot(self) -> str | None:
+        if self.snapshot_path:
+            return self.snapshot_path
+        snapshots = snapshot_utils.list_snapshots(self.snapshots_dir)
+        return snapshots[-1][1] if snapshots else None
+
+    def dataset(self) -> Dataset | None:
+        with self._lock:
+            now = time.monotonic()
+            if self._dataset is None or now - self._checked_at >= RELOAD_INTERVAL:
+                self._checked_at = now
+                path = self._latest_snapshot()
+                profiles = search_profiles.load_profiles()
+                key = (path, os.path.getmtime(path), tuple(profiles)) if path and os.path.exists(path) else None
+                if key and key != self._loaded_key:
+                    self._dataset = Dataset(snapshot_utils.load_snapshot_repos(path), source=path, profiles=profiles)
+                    self._loaded_key = key
+                    self._responses.clear()
+            return self._dataset
+
+    def cached_response(self, key, build):
+        """Memoized build() result for *key* (cleared when the dataset changes)."""
+        with self._lock:
+            if key in self._responses:
+                self._responses.move_to_end(key)
+                return self._responses[key]
+        value = build()
+        with self._lock:
+            self._responses[key] = value
+            while len(self._responses) > RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        return value
+
+
+def parse_repo_params(params: dict, today: date | None = None, profiles: list[str] | None = None) -> dict:
+    """Validated /v1/repos parameters with slider defaults filled in; *profiles* are the valid profile names."""
+    today = today or date.today()
+    try:
+        min_stars = int(params.get("min_stars", DEFAULT_MIN_STARS))
+        min_date = (datetime.strptime(params["min_date"], "%Y-%m-%d").date() if "min_date" in params
+                    else today - timedelta(days=365))
+        page = int(params.get("page", 1))
+        per_page = int(params.get("per_page", DEFAULT_PER_PAGE))
+    except ValueError as e:
+        raise BadRequest(str(e)) from None
+    category = params.get("category") or None
+    if category is not None and category not in KEYWORD_SETS:
+        raise BadRequest(f"unknown category {category!r}; expected one of {', '.join(KEYWORD_SETS)}")
+    profile = params.get("profile") or None
+    if profile is not None and profiles is not None and profile not in profiles:
+        raise BadRequest(f"unknown profile {profile!r}; expected one of {', '.join(profiles)}")
+    if page < 1 or not 1 <= per_page <= MAX_PER_PAGE:
+        raise BadRequest(f"page must be >= 1 and per_page between 1 and {MAX_PER_PAGE}")
+    return {"min_stars": min_stars, "min_date": min_date, "category": category, "profile": profile,
+            "q": (params.get("q") or "").strip() or None, "page": page, "per_page": per_page}
+
+
+class DataAPIHandler(BaseHTTPRequestHandler):
+    server_version = "LowCodeDataAPI/1.0"
+    store: DataStore  # set on the handler subclass by make_server()
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler signature
+        pass
+
+    def _send_json(self, status: int, payload, headers: dict | None = None):
+        body = json.dumps(payload).encode("utf-8")
+        self._send(status, body, {"Content-Type": "application/json; charset=utf-8", **(headers or {})})
+
+    def _send(self, status: int, body: bytes, headers: dict):
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_cached(self, key, build_payload):
+        """Send the memoized response for *key* with ETag / 304 / gzip handling.
+
+        *build_payload* returns (payload, extra headers) on a cache miss. The ETag is
+        derived from the dataset version in *key* and the encoded body, so it is strong.
+        """
+        use_gzip = "gzip" in (self.headers.get("Accept-Encoding") or "")
+
+        def build():
+            payload, extra_headers = build_payload()
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            if use_gzip:
+                body = gzip.compress(body, compresslevel=6, mtime=0)
+            digest = hashlib.blake2b(body, digest_size=12).hexdigest()
+            return f'"{digest}{"-gzip" if use_gzip else ""}"', body, extra_headers
+
+        etag, body, extra_headers = self.store.cached_response((key, use_gzip), build)
+        headers = {"ETag": etag, "Cache-Control": "public, max-age=60", "Vary": "Accept-Encoding",
+                   **extra_headers}
+        if etag in (t.strip() for t in (self.headers.get("If-None-Match") or "").split(",")):
+            self._send(304, b"", headers)
+            return
+        headers["Content-Type"] = "application/json; charset=utf-8"
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+        self._send(200, body, headers)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        dataset = self.store.dataset()
+        if dataset is None:
+            self._send_json(503, {"message": "No snapshot available"})
+        elif url.path == "/v1/repos":
+            self._repos(dataset, params)
+        elif url.path == "/v1/export":
+            self._export(dataset, params)
+        elif url.path == "/v1/dataset":
+            self._send_cached((dataset.version, "dataset"), lambda: ({
+                "version": dataset.version,
+                "snapshot": os.path.basename(dataset.source) if dataset.source else None,
+                "repos": len(dataset.repos),
+                "categories": list(KEYWORD_SETS),
+                "profiles": dataset.profiles,
+            }, {}))
+        else:
+            self._send_json(404, {"message": "Not Found"})
+
+    def _repos(self, dataset: Dataset, params: dict):
+        try:
+            query = parse_repo_params(params, profiles=dataset.profiles)
+        except BadRequest as e:
+            self._send_json(400, {"message": str(e)})
+            return
+        key = (dataset.version, tuple(sorted((k, str(v)) for k, v in query.items())))
+
+        def payload():
+            positions = dataset.query(query["min_stars"], query["min_date"], query["category"], query["q"],
+                                      query["profile"])
+            return {
+                "dataset_version": dataset.version,
+                "total_count": len(positions),
+                "page": query["page"],
+                "per_page": query["per_page"],
+                "items": dataset.page(positions, query["page"], query["per_page"]),
+            }, self._link_header(params, query, len(positions))
+
+        self._send_cached(key, payload)
+
+    def _export(self, dataset: Dataset, params: dict):
+        fmt = params.get("format", "csv")
+        try:
+            query = parse_repo_params({k: v for k, v in params.items() if k not in ("page", "per_page")},
+                                      profiles=dataset.profiles)
+            if fmt not in repo_export.FORMATS:
+                raise BadRequest(f"unknown format {fmt!r}; expected one of {', '.join(repo_export.FORMATS)}")
+        except BadRequest as e:
+            self._send_json(400, {"message": str(e)})
+            return
+        positions = dataset.query(query["min_stars"], query["min_date"], query["category"], query["q"],
+                                  query["profile"])
+        mime, extension = repo_export.FORMATS[fmt]
+        # No Content-Length: the body is written as it is produced and ends when the connection closes
+        self.send_response(200)
+        self.send_header("Content-Type", mime)
+        self.send_header("Content-Disposition", f'attachment; filename="lowcode-repos.{extension}"')
+        self.send_header("X-Total-Count", str(len(positions)))
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        if self.command == "HEAD":
+            return
+        repos = [dataset.repos[p] for p in positions]
+        for chunk in repo_export.iter_export(repos, fmt, categories=[dataset.categories[p] for p in positions]):
+            self.wfile.write(chunk)
+
+    @staticmethod
+    def _link_header(url_params: dict, query: dict, total: int) -> dict:
+        last = max(1, -(-total // query["per_page"]))
+        links = []
+        for rel, page in (("next", query["page"] + 1), ("last", last), ("first", 1), ("prev", query["page"] - 1)):
+            if 1 <= page <= last and page != query["page"]:
+                links.append(f'</v1/repos?{urlencode({**url_params, "page": page})}>; rel="{rel}"')
+        return {"Link": ", ".join(links)} if links else {}
+
+
+def make_server(snapshot_path: str | None = None, snapshots_dir: str | None = None,
+                host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Create a data API server (not yet serving). Port 0 picks a free port."""
+    store = DataStore(snapshot_path, snapshots_dir)
+    handler = type("BoundDataAPIHandler", (DataAPIHandler,), {"store": store})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.store = store
+    return server
+
+
+def start_data_api(**kwargs) -> tuple[ThreadingHTTPServer, str]:
+    """Start the API in a background thread. Returns (server, base_url); call server.shutdown() when done."""
+    server = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read-only JSON API over the curated repo list")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--snapshot", help="serve this snapshot file instead of the latest in snapshots/")
+    parser.add_argument("--snapshots-dir", help="directory to take the latest snapshot from")
+    args = parser.parse_args()
+
+    server = make_server(args.snapshot, args.snapshots_dir, args.host, args.port)
+    dataset = server.store.dataset()
+    if dataset is None:
+        print("No snapshot found; the API answers 503 until one appears")
+    else:
+        print(f"Serving {len(dataset.repos)} repos from {dataset.source} (version {dataset.version})")
+    print(f"  http://{args.host}:{args.port}/v1/repos")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+dataflow.py – Memoized dependency graph of the dashboard's derived artifacts.
+
+A Flow holds named inputs (dataset version, sliders, search box, ...) and
+derived nodes that declare which inputs or other nodes they are computed
+from. Values are pulled lazily with get() and memoized together with the
+versions of their dependencies; setting an input to a new value bumps its
+version, so only the nodes downstream of it are recomputed on their next
+get(). Nodes nobody asks for (e.g. the scatter of the axis not selected) are
+never computed.
+
+    flow = dashboard_flow()
+    flow.set("repos", repos, key=version)   # large inputs are compared by *key*
+    flow.set("min_date", min_date)
+    flow.get("table_rows")                  # recomputed only if an upstream input changed
+
+app.py keeps one dashboard_flow() per session, so moving the date slider
+reuses the search results and default view and only refilters; each
+recomputation is timed as a perf_metrics span named after the node.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import timedelta
+from functools import partial
+from typing import Any, Callable
+
+import perf_metrics
+
+
+class Flow:
+    """Named inputs plus memoized nodes computed from them."""
+
+    def __init__(self):
+        self._clock = 0
+        self._inputs: dict[str, list] = {}     # name -> [value, key, version]
+        self._nodes: dict[str, tuple[tuple[str, ...], Callable]] = {}
+        self._memo: dict[str, tuple[tuple[int, ...], int, Any]] = {}  # name -> (dep versions, version, value)
+        self.recomputed: Counter = Counter()   # node -> number of computations, for tests and profiling
+
+    def set(self, name: str, value, key=None):
+        """Set input *name*; downstream nodes go stale when *key* (default: the value) changed."""
+        key = value if key is None else key
+        current = self._inputs.get(name)
+        if current is not None and current[1] == key:
+            current[0] = value  # same content, possibly a new object: nothing downstream changes
+            return
+        self._clock += 1
+        self._inputs[name] = [value, key, self._clock]
+
+    def node(self, name: str, inputs: tuple[str, ...], fn: Callable):
+        """Declare node *name* = fn(*values of inputs); inputs are input or node names."""
+        if name in self._nodes or name in self._inputs:
+            raise ValueError(f"{name!r} is already defined")
+        self._nodes[name] = (tuple(inputs), fn)
+
+    def get(self, name: str):
+        """Current value of input or node *name*, recomputing the node only if a dependency changed."""
+        return self._resolve(name)[1]
+
+    def _resolve(self, name: str) -> tuple[int, Any]:
+        if name in self._inputs:
+            value, _, version = self._inputs[name]
+            return version, value
+        if name not in self._nodes:
+            raise KeyError(f"unknown input or node {name!r}")
+        inputs, fn = self._nodes[name]
+        resolved = [self._resolve(dep) for dep in inputs]
+        stamp = tuple(version for version, _ in resolved)
+        memo = self._memo.get(name)
+        if memo is not None and memo[0] == stamp:
+            perf_metrics.incr("dataflow_hits")
+            return memo[1], memo[2]
+        with perf_metrics.span(name):
+            value = fn(*(value for _, value in resolved))
+        self._clock += 1
+        self._memo[name] = (stamp, self._clock, value)
+        self.recomputed[name] += 1
+        return self._clock, value
+
+
+def _search(search_index, version, repos, query):
+    if not query.strip():
+        return repos
+    positions, _ = search_index(version, repos).search(query)
+    return [repos[p] for p in positions]  # best match first
+
+
+def _collapse(duplicate_clusters, repos, collapse, version, all_repos):
+    if not collapse:
+        return repos
+    import near_duplicates
+
+    return near_duplicates.collapse(repos, duplicate_clusters(version, all_repos))[0]
+
+
+def _default_search_index(version, repos):
+    from search_index import SearchIndex
+
+    return SearchIndex(repos)
+
+
+def _default_duplicate_clusters(version, repos):
+    import near_duplicates
+
+    return near_duplicates.cluster_ids(repos, near_duplicates.find_clusters(repos))
+
+
+def dashboard_flow(search_index: Callable = _default_search_index,
+                   duplicate_clusters: Callable = _default_duplicate_clusters) -> Flow:
+    """The dashboard's graph.
+
+    Inputs: dataset_version, repos (set with key=dataset_version), today, min_stars,
+    min_date, search_query, collapse_duplicates. *search_index* and
+    *duplicate_clusters* are called as f(dataset_version, repos), so app.py can pass
+    its cross-session st.cache_resource getters.
+
+    Nodes: default_view_filter, default_view_digest, search, slider_filter, filtered, hidden_duplicates,
+    table_rows, stats.first_commit_years, stats.languages, stats.stars,
+    stats.stars_vs_<axis> (dashboard_data.SCATTER_AXES) and analysis.<category>
+    (KEYWORD_SETS, keyword_analysis.analysis_result()).
+    """
+    import dashboard_data
+    import dashboard_figures
+    import quantile_sketch
+    from keyword_analysis import KEYWORD_SETS, analysis_result
+    from static_report import DEFAULT_MIN_STARS, DEFAULT_WINDOW_DAYS, view_digest
+
+    flow = Flow()
+    flow.node("default_view_filter", ("repos", "today"), lambda repos, today: dashboard_data.filter_repos(
+        repos, DEFAULT_MIN_STARS, today - timedelta(days=DEFAULT_WINDOW_DAYS)))
+    flow.node("default_view_digest", ("default_view_filter",), view_digest)
+    flow.node("search", ("dataset_version", "repos", "search_query"), partial(_search, search_index))
+    flow.node("slider_filter", ("search", "min_stars", "min_date"), dashboard_data.filter_repos)
+    flow.node("filtered", ("slider_filter", "collapse_duplicates", "dataset_version", "repos"),
+              partial(_collapse, duplicate_clusters))
+    flow.node("hidden_duplicates", ("slider_filter", "filtered"), lambda before, after: len(before) - len(after))
+    flow.node("table_rows", ("filtered",), dashboard_data.table_rows)
+    flow.node("stats.first_commit_years", ("filtered",), lambda repos: dashboard_figures.first_commit_year_chart(
+        dashboard_data.first_commit_year_counts(repos)))
+    flow.node("stats.languages", ("filtered",), lambda repos: dashboard_figures.language_bar_chart(
+        dashboard_data.language_counts(repos)))
+    flow.node("stats.stars", ("filtered",), lambda repos: dashboard_figures.star_box_plot(
+        quantile_sketch.star_box_stats(dashboard_data.star_counts(repos))))
+    for axis in dashboard_data.SCATTER_AXES:
+        flow.node(f"stats.stars_vs_{axis}", ("filtered", "today"),
+                  lambda repos, today, axis=axis: dashboard_figures.stars_scatter(
+                      dashboard_data.scatter_points(repos, today, axis), axis))
+    for category in KEYWORD_SETS:
+        flow.node(f"analysis.{category}", ("filtered",), partial(analysis_result, category=category))
+    return flow
@@ -0,0 +1,54 @@
+"""
+github_rate_limit.py – Rate-limit bookkeeping shared by the concurrent GitHub API clients.
+
+A RateLimitGate is shared by all worker threads of one enrichment run. It
+follows the X-RateLimit-Remaining / X-RateLimit-Reset headers GitHub sends on
+every REST and GraphQL response (for GraphQL they count points, not
+requests). Before a request a worker calls wait(cost): it passes while the
+budget lasts, sleeps until the reset when that is at most *max_wait* seconds
+away, and otherwise raises RateLimitExhausted so the caller can skip the rest.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class RateLimitExhausted(Exception):
+    pass
+
+
+class RateLimitGate:
+    """Shared view of one rate-limit resource across worker threads."""
+
+    def __init__(self, max_wait: float = 60.0, reserve: int = 0):
+        self.max_wait = max_wait
+        self.reserve = reserve
+        self._lock = threading.Lock()
+        self.remaining: int | None = None
+        self.reset: float = 0.0
+
+    def wait(self, cost: int = 1):
+        """Block until a request costing *cost* may be sent; raise RateLimitExhausted if the reset is too far."""
+        with self._lock:
+            if self.remaining is None or self.remaining - cost >= self.reserve:
+                if self.remaining is not None:
+                    self.remaining -= cost  # reserve it, so workers don't all pass on the last token
+                return
+            delay = self.reset - time.time()
+        if delay > self.max_wait:
+            raise RateLimitExhausted(f"rate limit exhausted for {delay:.0f}s more")
+        time.sleep(max(delay, 0) + 1)
+        with self._lock:
+            self.remaining = None  # unknown until the next response
+
+    def update(self, response):
+        """Take the budget from a response's X-RateLimit-* headers."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        with self._lock:
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset is not None:
+                self.reset = float(reset)
@@ -0,0 +1,444 @@
+"""
+github_stub_server.py – Local stand-in for the parts of the GitHub REST API the
+dashboard uses, for offline load, latency and retry testing.
+
+Endpoints:
+    GET  /search/repositories                  paginated search over a synthetic dataset
+    GET  /repos/{owner}/{repo}/readme          README of a dataset repo (used by readme_enrichment)
+    GET  /repos/{owner}/{repo}/contents/{path} Contents API read (used by commit_snapshot_to_github)
+    PUT  /repos/{owner}/{repo}/contents/{path} Contents API create/update
+    POST /graphql                              aliased repository(owner:, name:) lookups (used by graphql_enrichment)
+    GET  /rate_limit                           current rate-limit state
+    GET  /_stub/config, POST /_stub/config     read / change fault injection at runtime
+
+Behaviour emulated:
+    - X-RateLimit-* headers per resource ("search", "core", "graphql"); 403 once exhausted.
+      A GraphQL query costs points like GitHub's: one per 100 connections requested
+    - 422 beyond the first 1000 search results, like GitHub
+    - ETag on every GET and 304 for a matching If-None-Match (not counted
+      against the rate limit, like GitHub)
+    - slow pages, forced HTTP errors on given pages and a random error rate
+
+Usage:
+    python github_stub_server.py --repos 5000 --port 8765
+    python github_stub_server.py --search-limit 10 --slow-pages 3,4 --latency 2 --error-pages 7:403
+
+Point the app or CLI at it with GITHUB_API_BASE=http://127.0.0.1:8765.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from synthetic_repos import generate_repos
+
+_CONTENTS_RE = re.compile(r"^/repos/([^/]+)/([^/]+)/contents/(.+)$")
+_README_RE = re.compile(r"^/repos/([^/]+)/([^/]+)/readme$")
+_STARS_RE = re.compile(r"stars:>=(\d+)")
+_PUSHED_RE = re.compile(r"pushed:>=(\d{4}-\d{2}-\d{2})")
+_GRAPHQL_REPO_RE = re.compile(r'(\w+)\s*:\s*repository\(\s*owner:\s*"([^"]*)"\s*,\s*name:\s*"([^"]*)"\s*\)')
+_GRAPHQL_SINCE_RE = re.compile(r'since:\s*"([^"]+)"')
+# Connections per repository in graphql_enrichment's query (releases, mentionableUsers, history)
+_GRAPHQL_CONNECTIONS_PER_REPO = 3
+
+# GitHub only serves the first 1000 results of any search
+SEARCH_RESULT_CAP = 1000
+
+DEFAULT_CONFIG = {
+    "search_limit": 30,        # requests per window on the "search" resource (authenticated: 30/min)
+    "core_limit": 5000,        # requests per window on the "core" resource
+    "graphql_limit": 5000,     # points per window on the "graphql" resource
+    "window_seconds": 60,
+    "latency": 0.0,            # seconds added to every request
+    "slow_pages": [],          # search pages that get *slow_latency* extra delay
+    "slow_latency": 2.0,
+    "error_pages": {},         # {"7": 403} -> page 7 of every search answers with that status
+    "error_rate": 0.0,         # probability of a random 500 on any request
+}
+
+
+def _blob_sha(content: bytes) -> str:
+    """Git blob SHA, same as GitHub reports for file contents."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+class StubState:
+    """Dataset, stored files, rate-limit counters and fault-injection config shared by all handlers."""
+
+    def __init__(self, repos: list[dict], **config):
+        self.repos = repos
+        self.config = {**DEFAULT_CONFIG, **config}
+        self.files: dict[tuple[str, str, str], dict] = {}
+        self.request_log: list[tuple[str, str, int]] = []
+        self._lock = threading.Lock()
+        self._windows: dict[str, tuple[float, int]] = {}
+        self._rng = random.Random(0)
+        # Every page of a crawl repeats the same query; filter the dataset once per query
+        self._search_cache: dict[str, list[dict]] = {}
+        self._by_full_name = {r["full_name"].lower(): r for r in repos if r.get("full_name")}
+
+    def update_config(self, changes: dict):
+        with self._lock:
+            self.config.update(changes)
+            # Reset counters so a new limit takes effect immediately
+            self._windows.clear()
+
+    def take_token(self, resource: str, cost: int = 1) -> tuple[bool, dict]:
+        """Consume *cost* requests (points) on *resource*; return (allowed, rate-limit headers)."""
+        limit = self.config[f"{resource}_limit"]
+        window = self.config["window_seconds"]
+        with self._lock:
+            now = time.time()
+            start, used = self._windows.get(resource, (now, 0))
+            if now - start >= window:
+                start, used = now, 0
+            allowed = used + cost <= limit
+            if allowed:
+                used += cost
+            self._windows[resource] = (start, used)
+        headers = {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(max(limit - used, 0)),
+            "X-RateLimit-Used": str(used),
+            "X-RateLimit-Reset": str(int(start + window)),
+            "X-RateLimit-Resource": resource,
+        }
+        if not allowed:
+            headers["Retry-After"] = str(max(int(start + window - now), 1))
+        return allowed, headers
+
+    def refund_token(self, resource: str):
+        with self._lock:
+            start, used = self._windows.get(resource, (time.time(), 0))
+            self._windows[resource] = (start, max(used - 1, 0))
+
+    def random_failure(self) -> bool:
+        with self._lock:
+            return self._rng.random() < self.config["error_rate"]
+
+    def rate_limit_status(self) -> dict:
+        """Body of GET /rate_limit: {resource: {limit, used, remaining, reset}}."""
+        now = time.time()
+        status = {}
+        with self._lock:
+            for resource in ("search", "core", "graphql"):
+                limit = self.config[f"{resource}_limit"]
+                start, used = self._windows.get(resource, (now, 0))
+                status[resource] = {"limit": limit, "used": used, "remaining": max(limit - used, 0),
+                                    "reset": int(start + self.config["window_seconds"])}
+        return status
+
+    def readme(self, full_name: str) -> bytes | None:
+        """README of *full_name*: a README.md stored via the Contents API, else one generated from the repo."""
+        stored = self.files.get((full_name, "main", "README.md"))
+        if stored is not None:
+            return stored["content"]
+        repo = self._by_full_name.get(full_name.lower())
+        if repo is None:
+            return None
+        topics = ", ".join(repo.get("topics") or [])
+        return (f"# {repo['name']}\n\n{repo.get('description') or ''}\n\n"
+                f"## Topics\n\n{topics}\n\n## Getting started\n\n```bash\nnpm install {repo['name']}\n```\n").encode()
+
+    def repo_metrics(self, full_name: str, since: str) -> dict | None:
+        """GraphQL repository node of *full_name* (releases, contributors, commits since *since*), or None."""
+        repo = self._by_full_name.get(full_name.lower())
+        if repo is None:
+            return None
+        rng = random.Random(repo["full_name"])  # same numbers for the same repo on every call
+        releases = int(repo["stargazers_count"] ** 0.5 * rng.random())
+        active = repo["pushed_at"] >= since
+        return {
+            "releases": {"totalCount": releases},
+            "latestRelease": {"publishedAt": repo["pushed_at"]} if releases else None,
+            "mentionableUsers": {"totalCount": 1 + int(repo["stargazers_count"] ** 0.5 * rng.random())},
+            "defaultBranchRef": {"target": {"history": {
+                "totalCount": int(rng.lognormvariate(4, 1.2)) if active else 0,
+            }}},
+        }
+
+    def search(self, query: str) -> list[dict]:
+        """Repos matching the stars:>= / pushed:>= qualifiers of *query*, most stars first."""
+        with self._lock:
+            cached = self._search_cache.get(query)
+        if cached is not None:
+            return cached
+        stars = _STARS_RE.search(query)
+        pushed = _PUSHED_RE.search(query)
+        min_stars = int(stars.group(1)) if stars else 0
+        min_pushed = pushed.group(1) if pushed else ""
+        matches = [
+            r for r in self.repos
+            if r["stargazers_count"] >= min_stars and r["pushed_at"][:10] >= min_pushed
+        ]
+        with self._lock:
+            self._search_cache[query] = matches
+        return matches
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server_version = "GitHubStub/1.0"
+    state: StubState  # set on the handler subclass by make_server()
+    _resource = "core"
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler signature
+        pass
+
+    # -- helpers ---------------------------------------------------------
+
+    def _send_json(self, status: int, payload, headers: dict | None = None, etag: bool = False):
+        body = json.dumps(payload).encode("utf-8")
+        headers = dict(headers or {})
+        if etag:
+            tag = '"' + hashlib.sha1(body).hexdigest() + '"'
+            headers["ETag"] = tag
+            if self.headers.get("If-None-Match") == tag:
+                # Like GitHub, a 304 doesn't count against the rate limit
+                self.state.refund_token(self._resource)
+                if "X-RateLimit-Used" in headers:
+                    headers["X-RateLimit-Used"] = str(int(headers["X-RateLimit-Used"]) - 1)
+                    headers["X-RateLimit-Remaining"] = str(int(headers["X-RateLimit-Remaining"]) + 1)
+                self._send(304, b"", headers)
+                return
+        headers["Content-Type"] = "application/json; charset=utf-8"
+        self._send(status, body, headers)
+
+    def _send(self, status: int, body: bytes, headers: dict):
+        self.state.request_log.append((self.command, self.path, status))
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _guard(self, resource: str, cost: int = 1) -> dict | None:
+        """Apply latency, random failures and rate limiting. Returns headers, or None if answered."""
+        if self.state.config["latency"]:
+            time.sleep(self.state.config["latency"])
+        self._resource = resource
+        allowed, headers = self.state.take_token(resource, cost)
+        if not allowed:
+            self._send_json(403, {
+                "message": "API rate limit exceeded",
+                "documentation_url": "https://docs.github.com/rest/overview/resources-in-the-rest-api#rate-limiting",
+            }, headers)
+            return None
+        if self.state.random_failure():
+            self._send_json(500, {"message": "Server Error"}, headers)
+            return None
+        return headers
+
+    # -- routes ----------------------------------------------------------
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if url.path == "/search/repositories":
+            self._search(params)
+        elif url.path == "/rate_limit":
+            self._rate_limit()
+        elif url.path == "/_stub/config":
+            self._send_json(200, self.state.config)
+        elif (m := _CONTENTS_RE.match(url.path)):
+            self._get_contents(*m.groups(), params.get("ref", "main"))
+        elif (m := _README_RE.match(url.path)):
+            self._get_readme(*m.groups())
+        else:
+            self._send_json(404, {"message": "Not Found"})
+
+    def do_PUT(self):
+        m = _CONTENTS_RE.match(urlparse(self.path).path)
+        if not m:
+            self._send_json(404, {"message": "Not Found"})
+            return
+        self._put_contents(*m.groups(), self._read_json())
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        if path == "/_stub/config":
+            self.state.update_config(self._read_json())
+            self._send_json(200, self.state.config)
+        elif path == "/graphql":
+            self._graphql(self._read_json())
+        else:
+            self._send_json(404, {"message": "Not Found"})
+
+    def _search(self, params: dict):
+        page = int(params.get("page", 1))
+        per_page = min(int(params.get("per_page", 30)), 100)
+        config = self.state.config
+        if page in config["slow_pages"]:
+            time.sleep(config["slow_latency"])
+        headers = self._guard("search")
+        if headers is None:
+            return
+        forced = config["error_pages"].get(str(page))
+        if forced:
+            self._send_json(forced, {"message": f"Injected error on page {page}"}, headers)
+            return
+        if not params.get("q"):
+            self._send_json(422, {"message": "Validation Failed",
+                                  "errors": [{"resource": "Search", "field": "q", "code": "missing"}]}, headers)
+            return
+        if (page - 1) * per_page >= SEARCH_RESULT_CAP:
+            self._send_json(422, {"message": "Only the first 1000 search results are available"}, headers)
+            return
+        matches = self.state.search(params["q"])
+        start = (page - 1) * per_page
+        items = matches[start:min(start + per_page, SEARCH_RESULT_CAP)]
+        self._send_json(200, {"total_count": len(matches), "incomplete_results": False, "items": items},
+                        headers, etag=True)
+
+    def _rate_limit(self):
+        resources = self.state.rate_limit_status()
+        self._send_json(200, {"resources": resources, "rate": resources["core"]})
+
+    def _get_contents(self, owner: str, repo: str, path: str, ref: str):
+        headers = self._guard("core")
+        if headers is None:
+            return
+        stored = self.state.files.get((f"{owner}/{repo}", ref, path))
+        if stored is None:
+            self._send_json(404, {"message": "Not Found"}, headers)
+            return
+        self._send_json(200, {
+            "type": "file", "encoding": "base64", "path": path, "name": path.rsplit("/", 1)[-1],
+            "sha": stored["sha"], "size": len(stored["content"]),
+            "content": base64.b64encode(stored["content"]).decode("ascii"),
+        }, headers, etag=True)
+
+    def _get_readme(self, owner: str, repo: str):
+        headers = self._guard("core")
+        if headers is None:
+            return
+        content = self.state.readme(f"{owner}/{repo}")
+        if content is None:
+            self._send_json(404, {"message": "Not Found"}, headers)
+            return
+        self._send_json(200, {
+            "type": "file", "encoding": "base64", "path": "README.md", "name": "README.md",
+            "sha": _blob_sha(content), "size": len(content),
+            "content": base64.b64encode(content).decode("ascii"),
+        }, headers, etag=True)
+
+    def _graphql(self, payload: dict):
+        query = payload.get("query") or ""
+        lookups = _GRAPHQL_REPO_RE.findall(query)
+        since = (payload.get("variables") or {}).get("since")
+        if since is None and (m := _GRAPHQL_SINCE_RE.search(query)):
+            since = m.group(1)
+        cost = max(1, -(-len(lookups) * _GRAPHQL_CONNECTIONS_PER_REPO // 100))
+        headers = self._guard("graphql", cost)
+        if headers is None:
+            return
+        if not lookups:
+            self._send_json(200, {"errors": [{"message": "Stub only answers aliased repository(owner:, name:) queries"}]},
+                            headers)
+            return
+        data, errors = {}, []
+        for alias, owner, name in lookups:
+            data[alias] = self.state.repo_metrics(f"{owner}/{name}", since or "")
+            if data[alias] is None:
+                errors.append({"type": "NOT_FOUND", "path": [alias], "locations": [],
+                               "message": f"Could not resolve to a Repository with the name '{owner}/{name}'."})
+        if "rateLimit" in query:
+            data["rateLimit"] = {"cost": cost, "remaining": int(headers["X-RateLimit-Remaining"]),
+                                 "resetAt": time.strftime("%Y-%m-%dT%H:%M:%SZ",
+                                                          time.gmtime(int(headers["X-RateLimit-Reset"])))}
+        self._send_json(200, {"data": data, **({"errors": errors} if errors else {})}, headers)
+
+    def _put_contents(self, owner: str, repo: str, path: str, payload: dict):
+        headers = self._guard("core")
+        if headers is None:
+            return
+        if "message" not in payload or "content" not in payload:
+            self._send_json(422, {"message": "Invalid request. \"message\" and \"content\" are required."}, headers)
+            return
+        key = (f"{owner}/{repo}", payload.get("branch", "main"), path)
+        existing = self.state.files.get(key)
+        if existing and payload.get("sha") != existing["sha"]:
+            message = "\"sha\" wasn't supplied." if not payload.get("sha") else f"{path} does not match {payload['sha']}"
+            self._send_json(409 if payload.get("sha") else 422, {"message": message}, headers)
+            return
+        content = base64.b64decode(payload["content"])
+        sha = _blob_sha(content)
+        self.state.files[key] = {"sha": sha, "content": content, "message": payload["message"]}
+        self._send_json(200 if existing else 201, {
+            "content": {"name": path.rsplit("/", 1)[-1], "path": path, "sha": sha},
+            "commit": {"sha": hashlib.sha1(f"{sha}{time.time()}".encode()).hexdigest(),
+                       "message": payload["message"]},
+        }, headers)
+
+
+def make_server(repos: list[dict] | None = None, n_repos: int = 2000, host: str = "127.0.0.1",
+                port: int = 0, **config) -> ThreadingHTTPServer:
+    """Create a stub server (not yet serving). Port 0 picks a free port."""
+    state = StubState(repos if repos is not None else generate_repos(n_repos), **config)
+    handler = type("BoundStubHandler", (StubHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+
+def start_stub_server(repos: list[dict] | None = None, **kwargs) -> tuple[ThreadingHTTPServer, str]:
+    """Start a stub server in a background thread. Returns (server, base_url); call server.shutdown() when done."""
+    server = make_server(repos, **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local GitHub API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--repos", type=int, default=2000, help="size of the synthetic dataset")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--search-limit", type=int, default=DEFAULT_CONFIG["search_limit"])
+    parser.add_argument("--core-limit", type=int, default=DEFAULT_CONFIG["core_limit"])
+    parser.add_argument("--graphql-limit", type=int, default=DEFAULT_CONFIG["graphql_limit"],
+                        help="GraphQL points per window")
+    parser.add_argument("--window", type=int, default=DEFAULT_CONFIG["window_seconds"])
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--slow-pages", default="", help="comma-separated search pages to slow down")
+    parser.add_argument("--slow-latency", type=float, default=DEFAULT_CONFIG["slow_latency"])
+    parser.add_argument("--error-pages", default="", help="page:status pairs, e.g. 7:403,8:422")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    repos = generate_repos(args.repos, seed=args.seed)
+    server = make_server(
+        repos, host=args.host, port=args.port,
+        search_limit=args.search_limit, core_limit=args.core_limit,
+        graphql_limit=args.graphql_limit, window_seconds=args.window,
+        latency=args.latency, slow_latency=args.slow_latency, error_rate=args.error_rate,
+        slow_pages=[int(p) for p in args.slow_pages.split(",") if p],
+        error_pages={page: int(status) for page, status in
+                     (pair.split(":") for pair in args.error_pages.split(",") if pair)},
+    )
+    print(f"GitHub stub serving {len(repos)} repos on http://{args.host}:{args.port}")
+    print(f"  export GITHUB_API_BASE=http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
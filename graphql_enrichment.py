@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+graphql_enrichment.py – Optional per-repo metrics the Search API doesn't return.
+
+For every repo it adds
+
+    release_count       number of releases
+    latest_release      publishedAt of the latest release (None without releases)
+    contributor_count   mentionable users, GraphQL's closest stand-in for contributors
+    commits_last_year   commits on the default branch in the last 365 days
+
+Over REST that is three or four requests per repo. Here one GraphQL query
+covers a whole batch (BATCH_SIZE repos as aliased ``repository(owner:, name:)``
+fields), so ~1000 repos take about 20 queries at a few points each:
+
+    - batches run on a small thread pool (--workers, default 4)
+    - the GraphQL point budget is tracked from the X-RateLimit-* headers
+      (github_rate_limit.py); when it runs out the stage waits for the reset if
+      it is close (max_wait) and otherwise skips the remaining batches
+    - a batch the server gives up on (502/504, usually a timeout) is retried as
+      two halves
+    - results are cached per repo in a JSON file (LOWCODE_GRAPHQL_CACHE, default
+      .cache/graphql_metrics.json) and reused for CACHE_TTL seconds
+
+snapshot_utils.repos_to_csv() writes the metrics as extra snapshot columns
+when present. GitHub's GraphQL API needs a token. Enable for take_snapshot.py
+and the app's auto-snapshot with LOWCODE_GRAPHQL_ENRICHMENT=1, or run it by hand:
+
+    GITHUB_TOKEN=... python graphql_enrichment.py                      # latest snapshot
+    GITHUB_API_BASE=http://127.0.0.1:8765 python graphql_enrichment.py --output enriched.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import snapshot_utils
+from github_rate_limit import RateLimitExhausted, RateLimitGate
+from readme_enrichment import repo_full_name
+
+ENABLED = os.environ.get("LOWCODE_GRAPHQL_ENRICHMENT", "").lower() not in ("", "0", "false", "no")
+CACHE_PATH = os.environ.get(
+    "LOWCODE_GRAPHQL_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "graphql_metrics.json"),
+)
+# Cached metrics older than this are fetched again
+CACHE_TTL = 7 * 24 * 3600
+# Repos per query. GitHub charges one point per 100 connections and each repo asks for 3,
+# so 50 repos cost 2 points; much larger batches risk the server-side timeout.
+BATCH_SIZE = 50
+METRIC_KEYS = tuple(snapshot_utils.METRIC_COLUMNS.values())
+
+_REPO_FIELDS = """
+    releases { totalCount }
+    latestRelease { publishedAt }
+    mentionableUsers { totalCount }
+    defaultBranchRef { target { ... on Commit { history(since: $since) { totalCount } } } }
+"""
+
+
+def build_query(full_names: list[str]) -> str:
+    """One GraphQL query with an aliased repository field (r0, r1, ...) per owner/name."""
+    fields = []
+    for i, full_name in enumerate(full_names):
+        owner, name = full_name.split("/", 1)
+        fields.append(f"  r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ ...metrics }}")
+    return ("query($since: GitTimestamp!) {\n  rateLimit { cost remaining resetAt }\n"
+            + "\n".join(fields)
+            + "\n}\nfragment metrics on Repository {" + _REPO_FIELDS + "}\n")
+
+
+def parse_metrics(node: dict) -> dict:
+    """Metric fields (METRIC_KEYS) of one repository node."""
+    target = (node.get("defaultBranchRef") or {}).get("target") or {}
+    return {
+        "release_count": node["releases"]["totalCount"],
+        "latest_release": (node.get("latestRelease") or {}).get("publishedAt"),
+        "contributor_count": node["mentionableUsers"]["totalCount"],
+        # An empty repository has no default branch
+        "commits_last_year": target["history"]["totalCount"] if "history" in target else 0,
+    }
+
+
+def estimated_cost(n_repos: int) -> int:
+    """Points GitHub charges for a batch of *n_repos* (one per 100 connections, at least 1)."""
+    return max(1, -(-n_repos * 3 // 100))
+
+
+class MetricsCache:
+    """owner/repo -> {fetched_at, metrics} in one JSON file; metrics is None for repos that don't resolve."""
+
+    def __init__(self, path: str | None = None, ttl: float = CACHE_TTL):
+        self.path = path or CACHE_PATH
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.entries: dict[str, dict] = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, full_name: str, now: float) -> dict | None:
+        """The fresh cache entry of *full_name*, or None if missing or older than the TTL."""
+        with self._lock:
+            entry = self.entries.get(full_name.lower())
+        if entry is None or now - entry["fetched_at"] > self.ttl:
+            return None
+        return entry
+
+    def put(self, full_name: str, metrics: dict | None, now: float):
+        with self._lock:
+            self.entries[full_name.lower()] = {"fetched_at": now, "metrics": metrics}
+
+    def save(self):
+        """Write the cache file (atomically)."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock:
+            data = json.dumps(self.entries, sort_keys=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, self.path)
+
+
+def enrich_metrics(repos: list[dict], token: str | None = None, api_base: str | None = None,
+                   cache_path: str | None = None, ttl: float = CACHE_TTL, batch_size: int = BATCH_SIZE,
+                   max_workers: int = 4, max_wait: float = 60.0, timeout: float = 30.0,
+                   now: float | None = None) -> Counter:
+    """Set the METRIC_KEYS fields on every repo GitHub resolves. Returns counts per outcome:
+
+    cached (not requested), fetched, missing (repo not found), skipped (rate limit),
+    errors, plus queries sent and the GraphQL points they cost.
+    """
+    import requests
+
+    api_base = (api_base or snapshot_utils.GITHUB_API_BASE).rstrip("/")
+    now = time.time() if now is None else now
+    since = (datetime.fromtimestamp(now, timezone.utc) - timedelta(days=365)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    cache = MetricsCache(cache_path, ttl)
+    gate = RateLimitGate(max_wait=max_wait)
+    headers = {"Accept": "application/vnd.github+json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    local = threading.local()
+    stats = Counter()
+    stats_lock = threading.Lock()
+
+    def count(outcome, n=1):
+        with stats_lock:
+            stats[outcome] += n
+
+    # Repos sharing an owner/name (e.g. listed twice) are requested once
+    by_name: dict[str, list[dict]] = {}
+    for repo in repos:
+        by_name.setdefault(repo_full_name(repo).lower(), []).append(repo)
+
+    def apply(full_name, metrics):
+        for repo in by_name[full_name]:
+            repo.update(metrics)
+
+    pending = []
+    for full_name, same in by_name.items():
+        entry = cache.get(full_name, now)
+        if entry is None:
+            pending.append(full_name)
+        elif entry["metrics"] is None:
+            count("missing", len(same))
+        else:
+            apply(full_name, entry["metrics"])
+            count("cached", len(same))
+
+    def fetch(batch):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        try:
+            gate.wait(estimated_cost(len(batch)))
+            response = local.session.post(f"{api_base}/graphql", headers=headers, timeout=timeout,
+                                          json={"query": build_query(batch), "variables": {"since": since}})
+        except RateLimitExhausted:
+            count("skipped", len(batch))
+            return
+        except requests.exceptions.RequestException:
+            count("errors", len(batch))
+            return
+        gate.update(response)
+        count("queries")
+        if response.status_code in (502, 504) and len(batch) > 1:
+            half = len(batch) // 2
+            fetch(batch[:half])
+            fetch(batch[half:])
+            return
+        if response.status_code in (403, 429):
+            count("skipped", len(batch))
+            return
+        if response.status_code != 200:
+            count("errors", len(batch))
+            return
+        body = response.json()
+        data = body.get("data") or {}
+        error_types = {tuple(e.get("path") or ()): e.get("type") for e in body.get("errors") or []}
+        if not data and "RATE_LIMITED" in error_types.values():
+            count("skipped", len(batch))
+            return
+        count("points", (data.get("rateLimit") or {}).get("cost", 0))
+        for i, full_name in enumerate(batch):
+            node = data.get(f"r{i}")
+            if node is not None:
+                metrics = parse_metrics(node)
+                cache.put(full_name, metrics, now)
+                apply(full_name, metrics)
+                count("fetched", len(by_name[full_name]))
+            elif error_types.get((f"r{i}",)) == "NOT_FOUND":
+                cache.put(full_name, None, now)
+                count("missing", len(by_name[full_name]))
+            else:
+                count("errors", len(by_name[full_name]))
+
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(fetch, batches))
+    cache.save()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch release / contributor / commit metrics via GraphQL")
+    parser.add_argument("--snapshot", help="snapshot CSV (default: latest in snapshots/)")
+    parser.add_argument("--output", help="write the enriched snapshot here (default: only warm the cache)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--cache", default=CACHE_PATH)
+    parser.add_argument("--max-wait", type=float, default=60.0,
+                        help="longest wait for a rate-limit reset before skipping the rest")
+    args = parser.parse_args()
+
+    path = args.snapshot
+    if path is None:
+        snapshots = snapshot_utils.list_snapshots()
+        if not snapshots:
+            print(f"❌ No snapshots in {snapshot_utils.SNAPSHOTS_DIR}", file=sys.stderr)
+            return 1
+        path = snapshots[-1][1]
+    repos = snapshot_utils.load_snapshot_repos(path)
+    start = time.perf_counter()
+    stats = enrich_metrics(repos, token=os.environ.get("GITHUB_TOKEN"), cache_path=args.cache,
+                           batch_size=args.batch_size, max_workers=args.workers, max_wait=args.max_wait)
+    print(f"📈 {len(repos)} repos in {time.perf_counter() - start:.1f}s: "
+          + ", ".join(f"{n} {outcome}" for outcome, n in sorted(stats.items())))
+    if args.output:
+        snapshot_utils.repos_to_csv(repos, args.output)
+        print(f"Enriched snapshot saved: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
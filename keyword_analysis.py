@@ -1,7 +1,9 @@
 import re
 
 import streamlit as st
-import plotly.graph_objects as go
+
+import dashboard_figures
+import perf_metrics
 
 # Whole-word / phrase matching for software "modeling" — substring "model" matches inside
 # unrelated words (e.g. remodel, remodeling) and is far too noisy for descriptions.
@@ -37,6 +39,9 @@ def analyze_repos_multiple_keywords(repos, keywords, category_name):
     
     for repo in repos:
         description = (repo.get('description', '') or '').lower()
+        if repo.get('readme_excerpt'):
+            # Set by the optional README enrichment stage (readme_enrichment.py)
+            description += ' ' + repo['readme_excerpt'].lower()
         name = (repo.get('name', '') or '').lower()
         topics = [t.lower() for t in repo.get('topics', [])]
 
@@ -58,24 +63,26 @@ def analyze_repos_multiple_keywords(repos, keywords, category_name):
             
     return matching_repos, non_matching_repos
 
-def display_analysis(table_repos, category):
-    """Pie chart + table for *category*. *table_repos* must be the same list as the main repository table."""
-    # Define keyword sets for each category
-    keyword_sets = {
-        'no-code': ['nocode', 'no-code'],
-        'modeling': ['model', 'modeling', 'model-driven', 'model-based'],
-        'uml': ['uml', 'unified modeling language'],
-        'ai': ['ai', 'artificial intelligence']
-    }
-    
-    # Define excluded repos for modeling category
-    modeling_exclusions = {'langflow', 'ludwig', 'alan-sdk-web', 'otto-m8'}
-    
+
+# Keyword sets for each category shown in the "Repository Analysis" section
+KEYWORD_SETS = {
+    'no-code': ['nocode', 'no-code'],
+    'modeling': ['model', 'modeling', 'model-driven', 'model-based'],
+    'uml': ['uml', 'unified modeling language'],
+    'ai': ['ai', 'artificial intelligence']
+}
+
+# Repos excluded from the modeling category (ML "models", not software modeling)
+MODELING_EXCLUSIONS = {'langflow', 'ludwig', 'alan-sdk-web', 'otto-m8'}
+
+
+def categorize_repos(table_repos, category):
+    """Return (matching_repos, n_analyzed) for *category* over *table_repos*."""
     # Filter out specific repos for modeling category
     repos_to_analyze = table_repos
     if category == 'modeling':
         repos_to_analyze = [
-            repo for repo in table_repos if repo["name"] not in modeling_exclusions
+            repo for repo in table_repos if repo["name"] not in MODELING_EXCLUSIONS
         ]
 
     allowed_urls = frozenset(
@@ -84,45 +91,46 @@ def display_analysis(table_repos, category):
 
     matching_repos, _non_matching_repos = analyze_repos_multiple_keywords(
         repos_to_analyze,
-        keyword_sets[category],
+        KEYWORD_SETS[category],
         category,
     )
 
     # Hard guarantee: listed rows are only repos from the table list (same slider-filtered set).
     matching_repos = [r for r in matching_repos if r.get("html_url") in allowed_urls]
-    n_match = len(matching_repos)
-    n_non_match = len(repos_to_analyze) - n_match
-    
-    fig = go.Figure(data=[go.Pie(
-        labels=[f'Mentions {category}', f'No {category} mention'],
-        values=[n_match, n_non_match],
-        hole=0.3,
-        marker_colors=['#2ecc71', '#e74c3c']
-    )])
-    
-    fig.update_layout(
-        title=f'Distribution of {category} mentions in Low-Code Tools',
-        showlegend=True,
-        width=700,
-        height=500,
-        annotations=[{
-            'text': f'Total: {len(repos_to_analyze)}',
-            'x': 0.5,
-            'y': 0.5,
-            'font_size': 20,
-            'showarrow': False
-        }]
-    )
-    
+    return matching_repos, len(repos_to_analyze)
+
+
+def analysis_rows(matching_repos):
+    """Rows of the per-category table."""
+    return [{
+        'Name': repo['name'],
+        'Description': repo.get('description', 'No description'),
+        'Stars': repo.get('stargazers_count', 0)
+    } for repo in matching_repos]
+
+
+def render_analysis(category, fig, rows):
+    """Draw a category's pie chart and table (computed live or loaded from the static report)."""
     st.plotly_chart(fig)
-    
-    if matching_repos:
+
+    if rows:
         st.write(f"### Low-Code Tools Mentioning '{category}'")
-        data = [{
-            'Name': repo['name'],
-            'Description': repo.get('description', 'No description'),
-            'Stars': repo.get('stargazers_count', 0)
-        } for repo in matching_repos]
-        st.table(data)
+        st.table(rows)
     else:
         st.write(f"No repositories found mentioning '{category}'")
+
+
+def analysis_result(table_repos, category):
+    """(pie chart, table rows) for *category*; memoized per session by the dataflow graph in app.py."""
+    with perf_metrics.span("analysis.classify"):
+        matching_repos, n_analyzed = categorize_repos(table_repos, category)
+
+    with perf_metrics.span("analysis.figure"):
+        fig = dashboard_figures.category_pie(category, len(matching_repos), n_analyzed)
+
+    return fig, analysis_rows(matching_repos)
+
+
+def display_analysis(table_repos, category):
+    """Pie chart + table for *category*. *table_repos* must be the same list as the main repository table."""
+    render_analysis(category, *analysis_result(table_repos, category))
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+load_test.py – Concurrent-session load test for the Streamlit dashboard.
+
+Drives N simultaneous headless sessions of app.py with Streamlit's AppTest
+utility, all in this process (like sessions on one server instance). Each
+session loads the page, then moves the Minimum Stars / Last Commit sliders
+a few times. The report gives p50/p95 rerun latency, peak RSS, RSS growth per
+session and the size of each session's st.session_state.
+
+AppTest installs a process-global mock runtime for each script run, so two
+runs cannot execute at the same instant; sessions think and queue
+concurrently but script executions are serialised. Latency is reported both
+as what the viewer waits (queue + execution, "rerun_ms") and as pure script
+time ("exec_ms"). The app is CPU-bound under the GIL, so the wait figures are
+a close, slightly pessimistic, model of one server process.
+
+Data sources:
+    --source snapshot   API unreachable -> every session uses the bundled CSV fallback (default)
+    --source stub       in-process github_stub_server.py with --stub-repos synthetic repos
+    --api-base URL      an already running API (stub or real GitHub)
+
+Usage:
+    python load_test.py --sessions 20 --interactions 5
+    python load_test.py --source stub --stub-repos 5000 --sessions 50 --json load.json
+
+Snapshots that the app would auto-save go to a temporary directory, never to snapshots/.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+STAR_CHOICES = [50, 100, 250, 500, 1000, 5000, 10000]
+
+# See module docstring: AppTest script runs must not overlap
+_RUN_LOCK = threading.Lock()
+
+
+def _rss_mb() -> float:
+    """Current resident set size in MB (falls back to peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return _peak_rss_mb()
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _deep_size(obj, seen=None) -> int:
+    """Approximate bytes held by *obj* and everything it references."""
+    seen = seen if seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_size(item, seen) for item in obj)
+    return size
+
+
+def _percentile(values, pct):
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+class Session(threading.Thread):
+    """One simulated viewer: initial load followed by slider interactions."""
+
+    def __init__(self, index, interactions, think_time, start_barrier, loaded_barrier, timeout):
+        super().__init__(name=f"session-{index}", daemon=True)
+        self.rng = random.Random(index)
+        self.interactions = interactions
+        self.think_time = think_time
+        self.start_barrier = start_barrier
+        self.loaded_barrier = loaded_barrier
+        self.timeout = timeout
+        self.load_latency = None
+        self.rerun_latencies = []
+        self.exec_latencies = []
+        self.state_bytes = 0
+        self.errors = []
+        self.app = None
+
+    def _run_timed(self, action):
+        start = time.perf_counter()
+        with _RUN_LOCK:
+            exec_start = time.perf_counter()
+            action()
+            self.exec_latencies.append(time.perf_counter() - exec_start)
+        elapsed = time.perf_counter() - start
+        if self.app.exception:
+            self.errors.append(self.app.exception[0].value)
+        return elapsed
+
+    def _slider(self, label):
+        for slider in self.app.slider:
+            if slider.label == label:
+                return slider
+        raise LookupError(f"No slider {label!r}; page has {[s.label for s in self.app.slider]}")
+
+    def run(self):
+        from streamlit.testing.v1 import AppTest
+
+        try:
+            self.app = AppTest.from_file(APP_PATH, default_timeout=self.timeout)
+            self.start_barrier.wait()
+            self.load_latency = self._run_timed(self.app.run)
+        except Exception as e:  # noqa: BLE001 - report every failure, keep the other sessions going
+            self.errors.append(repr(e))
+        finally:
+            self.loaded_barrier.wait()
+        if self.app is None or self.errors:
+            return
+
+        state = self.app.session_state
+        self.state_bytes = sum(_deep_size(state[k]) for k in list(state))
+        today = datetime.today()
+        for _ in range(self.interactions):
+            time.sleep(self.think_time * self.rng.random())
+            try:
+                if self.rng.random() < 0.5:
+                    self._slider("Minimum Stars").set_value(self.rng.choice(STAR_CHOICES))
+                else:
+                    days = self.rng.randint(0, 364)
+                    self._slider("Last Commit").set_value(today - timedelta(days=days))
+                self.rerun_latencies.append(self._run_timed(self.app.run))
+            except Exception as e:  # noqa: BLE001
+                self.errors.append(repr(e))
+                return
+
+
+def run_load_test(sessions, interactions, think_time=0.2, timeout=120):
+    import perf_metrics
+
+    was_enabled = perf_metrics.ENABLED
+    perf_metrics.enable(log=False)
+    perf_metrics.reset()
+    try:
+        rss_before = _rss_mb()
+        start_barrier = threading.Barrier(sessions)
+        loaded_barrier = threading.Barrier(sessions + 1)
+        workers = [Session(i, interactions, think_time, start_barrier, loaded_barrier, timeout)
+                   for i in range(sessions)]
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        loaded_barrier.wait()
+        rss_loaded = _rss_mb()
+        for worker in workers:
+            worker.join()
+        wall = time.perf_counter() - started
+        counters = perf_metrics.snapshot()["counters"]
+    finally:
+        perf_metrics.enable(was_enabled, log=False)
+
+    loads = sorted(w.load_latency for w in workers if w.load_latency is not None)
+    reruns = sorted(t for w in workers for t in w.rerun_latencies)
+    execs = sorted(t for w in workers for t in w.exec_latencies)
+    state_sizes = [w.state_bytes for w in workers if w.state_bytes]
+    return {
+        "sessions": sessions,
+        "interactions_per_session": interactions,
+        "wall_seconds": round(wall, 2),
+        "initial_load_ms": {"p50": _ms(_percentile(loads, 50)), "p95": _ms(_percentile(loads, 95)),
+                            "max": _ms(loads[-1] if loads else None)},
+        "rerun_ms": {"p50": _ms(_percentile(reruns, 50)), "p95": _ms(_percentile(reruns, 95)),
+                     "max": _ms(reruns[-1] if reruns else None), "count": len(reruns)},
+        "exec_ms": {"p50": _ms(_percentile(execs, 50)), "p95": _ms(_percentile(execs, 95)),
+                    "max": _ms(execs[-1] if execs else None)},
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "rss_growth_per_session_mb": round((rss_loaded - rss_before) / sessions, 2),
+        "session_state_mb": round(statistics.mean(state_sizes) / 2**20, 2) if state_sizes else None,
+        "counters": counters,
+        "errors": [e for w in workers for e in w.errors][:20],
+    }
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for app.py")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--interactions", type=int, default=5, help="slider moves per session")
+    parser.add_argument("--think-time", type=float, default=0.2, help="max seconds between interactions")
+    parser.add_argument("--source", choices=("snapshot", "stub"), default="snapshot")
+    parser.add_argument("--stub-repos", type=int, default=2000)
+    parser.add_argument("--api-base", help="use an already running API instead of --source")
+    parser.add_argument("--timeout", type=float, default=120, help="per-rerun timeout in seconds")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    import snapshot_utils
+    import static_report
+
+    # app.py builds its API URLs from snapshot_utils.GITHUB_API_BASE on every run
+    server = None
+    if args.api_base:
+        snapshot_utils.GITHUB_API_BASE = args.api_base.rstrip("/")
+    elif args.source == "stub":
+        from github_stub_server import start_stub_server
+        server, snapshot_utils.GITHUB_API_BASE = start_stub_server(n_repos=args.stub_repos,
+                                                                   search_limit=10**6)
+    else:
+        # Nothing listens on the discard port: every fetch fails fast and falls back to the CSV
+        snapshot_utils.GITHUB_API_BASE = "http://127.0.0.1:9"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Auto-snapshots and the static report they regenerate stay out of the working tree
+        snapshot_utils.SNAPSHOTS_DIR = tmp
+        static_report.REPORT_DIR = os.path.join(tmp, "report")
+        static_report.REPORT_JSON = os.path.join(static_report.REPORT_DIR, "report.json")
+        print(f"🚦 {args.sessions} sessions × {args.interactions} interactions "
+              f"against {snapshot_utils.GITHUB_API_BASE}")
+        report = run_load_test(args.sessions, args.interactions, args.think_time, args.timeout)
+    if server:
+        server.shutdown()
+
+    print(json.dumps(report, indent=2))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
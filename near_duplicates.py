@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+near_duplicates.py – Likely forks, mirrors and clones in the repo list.
+
+Each repo is reduced to a set of features (name tokens, the squashed name,
+topics, description words and word pairs) and the sets are compared by
+Jaccard similarity. Instead of comparing all pairs, MinHash signatures
+(NUM_PERM hash permutations) are split into BANDS bands; repos that agree on
+every row of at least one band land in the same bucket and become candidate
+pairs, so the work grows with the number of repos, not its square. Candidates
+are confirmed with their exact Jaccard similarity and joined into clusters.
+
+Signatures only depend on the repo itself and the fixed permutations (SEED),
+so shards of a crawl can be hashed separately and their signatures stacked
+(np.vstack) before find_clusters().
+
+Suggest clusters for curation (most-starred repo first):
+
+    python near_duplicates.py                                   # latest snapshot
+    python near_duplicates.py snapshots/a.csv snapshots/b.csv --threshold 0.5 --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import zlib
+from dataclasses import dataclass
+
+import numpy as np
+
+NUM_PERM = 128
+BANDS = 32          # 32 bands x 4 rows: pairs above ~0.45 Jaccard very likely share a bucket
+DEFAULT_THRESHOLD = 0.6
+SEED = 42
+# Buckets larger than this (e.g. dozens of repos with only the same two topics) are linked
+# as a chain instead of all pairs, which keeps the candidate count linear
+MAX_BUCKET = 50
+
+_EMPTY = np.uint32(0xFFFFFFFF)  # signature of a repo without features
+_WORD = re.compile(r"\w+")
+_NAME_PART = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+# Words of the search query itself: nearly every repo has them, so they say nothing about duplication
+STOP_WORDS = frozenset({"low", "code", "lowcode", "no", "nocode", "platform", "a", "an", "the", "and",
+                        "for", "of", "to", "with", "in", "is", "based"})
+STOP_TOPICS = frozenset({"low-code", "lowcode", "low-code-platform", "no-code", "nocode"})
+
+
+def feature_set(repo: dict) -> frozenset[int]:
+    """Hashed features of *repo*: name parts, squashed name, topics, description words and word pairs."""
+    name = repo.get("name") or ""
+    parts = [p.lower() for p in _NAME_PART.findall(name)]
+    features = {f"n:{p}" for p in parts if p not in STOP_WORDS}
+    squashed = "".join(p for p in parts if p not in STOP_WORDS)
+    if squashed:
+        features.add(f"N:{squashed}")
+    features.update(f"t:{t.lower()}" for t in repo.get("topics") or [] if t.lower() not in STOP_TOPICS)
+    words = [w for w in _WORD.findall((repo.get("description") or "").lower()) if w not in STOP_WORDS]
+    features.update(f"d:{w}" for w in words)
+    features.update(f"d:{a} {b}" for a, b in zip(words, words[1:]))
+    return frozenset(zlib.crc32(f.encode("utf-8")) for f in features)
+
+
+def _permutations(num_perm: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    # Multiply-shift hashing, h(x) = ((a*x + b) mod 2^64) >> 32 with odd a: universal and, unlike
+    # a modulo prime, only needs operations numpy does natively on uint64 (wrap-around included)
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def minhash_signatures(feature_sets: list[frozenset[int]], num_perm: int = NUM_PERM, seed: int = SEED,
+                       block: int = 40_000) -> np.ndarray:
+    """(len(feature_sets), num_perm) uint32 MinHash signatures; rows of empty sets are all _EMPTY."""
+    a, b = _permutations(num_perm, seed)
+    signatures = np.full((len(feature_sets), num_perm), _EMPTY, dtype=np.uint32)
+    start = 0
+    while start < len(feature_sets):
+        # Take repos until about *block* features, so the (num_perm x features) matrix stays small
+        rows, sizes, stop, n = [], [], start, 0
+        while stop < len(feature_sets) and (n == 0 or n + len(feature_sets[stop]) <= block):
+            if feature_sets[stop]:
+                rows.append(stop)
+                sizes.append(len(feature_sets[stop]))
+                n += sizes[-1]
+            stop += 1
+        if rows:
+            x = np.fromiter((f for i in rows for f in feature_sets[i]), dtype=np.uint64, count=n)
+            hashed = a[:, None] * x[None, :]
+            hashed += b[:, None]
+            hashed >>= np.uint64(32)
+            offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+            signatures[rows] = np.minimum.reduceat(hashed, offsets, axis=1).T
+        start = stop
+    return signatures
+
+
+def lsh_candidates(signatures: np.ndarray, bands: int = BANDS) -> set[tuple[int, int]]:
+    """Pairs (i, j), i < j, of rows that agree on every row of at least one band."""
+    n, num_perm = signatures.shape
+    rows = num_perm // bands
+    valid = np.flatnonzero((signatures != _EMPTY).any(axis=1))  # repos without features match nothing
+    pairs: set[tuple[int, int]] = set()
+    for band in range(bands):
+        keys = np.ascontiguousarray(signatures[valid, band * rows:(band + 1) * rows])
+        keys = keys.view(np.dtype((np.void, keys.dtype.itemsize * rows))).ravel()
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        if counts.max(initial=0) < 2:
+            continue
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        for bucket in np.flatnonzero(counts >= 2):
+            members = valid[order[bounds[bucket]:bounds[bucket + 1]]].tolist()
+            if len(members) <= MAX_BUCKET:
+                pairs.update((i, j) for k, i in enumerate(members) for j in members[k + 1:])
+            else:
+                pairs.update(zip(members, members[1:]))
+    return pairs
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+@dataclass
+class Cluster:
+    members: list[int]        # positions in the repo list, most stars first (members[0] is the one to keep)
+    similarity: list[float]   # Jaccard similarity of each member to members[0]
+
+
+def find_clusters(repos: list[dict], threshold: float = DEFAULT_THRESHOLD, bands: int = BANDS,
+                  signatures: np.ndarray | None = None) -> list[Cluster]:
+    """Groups of near-duplicate repos (Jaccard >= *threshold* along a chain of pairs), largest first."""
+    features = [feature_set(repo) for repo in repos]
+    if signatures is None:
+        signatures = minhash_signatures(features)
+    parent = list(range(len(repos)))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in lsh_candidates(signatures, bands):
+        if jaccard(features[i], features[j]) >= threshold:
+            parent[root(i)] = root(j)
+
+    groups: dict[int, list[int]] = {}
+    for i in range(len(repos)):
+        groups.setdefault(root(i), []).append(i)
+    clusters = []
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        members.sort(key=lambda i: -repos[i]["stargazers_count"])
+        clusters.append(Cluster(members, [jaccard(features[members[0]], features[i]) for i in members]))
+    clusters.sort(key=lambda c: (-len(c.members), -repos[c.members[0]]["stargazers_count"]))
+    return clusters
+
+
+def cluster_ids(repos: list[dict], clusters: list[Cluster]) -> dict[str, int]:
+    """html_url -> cluster number, for the repos that are in a cluster."""
+    return {repos[i]["html_url"]: n for n, cluster in enumerate(clusters) for i in cluster.members}
+
+
+def collapse(repos: list[dict], cluster_of: dict[str, int]) -> tuple[list[dict], int]:
+    """*repos* with only the most-starred repo of each cluster present; returns (kept, number hidden).
+
+    Order is preserved, so a relevance-ranked list stays ranked.
+    """
+    best: dict[int, dict] = {}
+    for repo in repos:
+        n = cluster_of.get(repo["html_url"])
+        if n is not None and (n not in best or repo["stargazers_count"] > best[n]["stargazers_count"]):
+            best[n] = repo
+    kept = [repo for repo in repos
+            if (n := cluster_of.get(repo["html_url"])) is None or best[n] is repo]
+    return kept, len(repos) - len(kept)
+
+
+def main():
+    import snapshot_utils
+
+    parser = argparse.ArgumentParser(description="Suggest clusters of near-duplicate repos for curation")
+    parser.add_argument("snapshots", nargs="*", help="snapshot CSVs, e.g. shards of one crawl (default: latest)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="minimum Jaccard similarity")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    args = parser.parse_args()
+
+    paths = args.snapshots
+    if not paths:
+        snapshots = snapshot_utils.list_snapshots()
+        if not snapshots:
+            print(f"❌ No snapshots in {snapshot_utils.SNAPSHOTS_DIR}", file=sys.stderr)
+            return 1
+        paths = [snapshots[-1][1]]
+    repos, seen = [], set()
+    for path in paths:
+        for repo in snapshot_utils.load_snapshot_repos(path):
+            if repo["html_url"] not in seen:
+                seen.add(repo["html_url"])
+                repos.append(repo)
+
+    clusters = find_clusters(repos, args.threshold)
+    if args.format == "json":
+        for cluster in clusters:
+            print(json.dumps([{"name": repos[i]["name"], "url": repos[i]["html_url"],
+                               "stars": repos[i]["stargazers_count"], "similarity": round(s, 3)}
+                              for i, s in zip(cluster.members, cluster.similarity)]))
+        return 0
+    print(f"{len(clusters)} clusters ({sum(len(c.members) - 1 for c in clusters)} possible duplicates) "
+          f"among {len(repos)} repos")
+    for cluster in clusters:
+        print()
+        for k, (i, s) in enumerate(zip(cluster.members, cluster.similarity)):
+            repo = repos[i]
+            mark = "keep" if k == 0 else f"{s:.2f}"
+            print(f"  {mark:>5}  {repo['stargazers_count']:>7}★  {repo['name']:<40} {repo['html_url']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
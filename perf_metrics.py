@@ -0,0 +1,220 @@
+"""
+perf_metrics.py – Lightweight timing spans and counters for the dashboard.
+
+Collection is off unless the LOWCODE_METRICS environment variable is set
+(``LOWCODE_METRICS=1``); when off, ``span()`` returns a shared no-op context
+manager and ``incr()`` returns immediately, so instrumented code pays about
+one attribute lookup per call.
+
+When on, every finished span is:
+    - aggregated into a process-wide registry (count / total / max seconds),
+    - logged as one JSON line on the ``lowcode.metrics`` logger,
+    - recorded on the current script run so the admin debug panel can show it.
+
+Exports:
+    prometheus_text()        Prometheus text exposition format
+    write_prometheus(path)   atomically write it, e.g. for node_exporter's textfile
+                             collector (LOWCODE_METRICS_FILE is written after every run)
+    snapshot()               the same data as a dict (for JSON / st.json)
+
+Usage:
+    with perf_metrics.span("api.page"):
+        ...
+    perf_metrics.incr("api_calls")
+
+    @perf_metrics.timed("snapshot.repos_to_csv")
+    def repos_to_csv(...): ...
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+ENABLED = os.environ.get("LOWCODE_METRICS", "").lower() not in ("", "0", "false", "no")
+METRICS_FILE = os.environ.get("LOWCODE_METRICS_FILE")
+
+logger = logging.getLogger("lowcode.metrics")
+
+_lock = threading.Lock()
+_span_stats: dict[str, list[float]] = {}  # name -> [count, total_seconds, max_seconds]
+_counters: dict[str, float] = {}
+# Streamlit runs every session's script in its own thread, so the current run lives in a thread local
+_local = threading.local()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _record_span(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def _current_run() -> dict | None:
+    return getattr(_local, "run", None)
+
+
+def is_active() -> bool:
+    """True if spans are being recorded in this thread."""
+    return ENABLED or _current_run() is not None
+
+
+def enable(flag: bool = True, log: bool = True):
+    """Turn process-wide collection on or off; *log* also emits JSON span lines on stderr."""
+    global ENABLED
+    ENABLED = flag
+    if flag and log and not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+
+def reset():
+    """Forget all aggregated spans and counters."""
+    with _lock:
+        _span_stats.clear()
+        _counters.clear()
+
+
+def span(name: str):
+    """Context manager timing the block as span *name* (no-op when collection is off)."""
+    if not (ENABLED or _current_run() is not None):
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def timed(name: str):
+    """Decorator form of span()."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def incr(name: str, value: float = 1):
+    """Add *value* to counter *name* (no-op when collection is off)."""
+    if not (ENABLED or _current_run() is not None):
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+    run = _current_run()
+    if run is not None:
+        run["counters"][name] = run["counters"].get(name, 0) + value
+
+
+def _record_span(name: str, seconds: float):
+    with _lock:
+        stats = _span_stats.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+    run = _current_run()
+    if run is not None:
+        run["spans"].append({"name": name, "ms": round(seconds * 1000, 3)})
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({
+            "event": "span", "name": name, "ms": round(seconds * 1000, 3),
+            "run": run["id"] if run else None, "ts": round(time.time(), 3),
+        }))
+
+
+def begin_run(force: bool = False) -> dict | None:
+    """Start recording a script run in this thread. *force* records even when collection is off."""
+    if not (ENABLED or force):
+        _local.run = None
+        return None
+    _local.run = {"id": f"{os.getpid()}-{threading.get_ident()}-{time.time_ns()}",
+                  "start": time.perf_counter(), "spans": [], "counters": {}}
+    return _local.run
+
+
+def end_run() -> dict | None:
+    """Finish the current run, record its total as span "app.run" and refresh METRICS_FILE."""
+    run = _current_run()
+    if run is None:
+        return None
+    _record_span("app.run", time.perf_counter() - run["start"])
+    _local.run = None
+    if METRICS_FILE and ENABLED:
+        write_prometheus(METRICS_FILE)
+    return run
+
+
+def snapshot() -> dict:
+    """Aggregated spans and counters as plain data."""
+    with _lock:
+        return {
+            "spans": {name: {"count": int(c), "total_ms": round(t * 1000, 3), "max_ms": round(m * 1000, 3)}
+                      for name, (c, t, m) in sorted(_span_stats.items())},
+            "counters": dict(sorted(_counters.items())),
+        }
+
+
+def _metric_label(name: str) -> str:
+    return name.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def prometheus_text() -> str:
+    """Aggregated metrics in the Prometheus text exposition format."""
+    data = snapshot()
+    lines = [
+        "# HELP lowcode_span_seconds_total Total time spent in each instrumented phase.",
+        "# TYPE lowcode_span_seconds_total counter",
+    ]
+    lines += [f'lowcode_span_seconds_total{{span="{_metric_label(n)}"}} {s["total_ms"] / 1000:.6f}'
+              for n, s in data["spans"].items()]
+    lines += ["# HELP lowcode_span_count_total Number of times each phase ran.",
+              "# TYPE lowcode_span_count_total counter"]
+    lines += [f'lowcode_span_count_total{{span="{_metric_label(n)}"}} {s["count"]}'
+              for n, s in data["spans"].items()]
+    lines += ["# HELP lowcode_span_max_seconds Slowest single run of each phase.",
+              "# TYPE lowcode_span_max_seconds gauge"]
+    lines += [f'lowcode_span_max_seconds{{span="{_metric_label(n)}"}} {s["max_ms"] / 1000:.6f}'
+              for n, s in data["spans"].items()]
+    lines += ["# HELP lowcode_events_total Dashboard event counters (API calls, cache hits, fallbacks).",
+              "# TYPE lowcode_events_total counter"]
+    lines += [f'lowcode_events_total{{event="{_metric_label(n)}"}} {v:g}'
+              for n, v in data["counters"].items()]
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: str):
+    """Write prometheus_text() to *path* via temp file + rename so scrapers never see half a file."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+    os.replace(tmp, path)
+
+
+if ENABLED:
+    enable()
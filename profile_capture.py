@@ -0,0 +1,71 @@
+"""
+profile_capture.py – Profile a single dashboard rerun with cProfile.
+
+app.py starts a capture when it is opened with ?profile=<ADMIN_SECRET>; the
+whole script execution (fetch or snapshot fallback, filtering, stats figures
+and every category analysis) runs under the profiler and the result is
+offered as a downloadable .prof file, readable with pstats, snakeviz or
+``python -m pstats``.
+
+Streamlit executes each rerun in its own script thread and cProfile only
+profiles the thread that enabled it, so concurrent sessions don't leak into
+the capture. A rerun cut short (st.stop(), a rerun request, an exception)
+never reaches finish(); app.py calls stop_unfinished() at the top of every
+rerun so the profiler it left enabled doesn't keep running into the next,
+unprofiled, rerun or mix into the next capture.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import marshal
+import pstats
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class Capture:
+    prof_bytes: bytes   # same format as pstats.Stats.dump_stats()
+    summary: str        # top functions by cumulative time
+    file_name: str
+
+
+# The profiler started on each thread and not yet finished
+_active = threading.local()
+
+
+def stop_unfinished():
+    """Disable the calling thread's profiler if its capture never reached finish()."""
+    leftover = getattr(_active, "profiler", None)
+    if leftover is not None:
+        leftover.disable()
+        _active.profiler = None
+
+
+def start() -> cProfile.Profile:
+    """Start profiling the calling thread, first stopping a capture it left unfinished."""
+    stop_unfinished()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    _active.profiler = profiler
+    return profiler
+
+
+def finish(profiler: cProfile.Profile, top: int = 40) -> Capture:
+    """Stop *profiler* and package its results."""
+    profiler.disable()
+    if getattr(_active, "profiler", None) is profiler:
+        _active.profiler = None
+    profiler.create_stats()
+    # Serialise before building pstats.Stats: loading a profiler into Stats empties profiler.stats
+    prof_bytes = marshal.dumps(profiler.stats)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(top)
+    return Capture(
+        prof_bytes=prof_bytes,
+        summary=out.getvalue(),
+        file_name=f"dashboard-rerun-{datetime.now().strftime('%Y%m%d-%H%M%S')}.prof",
+    )
@@ -0,0 +1,121 @@
+"""
+profile_imports.py – Report the cold import cost of the dashboard modules.
+
+Usage:
+    python profile_imports.py                      # app modules, top 25 by cumulative time
+    python profile_imports.py --top 50 --sort self
+    python profile_imports.py pandas plotly.graph_objects
+
+Each run imports the given modules in a fresh interpreter with ``-X importtime``
+so nothing is already cached in ``sys.modules``. The report lists the most
+expensive modules (self and cumulative microseconds) and the total wall time.
+app.py itself is not imported: it is a Streamlit script that fetches data at
+import, so its startup cost is Streamlit plus the modules it imports up front.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+APP_PATH = os.path.join(ROOT_DIR, "app.py")
+
+# Modules that must not be pulled in by a plain import of the app modules.
+HEAVY_MODULES = ("pandas", "plotly.graph_objects", "requests", "numpy", "scipy.sparse")
+
+
+def app_modules(path: str = APP_PATH) -> tuple[str, ...]:
+    """Modules imported by top-level statements of app.py, in order (imports inside functions are lazy)."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.append(node.module)
+    return tuple(dict.fromkeys(modules))
+
+
+# What a Streamlit worker imports before app.py renders anything.
+APP_MODULES = app_modules()
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def _run(modules: list[str] | tuple[str, ...], importtime: bool) -> subprocess.CompletedProcess:
+    code = (
+        "import sys, time\n"
+        "t0 = time.perf_counter()\n"
+        f"import {', '.join(modules)}\n"
+        "print(time.perf_counter() - t0)\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", code]
+    result = subprocess.run(cmd, cwd=ROOT_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {', '.join(modules)} failed:\n{result.stderr[-2000:]}")
+    return result
+
+
+def cold_import(modules: list[str] | tuple[str, ...] = APP_MODULES) -> tuple[float, list[str]]:
+    """Import *modules* in a fresh interpreter.
+
+    Returns (wall_seconds, heavy_modules_loaded).
+    """
+    lines = _run(modules, importtime=False).stdout.strip().splitlines()
+    heavy = [m for m in lines[-1].split(",") if m]
+    return float(lines[-2]), heavy
+
+
+def profile_imports(modules: list[str] | tuple[str, ...] = APP_MODULES) -> list[ImportRecord]:
+    """Return one ImportRecord per module loaded while importing *modules*."""
+    records = []
+    for line in _run(modules, importtime=True).stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        records.append(ImportRecord(
+            module=name.strip(),
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            depth=(len(name) - len(name.lstrip())) // 2,
+        ))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-module cold import cost")
+    parser.add_argument("modules", nargs="*", default=list(APP_MODULES))
+    parser.add_argument("--top", type=int, default=25, help="number of modules to list")
+    parser.add_argument("--sort", choices=("cumulative", "self"), default="cumulative")
+    args = parser.parse_args()
+
+    records = profile_imports(args.modules)
+    key = (lambda r: r.cumulative_us) if args.sort == "cumulative" else (lambda r: r.self_us)
+    print(f"{'self [ms]':>10} {'cumul [ms]':>11}  module")
+    for rec in sorted(records, key=key, reverse=True)[:args.top]:
+        print(f"{rec.self_us / 1000:10.1f} {rec.cumulative_us / 1000:11.1f}  {rec.module}")
+
+    wall, heavy = cold_import(args.modules)
+    print(f"\n{len(records)} modules loaded, cold import wall time {wall * 1000:.0f} ms")
+    print(f"Heavy modules loaded: {', '.join(heavy) if heavy else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
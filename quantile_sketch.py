@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+quantile_sketch.py – Box plot statistics from raw values or a mergeable t-digest.
+
+The star box plot is drawn from precomputed quartiles, whiskers and a capped
+list of outliers, so its payload does not grow with the number of repos.
+Up to EXACT_LIMIT values the statistics are computed exactly (box_stats());
+beyond that, and for data that only exists as shards, they come from a
+TDigest: a fixed number of weighted centroids (about compression/2) that
+places small centroids at the tails, where the quantiles of heavy-tailed
+data like star counts need precision, plus the MAX_OUTLIERS smallest and
+largest values for the outlier points. Digests of shards or snapshots merge
+(TDigest.merge / merge_all) into the digest of the combined data, and
+to_dict() / from_dict() store them as JSON.
+
+Merged quartiles of snapshots:
+
+    python quantile_sketch.py snapshots/a.csv snapshots/b.csv
+    python quantile_sketch.py snapshots/*.csv --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+
+import numpy as np
+
+EXACT_LIMIT = 50_000
+COMPRESSION = 200
+MAX_OUTLIERS = 200  # outlier points drawn per side (the most extreme ones)
+
+
+def _fences(q1: float, q3: float) -> tuple[float, float]:
+    iqr = q3 - q1
+    return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+
+def box_stats(values, max_outliers: int = MAX_OUTLIERS) -> dict:
+    """Exact box plot statistics of *values* (linear-interpolated quartiles, Tukey whiskers).
+
+    Returns count, q1, median, q3, lowerfence / upperfence (the most extreme values
+    within 1.5 IQR of the box), outliers (at most *max_outliers* per side, the most
+    extreme), outliers_total and exact=True.
+    """
+    values = np.sort(np.asarray(values, dtype=np.float64))
+    if not len(values):
+        return {"count": 0, "exact": True, "outliers": [], "outliers_total": 0}
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    low, high = _fences(q1, q3)
+    first, last = np.searchsorted(values, low, "left"), np.searchsorted(values, high, "right")
+    below, above = values[:first], values[last:]
+    return {
+        "count": len(values),
+        "q1": float(q1), "median": float(median), "q3": float(q3),
+        "lowerfence": float(values[first]), "upperfence": float(values[last - 1]),
+        "outliers": below[:max_outliers].tolist() + above[max(len(above) - max_outliers, 0):].tolist(),
+        "outliers_total": len(below) + len(above),
+        "exact": True,
+    }
+
+
+class TDigest:
+    """Mergeable quantile sketch: t-digest centroids plus the most extreme values at each end."""
+
+    def __init__(self, compression: int = COMPRESSION, extremes: int = MAX_OUTLIERS):
+        self.compression = compression
+        self.extremes = extremes
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.low = np.empty(0)    # the *extremes* smallest values, ascending
+        self.high = np.empty(0)   # the *extremes* largest values, ascending
+
+    @classmethod
+    def of(cls, values, **kwargs) -> TDigest:
+        digest = cls(**kwargs)
+        digest.update(values)
+        return digest
+
+    @property
+    def count(self) -> int:
+        return int(self.weights.sum())
+
+    def update(self, values):
+        """Add a batch of values."""
+        values = np.asarray(values, dtype=np.float64)
+        self._absorb(values, np.ones(len(values)), np.sort(values))
+
+    def merge(self, other: TDigest) -> TDigest:
+        """Fold *other* (e.g. the digest of another shard or snapshot) into this digest."""
+        self._absorb(other.means, other.weights, other._extremes())
+        return self
+
+    def _absorb(self, means, weights, extremes):
+        self._compress(np.concatenate((self.means, means)), np.concatenate((self.weights, weights)))
+        self.low = np.sort(np.concatenate((self.low, extremes[:self.extremes])))[:self.extremes]
+        high = extremes[max(len(extremes) - self.extremes, 0):]
+        self.high = np.sort(np.concatenate((self.high, high)))[-self.extremes:]
+
+    def _extremes(self) -> np.ndarray:
+        # low and high ascending, each stored value once: with fewer than 2 * extremes values the
+        # two share values, and together they hold all of them
+        overlap = max(0, len(self.low) + len(self.high) - self.count)
+        return np.concatenate((self.low, self.high[overlap:]))
+
+    def _compress(self, means, weights):
+        if not len(means):
+            return
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        # k1 scale function: a centroid may cover one unit of k = compression / (2 pi) * asin(2q - 1),
+        # which is narrow in q near 0 and 1 and wide around the median
+        q = (np.cumsum(weights) - weights / 2) / total
+        k = self.compression / (2 * math.pi) * np.arcsin(2 * q - 1)
+        groups = np.floor(k - k[0]).astype(np.int64)
+        starts = np.flatnonzero(np.diff(groups, prepend=-1))
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def _curve(self) -> tuple[np.ndarray, np.ndarray]:
+        # Piecewise-linear CDF through (min, 0), the centroid centres and (max, count)
+        centres = np.cumsum(self.weights) - self.weights / 2
+        positions = np.concatenate(([0.0], centres, [self.weights.sum()]))
+        values = np.concatenate(([self.low[0]], self.means, [self.high[-1]]))
+        return positions, values
+
+    def quantile(self, q):
+        """Estimated quantile(s) *q* in [0, 1]."""
+        if not len(self.means):
+            raise ValueError("empty digest")
+        positions, values = self._curve()
+        return np.interp(np.asarray(q) * positions[-1], positions, values)
+
+    def rank(self, x):
+        """Estimated number of values below *x*."""
+        positions, values = self._curve()
+        return np.interp(x, values, positions)
+
+    def box_stats(self, max_outliers: int = MAX_OUTLIERS) -> dict:
+        """Estimated box plot statistics, in the format of box_stats() with exact=False.
+
+        Whiskers are the fence limits clipped to the observed range. Outlier
+        points come from the stored extremes; outliers_total is estimated from
+        the digest when more values than that lie beyond a fence. Up to
+        2 * extremes values the extremes hold all data and the result is exact.
+        """
+        if not len(self.means):
+            return {"count": 0, "exact": False, "outliers": [], "outliers_total": 0}
+        if self.count <= 2 * self.extremes:
+            return box_stats(self._extremes(), max_outliers)  # every value is stored
+        q1, median, q3 = (float(v) for v in self.quantile([0.25, 0.5, 0.75]))
+        low, high = _fences(q1, q3)
+        below, above = self.low[self.low < low], self.high[self.high > high]
+        return {
+            "count": self.count,
+            "q1": q1, "median": median, "q3": q3,
+            "lowerfence": max(low, float(self.low[0])), "upperfence": min(high, float(self.high[-1])),
+            "outliers": below[:max_outliers].tolist() + above[max(len(above) - max_outliers, 0):].tolist(),
+            "outliers_total": self._beyond(below, self.low, float(self.rank(low)))
+            + self._beyond(above, self.high, self.count - float(self.rank(high))),
+            "exact": False,
+        }
+
+    @staticmethod
+    def _beyond(outside, extremes, estimate: float) -> int:
+        # Exact while some stored extreme lies inside the fence; beyond that, the digest's estimate
+        if len(outside) < len(extremes):
+            return len(outside)
+        return max(len(outside), round(estimate))
+
+    def to_dict(self) -> dict:
+        return {"compression": self.compression, "extremes": self.extremes,
+                "means": self.means.tolist(), "weights": self.weights.tolist(),
+                "low": self.low.tolist(), "high": self.high.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TDigest:
+        digest = cls(data["compression"], data["extremes"])
+        digest.means, digest.weights = np.array(data["means"], dtype=np.float64), np.array(data["weights"])
+        digest.low, digest.high = np.array(data["low"], dtype=np.float64), np.array(data["high"], dtype=np.float64)
+        return digest
+
+
+def merge_all(digests) -> TDigest:
+    """One digest of the data of all *digests*."""
+    merged = TDigest()
+    for digest in digests:
+        merged.merge(digest)
+    return merged
+
+
+def star_box_stats(star_counts, exact_limit: int | None = None) -> dict:
+    """Box plot statistics of *star_counts*: exact up to *exact_limit* values, else from a TDigest."""
+    exact_limit = exact_limit or EXACT_LIMIT
+    if len(star_counts) <= exact_limit:
+        return box_stats(star_counts)
+    return TDigest.of(star_counts).box_stats()
+
+
+def main():
+    import snapshot_utils
+
+    parser = argparse.ArgumentParser(description="Star count quartiles of one or more snapshots, via merged t-digests")
+    parser.add_argument("snapshots", nargs="+", help="snapshot CSVs (shards or dates)")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    args = parser.parse_args()
+
+    digests = [TDigest.of([repo["stargazers_count"] for repo in snapshot_utils.load_snapshot_repos(path)])
+               for path in args.snapshots]
+    stats = merge_all(digests).box_stats()
+    if args.format == "json":
+        print(json.dumps(stats))
+        return 0
+    if not stats["count"]:
+        print("No repositories", file=sys.stderr)
+        return 1
+    print(f"{stats['count']} repositories in {len(digests)} snapshot(s)")
+    for key in ("lowerfence", "q1", "median", "q3", "upperfence"):
+        print(f"  {key:<11} {stats[key]:>10.1f}")
+    print(f"  outliers    {stats['outliers_total']:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
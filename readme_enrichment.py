@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+readme_enrichment.py – Optional README stage for the category classifier.
+
+keyword_analysis only sees a repo's name, topics and (truncated) description,
+which misses many modeling / UML / AI tools. This stage fetches every repo's
+README through the GitHub API and stores a size-capped plain-text excerpt in
+``repo["readme_excerpt"]``, which the classifier reads alongside the
+description.
+
+Fetching:
+    - a bounded thread pool (--workers, default 8)
+    - conditional requests: the stored ETag is sent as If-None-Match, and a
+      304 costs no rate limit and no download
+    - rate-limit aware (github_rate_limit.py): when the quota runs out the stage
+      waits for the reset if it is close (max_wait) and otherwise skips the
+      remaining repos
+    - repos whose pushed_at hasn't changed since the last fetch aren't requested at all
+
+Cache (LOWCODE_README_CACHE, default .cache/readmes/), content addressed:
+    blobs/<sha[:2]>/<sha>   raw README bytes, keyed by the git blob SHA GitHub reports
+    index.json              owner/repo -> {sha, etag, pushed_at}
+
+Enable in the app with LOWCODE_README_ENRICHMENT=1. Warm the cache / compare
+classifications from the command line:
+
+    GITHUB_TOKEN=... python readme_enrichment.py                      # latest snapshot
+    GITHUB_API_BASE=http://127.0.0.1:8765 python readme_enrichment.py --workers 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from urllib.parse import urlparse
+
+import snapshot_utils
+from github_rate_limit import RateLimitExhausted, RateLimitGate
+
+ENABLED = os.environ.get("LOWCODE_README_ENRICHMENT", "").lower() not in ("", "0", "false", "no")
+CACHE_DIR = os.environ.get(
+    "LOWCODE_README_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "readmes"),
+)
+# Characters of README text handed to the classifier
+EXCERPT_CHARS = 4000
+
+_FENCED_CODE = re.compile(r"```.*?```|~~~.*?~~~", re.S)
+_HTML_TAG = re.compile(r"<[^>]+>")
+_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_URL = re.compile(r"https?://\S+")
+_MARKUP = re.compile(r"[#*_>|`=-]{2,}|^\s*[#>*-]+\s*", re.M)
+_SPACE = re.compile(r"\s+")
+
+
+def repo_full_name(repo: dict) -> str:
+    """owner/name of a repo in API format (snapshot rows only have html_url)."""
+    return repo.get("full_name") or urlparse(repo["html_url"]).path.strip("/")
+
+
+def readme_excerpt(text: str, limit: int = EXCERPT_CHARS) -> str:
+    """Plain-text prose of a Markdown README: no code blocks, badges, HTML or URLs; at most *limit* chars."""
+    text = _FENCED_CODE.sub(" ", text)
+    text = _IMAGE.sub(" ", text)
+    text = _LINK.sub(r"\1", text)
+    text = _HTML_TAG.sub(" ", text)
+    text = _URL.sub(" ", text)
+    text = _MARKUP.sub(" ", text)
+    return _SPACE.sub(" ", text).strip()[:limit]
+
+
+class ReadmeCache:
+    """Content-addressed README store plus the per-repo index (sha, etag, pushed_at)."""
+
+    def __init__(self, cache_dir: str | None = None):
+        self.cache_dir = cache_dir or CACHE_DIR
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(self.cache_dir, "index.json")
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                self.index: dict[str, dict] = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def _blob_path(self, sha: str) -> str:
+        return os.path.join(self.cache_dir, "blobs", sha[:2], sha)
+
+    def entry(self, full_name: str) -> dict | None:
+        with self._lock:
+            entry = self.index.get(full_name.lower())
+        if entry and entry.get("sha") and not os.path.exists(self._blob_path(entry["sha"])):
+            return None  # blob was removed: treat as never fetched
+        return entry
+
+    def read(self, sha: str) -> str:
+        with open(self._blob_path(sha), "rb") as f:
+            return f.read().decode("utf-8", errors="replace")
+
+    def store(self, full_name: str, sha: str | None, etag: str | None, pushed_at: str | None,
+              content: bytes | None = None):
+        """Record the repo's README; *content* is written only if that blob isn't stored yet."""
+        if content is not None and sha:
+            path = self._blob_path(sha)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(content)
+                os.replace(tmp, path)
+        with self._lock:
+            self.index[full_name.lower()] = {"sha": sha, "etag": etag, "pushed_at": pushed_at}
+
+    def save(self):
+        """Write index.json (atomically)."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with self._lock:
+            data = json.dumps(self.index, sort_keys=True)
+        tmp = f"{self._index_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, self._index_path)
+
+
+def enrich_repos(repos: list[dict], token: str | None = None, api_base: str | None = None,
+                 cache_dir: str | None = None, max_workers: int = 8, max_wait: float = 60.0,
+                 timeout: float = 10.0) -> Counter:
+    """Set repo["readme_excerpt"] on every repo with a README. Returns counts per outcome:
+
+    cached (not requested), not_modified (304), downloaded, missing (no README),
+    skipped (rate limit), errors.
+    """
+    import requests
+
+    api_base = (api_base or snapshot_utils.GITHUB_API_BASE).rstrip("/")
+    cache = ReadmeCache(cache_dir)
+    gate = RateLimitGate(max_wait=max_wait)
+    headers = {"Accept": "application/vnd.github+json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    local = threading.local()
+    stats = Counter()
+    stats_lock = threading.Lock()
+
+    def count(outcome):
+        with stats_lock:
+            stats[outcome] += 1
+
+    def enrich(repo):
+        full_name = repo_full_name(repo)
+        entry = cache.entry(full_name)
+        if entry and entry.get("pushed_at") and entry["pushed_at"] == repo.get("pushed_at"):
+            count("cached")
+        else:
+            if not hasattr(local, "session"):
+                local.session = requests.Session()
+            request_headers = dict(headers)
+            if entry and entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            try:
+                gate.wait()
+                response = local.session.get(f"{api_base}/repos/{full_name}/readme",
+                                             headers=request_headers, timeout=timeout)
+            except RateLimitExhausted:
+                count("skipped")
+                return
+            except requests.exceptions.RequestException:
+                count("errors")
+                return
+            gate.update(response)
+            if response.status_code == 304:
+                cache.store(full_name, entry["sha"], entry["etag"], repo.get("pushed_at"))
+                count("not_modified")
+            elif response.status_code == 200:
+                body = response.json()
+                content = base64.b64decode(body.get("content") or "")
+                cache.store(full_name, body.get("sha"), response.headers.get("ETag"), repo.get("pushed_at"), content)
+                entry = cache.entry(full_name)
+                count("downloaded")
+            elif response.status_code == 404:
+                cache.store(full_name, None, None, repo.get("pushed_at"))
+                count("missing")
+                return
+            elif response.status_code in (403, 429):
+                count("skipped")
+                return
+            else:
+                count("errors")
+                return
+        if entry and entry.get("sha"):
+            repo["readme_excerpt"] = readme_excerpt(cache.read(entry["sha"]))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(enrich, repos))
+    cache.save()
+    return stats
+
+
+def main():
+    from keyword_analysis import KEYWORD_SETS, categorize_repos
+
+    parser = argparse.ArgumentParser(description="Fetch README excerpts and compare category counts")
+    parser.add_argument("--snapshot", help="snapshot CSV (default: latest in snapshots/)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--max-wait", type=float, default=60.0,
+                        help="longest wait for a rate-limit reset before skipping the rest")
+    args = parser.parse_args()
+
+    path = args.snapshot
+    if path is None:
+        snapshots = snapshot_utils.list_snapshots()
+        if not snapshots:
+            print(f"❌ No snapshots in {snapshot_utils.SNAPSHOTS_DIR}", file=sys.stderr)
+            return 1
+        path = snapshots[-1][1]
+    repos = snapshot_utils.load_snapshot_repos(path)
+    before = {c: len(categorize_repos(repos, c)[0]) for c in KEYWORD_SETS}
+    start = time.perf_counter()
+    stats = enrich_repos(repos, token=os.environ.get("GITHUB_TOKEN"), cache_dir=args.cache_dir,
+                         max_workers=args.workers, max_wait=args.max_wait)
+    print(f"📚 {len(repos)} repos in {time.perf_counter() - start:.1f}s: "
+          + ", ".join(f"{n} {outcome}" for outcome, n in sorted(stats.items())))
+    for category in KEYWORD_SETS:
+        after = len(categorize_repos(repos, category)[0])
+        print(f"   {category:<10} {before[category]:>4} -> {after:>4}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+repo_export.py – Chunked export of a repo list as CSV, JSON Lines or Parquet.
+
+Rows use the snapshot column mapping (snapshot_utils.repo_to_row, so an
+exported CSV reads back with load_snapshot_repos) followed by one boolean
+"Mentions <category>" column per Repository Analysis category. Repos are
+converted CHUNK_ROWS at a time and each format is produced as a stream of
+byte chunks (iter_export), so an export of any size never exists as one
+string: the data API sends the chunks as they are made, and the dashboard
+collects them into its download buffer only when an export is requested.
+
+    python repo_export.py --format parquet -o lowcode.parquet          # latest snapshot
+    python repo_export.py snapshots/snapshot-2026-04-19.csv --format jsonl --min-stars 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+from typing import Iterator, Sequence
+
+import snapshot_utils
+from keyword_analysis import KEYWORD_SETS, categorize_repos
+
+CHUNK_ROWS = 5000
+# format -> (MIME type, file extension)
+FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+CATEGORY_COLUMNS = {category: f"Mentions {category}" for category in KEYWORD_SETS}
+_INT_COLUMNS = {"Stars⭐", "Forks", "Issues", "Releases", "Contributors", "Commits (1y)"}
+
+
+def export_columns(repos: Sequence[dict]) -> list[str]:
+    """Columns of an export of *repos*: snapshot columns, metrics and profiles present on any repo, category flags."""
+    optional = {**snapshot_utils.METRIC_COLUMNS, snapshot_utils.PROFILES_COLUMN: "profiles"}
+    extra_columns = [column for column, key in optional.items() if any(key in repo for repo in repos)]
+    return snapshot_utils.SNAPSHOT_COLUMNS + extra_columns + list(CATEGORY_COLUMNS.values())
+
+
+def export_chunks(repos: Sequence[dict], categories: Sequence[list[str]] | None = None,
+                  chunk_rows: int = CHUNK_ROWS) -> Iterator[list[dict]]:
+    """Export rows of *repos*, *chunk_rows* at a time, every row with all export_columns().
+
+    *categories* (the category names of each repo, as data_api.Dataset keeps them)
+    saves classifying the repos again.
+    """
+    extra_columns = export_columns(repos)[len(snapshot_utils.SNAPSHOT_COLUMNS):-len(CATEGORY_COLUMNS)]
+    for start in range(0, len(repos), chunk_rows):
+        chunk = repos[start:start + chunk_rows]
+        if categories is not None:
+            flags = [set(c) for c in categories[start:start + chunk_rows]]
+        else:
+            # Classification is per repo, so classifying a chunk gives the same flags as the whole list
+            members = {category: {r["html_url"] for r in categorize_repos(chunk, category)[0]}
+                       for category in CATEGORY_COLUMNS}
+            flags = [{c for c in CATEGORY_COLUMNS if repo["html_url"] in members[c]} for repo in chunk]
+        rows = []
+        for repo, repo_flags in zip(chunk, flags):
+            row = snapshot_utils.repo_to_row(repo)
+            for column in extra_columns:
+                row.setdefault(column, "")
+            for category, column in CATEGORY_COLUMNS.items():
+                row[column] = category in repo_flags
+            rows.append(row)
+        yield rows
+
+
+def _typed(row: dict) -> dict:
+    # Blank metric cells (repos without that metric) are null outside CSV
+    return {k: None if v == "" and k in _INT_COLUMNS else v for k, v in row.items()}
+
+
+def _csv(repos, categories, chunk_rows) -> Iterator[bytes]:
+    import pandas as pd
+
+    columns = export_columns(repos)
+    # Same writer as repos_to_csv, one chunk at a time
+    yield pd.DataFrame(columns=columns).to_csv(index=False).encode("utf-8")
+    for rows in export_chunks(repos, categories, chunk_rows):
+        yield pd.DataFrame(rows, columns=columns).to_csv(index=False, header=False).encode("utf-8")
+
+
+def _jsonl(repos, categories, chunk_rows) -> Iterator[bytes]:
+    for rows in export_chunks(repos, categories, chunk_rows):
+        yield "".join(json.dumps(_typed(row), ensure_ascii=False) + "\n" for row in rows).encode("utf-8")
+
+
+class _Drain(io.RawIOBase):
+    """Write-only sink whose content is taken out after every row group."""
+
+    def __init__(self):
+        self.parts: list[bytes] = []
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.parts.append(bytes(b))
+        return len(b)
+
+    def take(self) -> bytes:
+        data, self.parts = b"".join(self.parts), []
+        return data
+
+
+def _parquet_schema(columns: list[str]):
+    import pyarrow as pa
+
+    return pa.schema([
+        (c, pa.int64() if c in _INT_COLUMNS else pa.bool_() if c in CATEGORY_COLUMNS.values() else pa.string())
+        for c in columns
+    ])
+
+
+def _parquet(repos, categories, chunk_rows) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema(export_columns(repos))
+    sink = _Drain()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for rows in export_chunks(repos, categories, chunk_rows):
+            writer.write_table(pa.Table.from_pylist([_typed(row) for row in rows], schema=schema))  # one row group
+            yield sink.take()
+    yield sink.take()  # footer
+
+
+_WRITERS = {"csv": _csv, "jsonl": _jsonl, "parquet": _parquet}
+
+
+def iter_export(repos: Sequence[dict], fmt: str, categories: Sequence[list[str]] | None = None,
+                chunk_rows: int = CHUNK_ROWS) -> Iterator[bytes]:
+    """The export of *repos* in *fmt* (a FORMATS key) as a stream of byte chunks."""
+    if fmt not in _WRITERS:
+        raise ValueError(f"unknown export format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    return _WRITERS[fmt](repos, categories, chunk_rows)
+
+
+def export_buffer(repos: Sequence[dict], fmt: str, chunk_rows: int = CHUNK_ROWS) -> io.BytesIO:
+    """The export as a rewound in-memory file, e.g. for st.download_button (which keeps its data in memory)."""
+    buffer = io.BytesIO()
+    for chunk in iter_export(repos, fmt, chunk_rows=chunk_rows):
+        buffer.write(chunk)
+    buffer.seek(0)
+    return buffer
+
+
+def main():
+    from datetime import datetime
+
+    import dashboard_data
+
+    parser = argparse.ArgumentParser(description="Export a snapshot (with category flags) as CSV, JSONL or Parquet")
+    parser.add_argument("snapshot", nargs="?", help="snapshot CSV (default: latest in snapshots/)")
+    parser.add_argument("--format", choices=list(FORMATS), default="csv")
+    parser.add_argument("--min-stars", type=int, default=0)
+    parser.add_argument("--min-date", type=lambda s: datetime.strptime(s, "%Y-%m-%d"), default=datetime(1970, 1, 1),
+                        help="last commit on or after YYYY-MM-DD")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = parser.parse_args()
+
+    path = args.snapshot
+    if not path:
+        snapshots = snapshot_utils.list_snapshots()
+        if not snapshots:
+            print(f"❌ No snapshots in {snapshot_utils.SNAPSHOTS_DIR}", file=sys.stderr)
+            return 1
+        path = snapshots[-1][1]
+    repos = dashboard_data.filter_repos(snapshot_utils.load_snapshot_repos(path), args.min_stars, args.min_date)
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for chunk in iter_export(repos, args.format):
+            out.write(chunk)
+    finally:
+        if args.output:
+            out.close()
+    if args.output:
+        print(f"✅ {len(repos)} repositories written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark runner for the Low-Code Tools Dashboard
+
+Times the dashboard's hot paths on synthetic datasets (see synthetic_repos.py)
+at increasing scales, saves the timings as JSON and compares them against a
+stored baseline to flag regressions.
+
+Timed at each scale:
+    repos_to_csv        writing a snapshot CSV
+    snapshot_load       reading a snapshot CSV back into API format
+    slider_filter       min stars / last commit filtering
+    table_rows          building the repository table rows
+    stats_aggregation   year / language / star aggregations
+    analysis_<category> keyword analysis for each category
+    search_index_build  building the full-text search index (timed once)
+    search_query        a broad, a narrow and a two-word search query
+    near_duplicates     MinHash/LSH near-duplicate clustering (timed once)
+    scatter_points      stars-versus-age scatter points, binned above SCATTER_MAX_POINTS
+    star_box_stats      star box plot statistics, from a t-digest above EXACT_LIMIT
+
+Usage:
+    python run_benchmarks.py                             # 1k, 10k, 100k repos
+    python run_benchmarks.py --scales 1000,1000000       # up to 1M repos
+    python run_benchmarks.py --save-baseline             # store results as the new baseline
+    python run_benchmarks.py --tolerance 0.5             # allow 50% slowdown before flagging
+
+Timings are the best of --repeat runs, in seconds. Baselines are machine
+specific: regenerate benchmarks/baseline.json with --save-baseline on the
+machine you compare against. Exit code is 1 when a regression is flagged.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import dashboard_data
+import near_duplicates
+import quantile_sketch
+import snapshot_utils
+from search_index import SearchIndex
+from keyword_analysis import KEYWORD_SETS, categorize_repos
+from synthetic_repos import generate_repos
+
+BENCH_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+RESULTS_PATH = os.path.join(BENCH_DIR, "results", "latest.json")
+
+# Timings below this are dominated by timer noise and never flagged
+NOISE_FLOOR_SECONDS = 0.002
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_scale(n, repeat=3, seed=0):
+    """Return {benchmark_name: seconds} for a synthetic dataset of *n* repos."""
+    today = datetime.now()
+    repos = generate_repos(n, seed=seed, today=today)
+    one_year_ago = today - timedelta(days=365)
+    filtered = dashboard_data.filter_repos(repos, 50, one_year_ago)
+
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "snapshot-bench.csv")
+        timings["repos_to_csv"] = _best_of(lambda: snapshot_utils.repos_to_csv(repos, csv_path), repeat)
+        timings["snapshot_load"] = _best_of(lambda: snapshot_utils.load_snapshot_repos(csv_path), repeat)
+
+    timings["slider_filter"] = _best_of(
+        lambda: dashboard_data.filter_repos(repos, 500, today - timedelta(days=90)), repeat
+    )
+    timings["table_rows"] = _best_of(lambda: dashboard_data.table_rows(filtered), repeat)
+    timings["stats_aggregation"] = _best_of(lambda: (
+        dashboard_data.first_commit_year_counts(filtered),
+        dashboard_data.language_counts(filtered),
+        dashboard_data.star_counts(filtered),
+    ), repeat)
+    for category in KEYWORD_SETS:
+        timings[f"analysis_{category}"] = _best_of(lambda: categorize_repos(filtered, category), repeat)
+
+    # Built once per dataset version in the app, so a single run is representative
+    timings["search_index_build"] = _best_of(lambda: SearchIndex(repos), 1)
+    index = SearchIndex(repos)
+    timings["search_query"] = _best_of(
+        lambda: [index.search(q) for q in ("low code", "uml", "workflow automation")], repeat
+    )
+    timings["near_duplicates"] = _best_of(lambda: near_duplicates.find_clusters(repos), 1)
+    timings["scatter_points"] = _best_of(lambda: dashboard_data.scatter_points(repos, today), repeat)
+    star_counts = dashboard_data.star_counts(repos)
+    timings["star_box_stats"] = _best_of(lambda: quantile_sketch.star_box_stats(star_counts), repeat)
+    return timings
+
+
+def run_benchmarks(scales, repeat=3):
+    results = {}
+    for n in scales:
+        print(f"📏 {n:,} repos")
+        results[str(n)] = bench_scale(n, repeat)
+        for name, seconds in results[str(n)].items():
+            print(f"   {name:<22} {seconds * 1000:10.2f} ms")
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance=0.25):
+    """Return a list of (scale, name, baseline_s, current_s) slower than *tolerance* allows."""
+    regressions = []
+    for scale, timings in current["results"].items():
+        base_timings = baseline.get("results", {}).get(scale, {})
+        for name, seconds in timings.items():
+            base = base_timings.get(name)
+            if base is None or seconds < NOISE_FLOOR_SECONDS:
+                continue
+            if seconds > base * (1 + tolerance):
+                regressions.append((scale, name, base, seconds))
+    return regressions
+
+
+def _write_json(data, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard hot paths")
+    parser.add_argument("--scales", default="1000,10000,100000",
+                        help="comma-separated repo counts (default: 1000,10000,100000)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=RESULTS_PATH)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown vs baseline before flagging (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    print("🚀 Low-Code Tools Dashboard Benchmarks")
+    print("=" * 50)
+    current = run_benchmarks([int(s) for s in args.scales.split(",")], args.repeat)
+    _write_json(current, args.output)
+    print(f"\nResults saved: {args.output}")
+
+    if args.save_baseline:
+        _write_json(current, args.baseline)
+        print(f"Baseline saved: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline found; run with --save-baseline to create one.")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        regressions = compare(current, json.load(f), args.tolerance)
+
+    print("\n" + "=" * 50)
+    if not regressions:
+        print("✅ No regressions against baseline.")
+        return 0
+    print(f"❌ {len(regressions)} regression(s) against baseline:")
+    for scale, name, base, seconds in regressions:
+        print(f"   {int(scale):>9,} repos  {name:<22} {base * 1000:9.2f} ms -> {seconds * 1000:9.2f} ms "
+              f"({seconds / base:.2f}x)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,12 +8,18 @@ Usage:
     python run_tests.py           # Run all tests
     python run_tests.py simple    # Run only simple tests
     python run_tests.py full      # Run comprehensive tests
+    python run_tests.py startup   # Run the cold-import time budget check
+    python run_tests.py features  # Run every other tests/test_*.py module
 """
 
 import sys
 import subprocess
 import os
 
+# Modules with a suite of their own; every other tests/test_*.py belongs to the feature suite,
+# so new test modules run under "all" without being registered here
+DEDICATED_MODULES = {"test_simple.py", "test_api_fallback.py", "test_startup_time.py"}
+
 def run_simple_tests():
     """Run the simple test suite."""
     print("🧪 Running Simple Tests...")
@@ -59,6 +65,47 @@ def run_comprehensive_tests():
     
     return result.returncode == 0
 
+def run_startup_tests():
+    """Run the cold-import time budget check."""
+    print("\n⏱️ Running Startup-Time Tests...")
+    print("=" * 50)
+
+    result = subprocess.run([
+        sys.executable, "tests/test_startup_time.py"
+    ], capture_output=True, text=True)
+
+    print(result.stdout)
+    print(result.stderr)
+
+    return result.returncode == 0
+
+def feature_test_modules():
+    """tests/test_*.py modules not covered by a dedicated suite, sorted."""
+    return sorted(name for name in os.listdir("tests")
+                  if name.startswith("test_") and name.endswith(".py") and name not in DEDICATED_MODULES)
+
+def run_feature_tests():
+    """Run every feature test module, each in its own interpreter."""
+    print("\n🧩 Running Feature Tests...")
+    print("=" * 50)
+
+    failed = []
+    for name in feature_test_modules():
+        result = subprocess.run([
+            sys.executable, os.path.join("tests", name)
+        ], capture_output=True, text=True)
+        # unittest reports on stderr; its last lines are "Ran N tests ..." and OK / FAILED
+        summary = [line for line in result.stderr.splitlines() if line.strip()][-2:]
+        print(f"{'✅' if result.returncode == 0 else '❌'} {name}: {' '.join(summary)}")
+        if result.returncode != 0:
+            failed.append(name)
+            print(result.stdout)
+            print(result.stderr)
+
+    if failed:
+        print(f"Failed modules: {', '.join(failed)}")
+    return not failed
+
 def main():
     """Main test runner."""
     args = sys.argv[1:] if len(sys.argv) > 1 else ['all']
@@ -71,13 +118,19 @@ def main():
         success = run_simple_tests()
     elif test_type in ['full', 'comprehensive', 'complete']:
         success = run_comprehensive_tests()
+    elif test_type in ['startup', 'import']:
+        success = run_startup_tests()
+    elif test_type in ['features', 'feature']:
+        success = run_feature_tests()
     elif test_type in ['all', 'both']:
         simple_success = run_simple_tests()
         comprehensive_success = run_comprehensive_tests()
-        success = simple_success and comprehensive_success
+        startup_success = run_startup_tests()
+        feature_success = run_feature_tests()
+        success = simple_success and comprehensive_success and startup_success and feature_success
     else:
         print(f"❌ Unknown test type: {test_type}")
-        print("Available options: simple, full, all")
+        print("Available options: simple, full, startup, features, all")
         return 1
     
     print("\n" + "=" * 50)
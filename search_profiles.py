@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+search_profiles.py – Declarative GitHub search profiles, crawled together.
+
+A profile (search_profiles.toml, or LOWCODE_SEARCH_PROFILES) names one
+ecosystem: its search queries, star threshold, activity window and excluded
+repos. crawl_profiles() runs the searches of all profiles concurrently,
+sharing one RateLimitGate, and merges the results: every repo is kept once
+(by GitHub id) with ``repo["profiles"]`` listing the profiles that found and
+don't exclude it. Snapshots store that list in their Profiles column, so the
+dashboard switches between profiles of one crawl without API calls.
+
+The first profile is the default: repos loaded from snapshots without a
+Profiles column (and the bundled CSV) belong to it.
+
+    python search_profiles.py                                   # profiles and their searches
+    python search_profiles.py snapshots/snapshot-2026-04-19.csv # members per profile
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Sequence
+
+from github_rate_limit import RateLimitGate
+
+PROFILES_PATH = os.environ.get(
+    "LOWCODE_SEARCH_PROFILES", os.path.join(os.path.dirname(os.path.abspath(__file__)), "search_profiles.toml")
+)
+_FIELDS = {"title", "queries", "min_stars", "active_days", "exclude"}
+
+
+@dataclass(frozen=True)
+class SearchProfile:
+    name: str
+    title: str
+    queries: tuple[str, ...]
+    min_stars: int = 50
+    active_days: int = 365
+    exclude: frozenset[str] = frozenset()
+
+    def full_query(self, query: str, today: datetime | None = None) -> str:
+        """*query* with this profile's stars:>= and pushed:>= qualifiers."""
+        cutoff = ((today or datetime.now()) - timedelta(days=self.active_days)).strftime("%Y-%m-%d")
+        return f"{query} stars:>={self.min_stars} pushed:>={cutoff}"
+
+    def excludes(self, repo: dict) -> bool:
+        return repo["name"] in self.exclude
+
+
+@lru_cache(maxsize=4)
+def _load(path: str, mtime: float) -> tuple[SearchProfile, ...]:
+    with open(path, "rb") as f:
+        config = tomllib.load(f).get("profiles") or {}
+    profiles = []
+    for name, fields in config.items():
+        unknown = set(fields) - _FIELDS
+        if unknown:
+            raise ValueError(f"{path}: profile {name!r} has unknown keys {', '.join(sorted(unknown))}")
+        if not fields.get("queries"):
+            raise ValueError(f"{path}: profile {name!r} has no queries")
+        profiles.append(SearchProfile(
+            name=name,
+            title=fields.get("title", name),
+            queries=tuple(fields["queries"]),
+            min_stars=int(fields.get("min_stars", 50)),
+            active_days=int(fields.get("active_days", 365)),
+            exclude=frozenset(fields.get("exclude", ())),
+        ))
+    if not profiles:
+        raise ValueError(f"{path}: no [profiles.<name>] tables")
+    return tuple(profiles)
+
+
+def load_profiles(path: str | None = None) -> list[SearchProfile]:
+    """The profiles in *path* (default PROFILES_PATH), in file order; re-read only when the file changes."""
+    path = path or PROFILES_PATH
+    return list(_load(path, os.path.getmtime(path)))
+
+
+def repo_key(repo: dict):
+    # Snapshot rows have no id; their URL is just as unique
+    return repo.get("id", repo["html_url"])
+
+
+def merge_profiles(profiles: Sequence[SearchProfile], results: dict[str, list[dict]]) -> list[dict]:
+    """One list of the repos found per profile (*results*: profile name -> repos), most stars first.
+
+    Each repo is kept once, with repo["profiles"] set to the profiles (in
+    *profiles* order) that found it and don't exclude it; repos that every
+    profile excludes are dropped.
+    """
+    merged: dict = {}
+    for profile in profiles:
+        for repo in results.get(profile.name, ()):
+            if profile.excludes(repo):
+                continue
+            kept = merged.setdefault(repo_key(repo), repo)
+            member_of = kept.setdefault("profiles", [])
+            if profile.name not in member_of:
+                member_of.append(profile.name)
+    return sorted(merged.values(), key=lambda repo: repo["stargazers_count"], reverse=True)
+
+
+def crawl_profiles(profiles: Sequence[SearchProfile], crawl_query: Callable, today: datetime | None = None,
+                   max_workers: int = 4, max_wait: float = 60.0) -> tuple[list[dict], dict[str, dict]]:
+    """Crawl every query of *profiles* concurrently under one rate-limit budget. Returns (repos, stats).
+
+    crawl_query(full_query, gate) crawls one search and returns (items, stats);
+    it calls gate.wait() before and gate.update(response) after every request,
+    so all searches draw on the same github_rate_limit.RateLimitGate. A search
+    shared by several profiles is crawled once. *repos* is merge_profiles() of
+    the results; *stats* maps each full query to its crawl stats.
+    """
+    searches: dict[str, list[str]] = {}  # full query -> profiles
+    for profile in profiles:
+        for query in profile.queries:
+            searches.setdefault(profile.full_query(query, today), []).append(profile.name)
+    gate = RateLimitGate(max_wait=max_wait)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        crawled = dict(zip(searches, pool.map(lambda q: crawl_query(q, gate), searches)))
+    results: dict[str, list[dict]] = {}
+    for full_query, names in searches.items():
+        for name in names:
+            results.setdefault(name, []).extend(crawled[full_query][0])
+    return merge_profiles(profiles, results), {q: stats for q, (_, stats) in crawled.items()}
+
+
+def apply_profiles(repos: list[dict], profiles: Sequence[SearchProfile]) -> list[dict]:
+    """*repos* (e.g. from a snapshot) with membership brought in line with the current *profiles*.
+
+    Repos without a "profiles" entry belong to the first profile. Memberships
+    of profiles that no longer exist or now exclude the repo are removed, and
+    repos left without any profile are dropped.
+    """
+    by_name = {profile.name: profile for profile in profiles}
+    default = [profiles[0].name]
+    kept = []
+    for repo in repos:
+        member_of = [name for name in repo.get("profiles") or default
+                     if name in by_name and not by_name[name].excludes(repo)]
+        if member_of:
+            repo["profiles"] = member_of
+            kept.append(repo)
+    return kept
+
+
+def members(repos: list[dict], name: str) -> list[dict]:
+    """The repos of profile *name*, in their order in *repos*."""
+    return [repo for repo in repos if name in repo["profiles"]]
+
+
+def main():
+    import snapshot_utils
+
+    parser = argparse.ArgumentParser(description="Show the search profiles, or their members in a snapshot")
+    parser.add_argument("snapshot", nargs="?", help="snapshot CSV to count members of")
+    parser.add_argument("--profiles", default=PROFILES_PATH, help="profile file (default: %(default)s)")
+    args = parser.parse_args()
+
+    profiles = load_profiles(args.profiles)
+    repos = apply_profiles(snapshot_utils.load_snapshot_repos(args.snapshot), profiles) if args.snapshot else None
+    for profile in profiles:
+        line = f"{profile.name} ({profile.title}), {len(profile.exclude)} excluded"
+        if repos is not None:
+            line += f": {len(members(repos, profile.name))} repositories"
+        print(line)
+        for query in profile.queries:
+            print(f"  {profile.full_query(query)}")
+    if repos is not None:
+        print(f"{len(repos)} repositories in all")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+snapshot_diff.py – What changed between two snapshots.
+
+Reports, as a stream of change records:
+    added      repo in the new snapshot only
+    removed    repo in the old snapshot only (e.g. dropped by the activity cutoff or excluded)
+    renamed    same URL with a new name, or a repo that moved to a new URL
+               (same name and first-commit date, e.g. bram2w/baserow -> baserow/baserow)
+    stars      star count changed by at least --min-delta stars and --min-pct percent
+
+The comparison is a hash join on URL: the old snapshot is indexed in one pass,
+the new one is streamed against it, so the cost is linear in the number of
+rows and only the old snapshot is held in memory. Records are written as they
+are produced; --format jsonl gives a machine-readable changelog, one JSON
+object per line.
+
+Usage:
+    python snapshot_diff.py                                  # two latest snapshots in snapshots/
+    python snapshot_diff.py OLD.csv NEW.csv --format jsonl -o changes.jsonl
+    python snapshot_diff.py --min-delta 1000 --only stars
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+from collections import Counter
+from typing import Iterable, Iterator
+
+import snapshot_utils
+
+CHANGE_TYPES = ("added", "removed", "renamed", "stars")
+
+
+def _key(url: str) -> str:
+    return url.strip().rstrip("/").lower()
+
+
+def _identity(row: dict) -> tuple[str, str]:
+    # Name + first commit date survive an ownership transfer, the URL doesn't
+    return row["Name"].lower(), row["First Commit"]
+
+
+def iter_snapshot_rows(path: str) -> Iterator[dict]:
+    """Rows of a snapshot CSV, one at a time (utf-8-sig: the oldest snapshot has a BOM)."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        yield from csv.DictReader(f)
+
+
+def _stars(row: dict) -> int:
+    return int(row["Stars⭐"] or 0)
+
+
+def _summary(row: dict) -> dict:
+    return {"name": row["Name"], "url": row["URL"], "stars": _stars(row)}
+
+
+def diff_rows(old_rows: Iterable[dict], new_rows: Iterable[dict],
+              min_delta: int = 100, min_pct: float = 10.0) -> Iterator[dict]:
+    """Yield change records between two iterables of snapshot rows (see module docstring)."""
+    old = {}
+    for row in old_rows:
+        old.setdefault(_key(row["URL"]), row)
+    old_by_identity = {_identity(row): key for key, row in old.items()}
+
+    matched = set()
+    maybe_moved = []  # new rows whose identity matches an old row; resolved once all URLs are seen
+    for new in new_rows:
+        key = _key(new["URL"])
+        if key in matched:
+            continue
+        before = old.get(key)
+        if before is None:
+            if _identity(new) in old_by_identity:
+                maybe_moved.append(new)
+            else:
+                yield {"change": "added", **_summary(new)}
+            continue
+        matched.add(key)
+        if before["Name"] != new["Name"]:
+            yield {"change": "renamed", **_summary(new), "old_name": before["Name"], "old_url": before["URL"]}
+        yield from _star_change(before, new, min_delta, min_pct)
+
+    for new in maybe_moved:
+        old_key = old_by_identity[_identity(new)]
+        if old_key in matched:
+            yield {"change": "added", **_summary(new)}
+            continue
+        matched.add(old_key)
+        before = old[old_key]
+        yield {"change": "renamed", **_summary(new), "old_name": before["Name"], "old_url": before["URL"]}
+        yield from _star_change(before, new, min_delta, min_pct)
+
+    for key, row in old.items():
+        if key not in matched:
+            yield {"change": "removed", **_summary(row)}
+
+
+def _star_change(before: dict, after: dict, min_delta: int, min_pct: float) -> Iterator[dict]:
+    old_stars, new_stars = _stars(before), _stars(after)
+    delta = new_stars - old_stars
+    pct = 100.0 * delta / max(old_stars, 1)
+    if abs(delta) >= min_delta and abs(pct) >= min_pct:
+        yield {"change": "stars", **_summary(after), "old_stars": old_stars,
+               "star_delta": delta, "star_pct": round(pct, 1)}
+
+
+def diff_snapshots(old_path: str, new_path: str, **thresholds) -> Iterator[dict]:
+    """diff_rows() over two snapshot files."""
+    return diff_rows(iter_snapshot_rows(old_path), iter_snapshot_rows(new_path), **thresholds)
+
+
+def format_change(change: dict) -> str:
+    """One human-readable line for a change record."""
+    kind = change["change"]
+    if kind == "added":
+        return f"+ {change['name']} ({change['stars']}⭐) {change['url']}"
+    if kind == "removed":
+        return f"- {change['name']} ({change['stars']}⭐) {change['url']}"
+    if kind == "renamed":
+        return f"~ {change['old_name']} -> {change['name']}  {change['old_url']} -> {change['url']}"
+    return (f"* {change['name']} {change['old_stars']} -> {change['stars']}⭐ "
+            f"({change['star_delta']:+d}, {change['star_pct']:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two snapshot CSVs")
+    parser.add_argument("old", nargs="?", help="older snapshot (default: second latest in snapshots/)")
+    parser.add_argument("new", nargs="?", help="newer snapshot (default: latest in snapshots/)")
+    parser.add_argument("--format", choices=("text", "jsonl"), default="text")
+    parser.add_argument("-o", "--output", help="write to this file instead of stdout")
+    parser.add_argument("--only", choices=CHANGE_TYPES, action="append", help="report only these change types")
+    parser.add_argument("--min-delta", type=int, default=100, help="minimum star change to report")
+    parser.add_argument("--min-pct", type=float, default=10.0, help="minimum star change in percent")
+    args = parser.parse_args()
+
+    if bool(args.old) != bool(args.new):
+        parser.error("give both OLD and NEW, or neither")
+    if args.old:
+        old_path, new_path = args.old, args.new
+    else:
+        snapshots = snapshot_utils.list_snapshots()
+        if len(snapshots) < 2:
+            print(f"❌ Need two snapshots in {snapshot_utils.SNAPSHOTS_DIR}", file=sys.stderr)
+            return 1
+        (_, old_path), (_, new_path) = snapshots[-2:]
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    counts = Counter()
+    try:
+        for change in diff_snapshots(old_path, new_path, min_delta=args.min_delta, min_pct=args.min_pct):
+            if args.only and change["change"] not in args.only:
+                continue
+            counts[change["change"]] += 1
+            if args.format == "jsonl":
+                out.write(json.dumps(change, ensure_ascii=False) + "\n")
+            else:
+                out.write(format_change(change) + "\n")
+    finally:
+        if args.output:
+            out.close()
+    summary = ", ".join(f"{counts[kind]} {kind}" for kind in CHANGE_TYPES)
+    print(f"📋 {old_path} -> {new_path}: {summary}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,65 @@
 """
 snapshot_utils.py – Shared helpers for managing dated snapshot CSV files.
 
-Snapshot files live in snapshots/ and are named snapshot-YYYY-MM-DD.csv.
+Snapshot files live in snapshots/ (or LOWCODE_SNAPSHOTS_DIR, e.g. a volume
+shared by several app replicas) and are named snapshot-YYYY-MM-DD.csv.
+
+When snapshots are refreshed out of band (take_snapshot.py --daemon) the
+directory also holds
+    .crawl.lock   held while a crawl runs, so replicas never crawl at once
+    .reload       rewritten after every refresh; apps that see it change reload
+
+The marker records the daemon's refresh interval and expires after
+MARKER_TTL_INTERVALS intervals without a refresh, so apps go back to
+crawling GitHub themselves once no daemon is keeping the snapshots fresh.
 """
 
 from __future__ import annotations
 
 import base64
+import json
 import os
 import re
-import requests
-import pandas as pd
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
-SNAPSHOTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots")
+import perf_metrics
+
+SNAPSHOTS_DIR = os.environ.get(
+    "LOWCODE_SNAPSHOTS_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots")
+)
+# Override to point every GitHub call at a local stand-in (see github_stub_server.py)
+GITHUB_API_BASE = os.environ.get("GITHUB_API_BASE", "https://api.github.com").rstrip("/")
 _FILENAME_RE = re.compile(r"^snapshot-(\d{4}-\d{2}-\d{2})\.csv$")
+CRAWL_LOCK = ".crawl.lock"
+RELOAD_MARKER = ".reload"
+MARKER_TTL_INTERVALS = 3
+
+
+def snapshot_date(path: str) -> datetime.date | None:
+    """Return the date in a snapshot-YYYY-MM-DD.csv file name, or None for other files."""
+    m = _FILENAME_RE.match(os.path.basename(path))
+    return datetime.strptime(m.group(1), "%Y-%m-%d").date() if m else None
+
+
+def list_snapshots(directory: str | None = None) -> list[tuple[datetime.date, str]]:
+    """Return (date, path) of every snapshot file in *directory* (default SNAPSHOTS_DIR), oldest first."""
+    directory = directory or SNAPSHOTS_DIR
+    if not os.path.isdir(directory):
+        return []
+    snapshots = []
+    for fname in os.listdir(directory):
+        snap_date = snapshot_date(fname)
+        if snap_date:
+            snapshots.append((snap_date, os.path.join(directory, fname)))
+    return sorted(snapshots)
 
 
 def get_latest_snapshot_date() -> datetime.date | None:
     """Return the date of the most recent snapshot file, or None if none exist."""
-    if not os.path.isdir(SNAPSHOTS_DIR):
-        return None
-    dates = []
-    for fname in os.listdir(SNAPSHOTS_DIR):
-        m = _FILENAME_RE.match(fname)
-        if m:
-            dates.append(datetime.strptime(m.group(1), "%Y-%m-%d").date())
-    return max(dates) if dates else None
+    snapshots = list_snapshots()
+    return snapshots[-1][0] if snapshots else None
 
 
 def should_take_snapshot(months: int = 3) -> bool:
@@ -38,31 +71,176 @@ def should_take_snapshot(months: int = 3) -> bool:
     return latest < cutoff
 
 
+# Column order of every snapshot CSV (same as the dashboard's repository table).
+SNAPSHOT_COLUMNS = [
+    "Name", "Stars⭐", "Last Updated", "First Commit", "URL", "Forks", "Issues",
+    "Language", "License", "Description", "Topics",
+]
+# Optional trailing columns (snapshot column -> repo key), written only when the repos carry
+# the metrics fetched by graphql_enrichment.py. Older snapshots simply don't have them.
+METRIC_COLUMNS = {
+    "Releases": "release_count",
+    "Latest Release": "latest_release",
+    "Contributors": "contributor_count",
+    "Commits (1y)": "commits_last_year",
+}
+# Optional last column: the search profiles a repo belongs to (see search_profiles.py), written
+# when the repos carry a membership. Snapshots without it belong to the default profile.
+PROFILES_COLUMN = "Profiles"
+
+
+def repo_to_row(repo: dict) -> dict:
+    """Map one repo (GitHub API format) to a snapshot CSV row."""
+    row = {
+        "Name": repo["name"],
+        "Stars⭐": repo["stargazers_count"],
+        "Last Updated": repo["pushed_at"].split("T")[0],
+        "First Commit": repo["created_at"].split("T")[0],
+        "URL": repo["html_url"],
+        "Forks": repo["forks"],
+        "Issues": repo["open_issues"],
+        "Language": repo.get("language") or "No language",
+        "License": repo["license"]["name"] if repo.get("license") else "No license",
+        "Description": repo.get("description") or "No description",
+        "Topics": ",".join(repo.get("topics") or []),
+    }
+    for column, key in METRIC_COLUMNS.items():
+        if key in repo:
+            value = repo[key]
+            if key == "latest_release" and value:
+                value = value.split("T")[0]
+            row[column] = "" if value is None else value
+    if "profiles" in repo:
+        row[PROFILES_COLUMN] = ",".join(repo["profiles"])
+    return row
+
+
+@perf_metrics.timed("snapshot.repos_to_csv")
 def repos_to_csv(repos: list[dict], path: str) -> int:
     """Write *repos* (GitHub API format) to *path* as a snapshot CSV.
 
     Returns the number of rows written.
     """
-    rows = []
-    for repo in repos:
-        rows.append({
-            "Name": repo["name"],
-            "Stars⭐": repo["stargazers_count"],
-            "Last Updated": repo["pushed_at"].split("T")[0],
-            "First Commit": repo["created_at"].split("T")[0],
-            "URL": repo["html_url"],
-            "Forks": repo["forks"],
-            "Issues": repo["open_issues"],
-            "Language": repo.get("language") or "No language",
-            "License": repo["license"]["name"] if repo.get("license") else "No license",
-            "Description": repo.get("description") or "No description",
-            "Topics": ",".join(repo.get("topics") or []),
-        })
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    pd.DataFrame(rows).to_csv(path, index=False, encoding="utf-8")
+    import pandas as pd
+
+    rows = [repo_to_row(repo) for repo in repos]
+    extra_columns = [c for c in [*METRIC_COLUMNS, PROFILES_COLUMN] if any(c in row for row in rows)]
+    for row in rows:
+        for column in extra_columns:
+            row.setdefault(column, "")  # blank, not NaN: a NaN would turn the whole column into floats
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Temp file + rename: readers (other replicas, data_api.py) never see a half-written snapshot.
+    # The temp name doesn't match _FILENAME_RE, so list_snapshots() ignores it meanwhile.
+    tmp = f"{path}.{os.getpid()}.tmp"
+    pd.DataFrame(rows, columns=SNAPSHOT_COLUMNS + extra_columns).to_csv(tmp, index=False, encoding="utf-8")
+    os.replace(tmp, path)
     return len(rows)
 
 
+@perf_metrics.timed("snapshot.load_snapshot_repos")
+def load_snapshot_repos(path: str) -> list[dict]:
+    """Read the snapshot CSV at *path* back into GitHub API format (inverse of repos_to_csv)."""
+    import pandas as pd
+
+    # keep_default_na=False: empty cells stay "" and repo names such as "null" or "NA"
+    # stay strings instead of turning into NaN floats.
+    df = pd.read_csv(path, encoding="utf-8", keep_default_na=False,
+                     dtype={col: str for col in [*SNAPSHOT_COLUMNS, *METRIC_COLUMNS, PROFILES_COLUMN]
+                            if col not in ("Stars⭐", "Forks", "Issues")})
+    repos = []
+    # Column-wise tolist() + zip is an order of magnitude faster than DataFrame.iterrows().
+    for (name, stars, pushed, created, url, forks, issues,
+         language, license_name, description, topics) in zip(*(df[c].tolist() for c in SNAPSHOT_COLUMNS)):
+        repos.append({
+            "name": name,
+            "stargazers_count": stars,
+            "pushed_at": pushed + "T00:00:00Z",
+            "created_at": created + "T00:00:00Z",
+            "html_url": url,
+            "forks": forks,
+            "open_issues": issues,
+            "language": language if language and language != "No language" else None,
+            "license": {"name": license_name} if license_name and license_name != "No license" else None,
+            "description": description if description and description != "No description" else None,
+            "topics": topics.split(",") if topics else [],
+        })
+    for column, key in METRIC_COLUMNS.items():
+        if column not in df.columns:
+            continue
+        for repo, value in zip(repos, df[column].tolist()):
+            if key == "latest_release":
+                repo[key] = value + "T00:00:00Z" if value else None
+            else:
+                repo[key] = int(value) if value else None
+    if PROFILES_COLUMN in df.columns:
+        for repo, value in zip(repos, df[PROFILES_COLUMN].tolist()):
+            repo["profiles"] = value.split(",") if value else []
+    return repos
+
+
+@contextmanager
+def crawl_lock(directory: str | None = None):
+    """Try to take the crawl lock of *directory* (default SNAPSHOTS_DIR) without blocking.
+
+    Yields True while this process holds it, False if another process does. The lock is
+    an OS file lock, so it is released even if the holder dies.
+    """
+    directory = directory or SNAPSHOTS_DIR
+    os.makedirs(directory, exist_ok=True)
+    f = open(os.path.join(directory, CRAWL_LOCK), "a+")
+    try:
+        try:
+            if os.name == "nt":
+                import msvcrt
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+        yield True  # closing the file below releases the lock
+    finally:
+        f.close()
+
+
+def signal_reload(snapshot_path: str, directory: str | None = None, interval: float = 24 * 3600) -> str:
+    """Announce a new snapshot in *directory* (default SNAPSHOTS_DIR) to running apps; returns the marker path.
+
+    *interval* is the refresh interval (seconds) of the daemon writing the marker.
+    """
+    directory = directory or SNAPSHOTS_DIR
+    path = os.path.join(directory, RELOAD_MARKER)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"snapshot": os.path.basename(snapshot_path),
+                   "written_at": datetime.now().isoformat(timespec="seconds"),
+                   "interval": interval}, f)
+    os.replace(tmp, path)
+    return path
+
+
+def reload_marker(directory: str | None = None) -> tuple[float, str] | None:
+    """(mtime, snapshot path) of the last signal_reload() in *directory*, or None if there is none.
+
+    Also None when the announced snapshot has been removed since, and when the marker is
+    stale: no refresh within MARKER_TTL_INTERVALS of its interval (or a marker without one).
+    """
+    directory = directory or SNAPSHOTS_DIR
+    path = os.path.join(directory, RELOAD_MARKER)
+    try:
+        mtime = os.path.getmtime(path)
+        with open(path, encoding="utf-8") as f:
+            marker = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if "interval" not in marker or time.time() - mtime > MARKER_TTL_INTERVALS * marker["interval"]:
+        return None
+    path = os.path.join(directory, marker["snapshot"])
+    return (mtime, path) if os.path.exists(path) else None
+
+
+@perf_metrics.timed("snapshot.auto_snapshot")
 def auto_snapshot(repos: list[dict]) -> str | None:
     """Save a new snapshot when no snapshot exists in the last 3 months.
 
@@ -78,6 +256,7 @@ def auto_snapshot(repos: list[dict]) -> str | None:
     return path
 
 
+@perf_metrics.timed("snapshot.commit_snapshot_to_github")
 def commit_snapshot_to_github(
     local_path: str,
     token: str,
@@ -89,9 +268,11 @@ def commit_snapshot_to_github(
     Uses a personal access token with 'contents: write' permission.
     Returns (success, error_detail_or_None).
     """
+    import requests
+
     filename = os.path.basename(local_path)
     repo_path = f"snapshots/{filename}"
-    url = f"https://api.github.com/repos/{repo}/contents/{repo_path}"
+    url = f"{GITHUB_API_BASE}/repos/{repo}/contents/{repo_path}"
     headers = {
         "Authorization": f"Bearer {token}",
         "Accept": "application/vnd.github+json",
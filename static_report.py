@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+static_report.py – Pre-rendered report of the dashboard's default view.
+
+Most visitors never touch the filters, so the default view (Minimum Stars 50,
+Last Commit within the last year, no search) is computed once when a snapshot
+is taken and saved as a static bundle:
+
+    report/report.json   table rows, aggregates, category classifications and
+                         plotly figure JSON
+    report/index.html    the same content as a standalone page (plotly.js from
+                         its CDN), publishable as a static site
+
+(LOWCODE_REPORT_DIR moves report/, e.g. onto a volume shared by several replicas.)
+
+app.py serves report.json for the default filter state when the report was
+built from exactly the data the session loaded (see view_digest()); any other
+state, or a report built from other data, is computed live as before.
+
+Written by take_snapshot.py and after the app's auto-snapshot. By hand:
+
+    python static_report.py                                  # latest snapshot in snapshots/
+    python static_report.py --snapshot snapshots/snapshot-2026-04-19.csv --output site/
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+import dashboard_data
+import dashboard_figures
+import snapshot_utils
+from keyword_analysis import KEYWORD_SETS, analysis_rows, categorize_repos
+
+REPORT_DIR = os.environ.get("LOWCODE_REPORT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "report"))
+REPORT_JSON = os.path.join(REPORT_DIR, "report.json")
+
+# Must match the slider defaults in app.py
+DEFAULT_MIN_STARS = 50
+DEFAULT_WINDOW_DAYS = 365
+
+# Every field the default view reads: same digest => same table, stats and classifications
+_DIGEST_FIELDS = ("name", "html_url", "stargazers_count", "forks", "open_issues", "pushed_at",
+                  "created_at", "language", "license", "description", "topics", "readme_excerpt")
+
+
+def default_view(repos: list[dict], today: datetime | None = None) -> list[dict]:
+    """The repos shown in the dashboard's default filter state on *today*."""
+    today = today or datetime.today()
+    return dashboard_data.filter_repos(repos, DEFAULT_MIN_STARS, today - timedelta(days=DEFAULT_WINDOW_DAYS))
+
+
+def view_digest(view_repos: list[dict]) -> str:
+    """Content digest of a list of repos, over the fields the dashboard displays or classifies."""
+    digest = hashlib.blake2b(digest_size=16)
+    for repo in view_repos:
+        digest.update(json.dumps([repo.get(f) for f in _DIGEST_FIELDS], default=str).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _figure_json(fig) -> dict:
+    return json.loads(fig.to_json())
+
+
+def build_report(repos: list[dict], today: datetime | None = None, source: str | None = None) -> dict:
+    """Everything the default view shows, as plain JSON-serialisable data."""
+    import quantile_sketch
+
+    today = today or datetime.today()
+    view = default_view(repos, today)
+    year_counts = dashboard_data.first_commit_year_counts(view)
+    language_counts = dashboard_data.language_counts(view)
+    star_counts = dashboard_data.star_counts(view)
+    star_stats = quantile_sketch.star_box_stats(star_counts)
+
+    analysis = {}
+    for category in KEYWORD_SETS:
+        matching_repos, n_analyzed = categorize_repos(view, category)
+        analysis[category] = {
+            "n_analyzed": n_analyzed,
+            "rows": analysis_rows(matching_repos),
+            "figure": _figure_json(dashboard_figures.category_pie(category, len(matching_repos), n_analyzed)),
+        }
+
+    return {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "source": source,
+            "digest": view_digest(view),
+            "min_stars": DEFAULT_MIN_STARS,
+            "min_date": (today - timedelta(days=DEFAULT_WINDOW_DAYS)).strftime("%Y-%m-%d"),
+            "repos": len(view),
+        },
+        "table": dashboard_data.table_rows(view),
+        "stats": {
+            "first_commit_years": {str(year): n for year, n in sorted(year_counts.items())},
+            "languages": dict(language_counts.most_common()),
+            "stars": star_stats,
+            # Mergeable with the digests of other reports / snapshots (quantile_sketch.TDigest.from_dict)
+            "star_digest": quantile_sketch.TDigest.of(star_counts).to_dict(),
+        },
+        "figures": {
+            "first_commit_years": _figure_json(dashboard_figures.first_commit_year_chart(year_counts)),
+            "languages": _figure_json(dashboard_figures.language_bar_chart(language_counts)),
+            "stars": _figure_json(dashboard_figures.star_box_plot(star_stats)),
+            **{f"stars_vs_{axis}": _figure_json(dashboard_figures.stars_scatter(
+                dashboard_data.scatter_points(view, today, axis), axis))
+               for axis in dashboard_data.SCATTER_AXES},
+        },
+        "analysis": analysis,
+    }
+
+
+def render_html(report: dict) -> str:
+    """Standalone HTML page for *report*."""
+    import plotly.io as pio
+
+    def figure(fig_json, first=False):
+        return pio.to_html(pio.from_json(json.dumps(fig_json)), full_html=False,
+                           include_plotlyjs="cdn" if first else False)
+
+    meta = report["meta"]
+    columns = list(report["table"][0]) if report["table"] else []
+    rows = "\n".join(
+        "<tr>" + "".join(
+            f'<td><a href="{html.escape(row[c])}">{html.escape(row[c])}</a></td>' if c == "URL"
+            else f"<td>{html.escape(', '.join(row[c]) if isinstance(row[c], list) else str(row[c]))}</td>"
+            for c in columns
+        ) + "</tr>"
+        for row in report["table"]
+    )
+    parts = [
+        "<!DOCTYPE html>",
+        '<html lang="en"><head><meta charset="utf-8">',
+        "<title>Dashboard of Open-Source Low-Code Tools in GitHub</title>",
+        "<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;font-size:.85em}"
+        "td,th{border:1px solid #ddd;padding:4px;vertical-align:top}th{background:#f4f4f4}</style>",
+        "</head><body>",
+        "<h1>Dashboard of Open-Source Low-Code Tools in GitHub</h1>",
+        f"<p>{meta['repos']} repositories with at least {meta['min_stars']} stars and a commit since "
+        f"{meta['min_date']}. Generated {meta['generated_at']}"
+        + (f" from {html.escape(os.path.basename(meta['source']))}" if meta.get("source") else "") + ".</p>",
+        "<h2>Repository Table</h2>",
+        "<table><thead><tr>" + "".join(f"<th>{html.escape(c)}</th>" for c in columns) + "</tr></thead>",
+        f"<tbody>{rows}</tbody></table>",
+        "<h2>Global Statistics</h2>",
+        figure(report["figures"]["first_commit_years"], first=True),
+        figure(report["figures"]["languages"]),
+        figure(report["figures"]["stars"]),
+        *(figure(report["figures"][f"stars_vs_{axis}"]) for axis in dashboard_data.SCATTER_AXES),
+        "<h2>Repository Analysis</h2>",
+    ]
+    for category, result in report["analysis"].items():
+        parts.append(f"<h3>Analysis for '{html.escape(category)}'</h3>")
+        parts.append(figure(result["figure"]))
+        if result["rows"]:
+            parts.append("<table><thead><tr><th>Name</th><th>Description</th><th>Stars</th></tr></thead><tbody>")
+            parts += [f"<tr><td>{html.escape(r['Name'])}</td><td>{html.escape(r['Description'] or '')}</td>"
+                      f"<td>{r['Stars']}</td></tr>" for r in result["rows"]]
+            parts.append("</tbody></table>")
+        else:
+            parts.append(f"<p>No repositories found mentioning '{html.escape(category)}'</p>")
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def _write_atomic(path: str, text: str):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def write_bundle(report: dict, out_dir: str | None = None) -> str:
+    """Write report.json and index.html to *out_dir* (default REPORT_DIR); returns the report.json path."""
+    out_dir = out_dir or REPORT_DIR
+    os.makedirs(out_dir, exist_ok=True)
+    _write_atomic(os.path.join(out_dir, "index.html"), render_html(report))
+    # report.json last: the app only picks up a bundle once its JSON is in place
+    json_path = os.path.join(out_dir, "report.json")
+    _write_atomic(json_path, json.dumps(report, ensure_ascii=False))
+    return json_path
+
+
+def generate_report(repos: list[dict], out_dir: str | None = None, source: str | None = None) -> str:
+    """build_report() + write_bundle()."""
+    return write_bundle(build_report(repos, source=source), out_dir)
+
+
+@lru_cache(maxsize=2)
+def _load_report(path: str, mtime: float) -> dict:
+    import plotly.io as pio
+
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+    # Parse figures once per report file instead of on every page view
+    report["figures"] = {name: pio.from_json(json.dumps(fig)) for name, fig in report["figures"].items()}
+    for result in report["analysis"].values():
+        result["figure"] = pio.from_json(json.dumps(result["figure"]))
+    return report
+
+
+def load_report_for(digest: str, path: str | None = None) -> dict | None:
+    """The report at *path* (default REPORT_JSON) if it was built from data with *digest*, else None.
+
+    The parsed report is shared between callers; treat it as read-only.
+    """
+    path = path or REPORT_JSON
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    report = _load_report(path, mtime)
+    return report if report["meta"]["digest"] == digest else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render the dashboard's default view")
+    parser.add_argument("--snapshot", help="snapshot CSV (default: latest in snapshots/)")
+    parser.add_argument("--output", help="bundle directory (default: report/)")
+    args = parser.parse_args()
+
+    path = args.snapshot
+    if path is None:
+        snapshots = snapshot_utils.list_snapshots()
+        if not snapshots:
+            print(f"❌ No snapshots in {snapshot_utils.SNAPSHOTS_DIR}", file=sys.stderr)
+            return 1
+        path = snapshots[-1][1]
+    report = build_report(snapshot_utils.load_snapshot_repos(path), source=path)
+    json_path = write_bundle(report, args.output)
+    print(f"Report of {report['meta']['repos']} repos written to {os.path.dirname(json_path)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+synthetic_repos.py – Generate synthetic GitHub Search API items at any scale.
+
+Used by the benchmark suite (run_benchmarks.py) to time the dashboard's hot
+paths on 1k–1M repositories. Languages, licenses, description words and topics
+are sampled from the bundled snapshots so the text looks like real low-code
+repos (same keyword hit rates for the analysis categories); star counts follow
+a heavy-tailed Pareto distribution starting at the 50-star search threshold.
+
+Usage:
+    python synthetic_repos.py 100000 /tmp/synthetic-100k.csv
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import re
+import sys
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+import snapshot_utils
+
+_WORD_RE = re.compile(r"[\w'-]+")
+
+# Extra topics per repo drawn from a long tail ("topic-<n>") so the topic vocabulary
+# keeps growing with the dataset size like it does in a real crawl.
+_TAIL_TOPIC_RATE = 0.15
+
+
+@lru_cache(maxsize=1)
+def _sample_pools() -> dict:
+    """Frequency-weighted pools built from every bundled snapshot."""
+    pools = {"language": [], "license": [], "word": [], "topic": [],
+             "n_words": [], "n_topics": []}
+    for _date, path in snapshot_utils.list_snapshots():
+        for repo in snapshot_utils.load_snapshot_repos(path):
+            words = _WORD_RE.findall(repo["description"] or "")
+            pools["language"].append(repo["language"])
+            pools["license"].append(repo["license"]["name"] if repo["license"] else None)
+            pools["word"].extend(words)
+            pools["topic"].extend(repo["topics"])
+            pools["n_words"].append(len(words))
+            pools["n_topics"].append(len(repo["topics"]))
+    return pools
+
+
+def generate_repos(n: int, seed: int = 0, today: datetime | None = None) -> list[dict]:
+    """Return *n* synthetic repos in GitHub Search API format (deterministic for a given *seed*)."""
+    rng = random.Random(seed)
+    pools = _sample_pools()
+    today = today or datetime.now()
+    name_words = [w.lower() for w in pools["word"] if w.isascii() and w.isalpha() and len(w) > 2] or ["tool"]
+
+    languages = rng.choices(pools["language"], k=n)
+    licenses = rng.choices(pools["license"], k=n)
+    n_words = rng.choices(pools["n_words"], k=n)
+    n_topics = rng.choices(pools["n_topics"], k=n)
+
+    repos = []
+    for i in range(n):
+        # ~10% pushed more than a year ago so the date filter has something to drop
+        pushed = today - timedelta(days=rng.randint(0, 400))
+        created = pushed - timedelta(days=rng.randint(0, 15 * 365))
+        stars = min(int(50 * rng.paretovariate(1.1)), 500_000)
+        owner = f"org{rng.randint(0, max(n // 3, 1))}"
+        name = f"{rng.choice(name_words)}-{rng.choice(name_words)}-{i}"
+        description = " ".join(rng.choices(pools["word"], k=n_words[i]))[:350] or None
+        topics = list(dict.fromkeys(rng.choices(pools["topic"], k=n_topics[i]))) if n_topics[i] else []
+        if rng.random() < _TAIL_TOPIC_RATE:
+            topics.append(f"topic-{int(rng.paretovariate(0.8))}")
+        license_name = licenses[i]
+        repos.append({
+            "id": i + 1,
+            "name": name,
+            "full_name": f"{owner}/{name}",
+            "owner": {"login": owner},
+            "stargazers_count": stars,
+            "pushed_at": pushed.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "created_at": created.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "html_url": f"https://github.com/{owner}/{name}",
+            "forks": int(stars * rng.lognormvariate(-2.0, 0.8)),
+            "open_issues": int(stars * rng.lognormvariate(-4.5, 1.0)),
+            "language": languages[i],
+            "license": {"name": license_name} if license_name else None,
+            "description": description,
+            "topics": topics,
+        })
+    # Search API order: most stars first
+    repos.sort(key=lambda r: r["stargazers_count"], reverse=True)
+    return repos
+
+
+def main():
+    if len(sys.argv) != 3:
+        print("Usage: python synthetic_repos.py <count> <output.csv>")
+        sys.exit(1)
+    count = snapshot_utils.repos_to_csv(generate_repos(int(sys.argv[1])), os.path.abspath(sys.argv[2]))
+    print(f"Wrote {count} synthetic repos to {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+    main()
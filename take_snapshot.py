@@ -2,98 +2,262 @@
 take_snapshot.py – Fetch the current list of low-code tools from GitHub and
 save it as a dated snapshot CSV in the snapshots/ folder.
 
+What is crawled is declared in search_profiles.toml: the queries of every
+profile are crawled concurrently under one rate-limit budget and each repo is
+stored once, with the profiles it belongs to in the Profiles column (see
+search_profiles.py).
+
 Usage:
     python take_snapshot.py
+    python take_snapshot.py --daemon --interval-hours 24
 
 The output file is named snapshot-YYYY-MM-DD.csv using today's date and is
-written to the snapshots/ directory. The CSV format matches the existing
-snapshot files (same columns, same ordering).
+written to the snapshots/ directory (LOWCODE_SNAPSHOTS_DIR). The CSV format
+matches the existing snapshot files (same columns, same ordering); with
+LOWCODE_GRAPHQL_ENRICHMENT=1 release / contributor / commit metrics are added
+as extra columns (see graphql_enrichment.py). The pre-rendered default view
+(report/, see static_report.py) is regenerated from the new snapshot.
+
+Every fetched search page is checkpointed to a crawl journal (see
+crawl_journal.py). If the crawl stops early (rate limit, HTTP error) no
+snapshot is written; rerunning resumes after the last good page instead of
+spending the quota on the same pages again.
+
+Daemon mode keeps running and refreshes today's snapshot every interval, so
+crawling happens outside the app's request path. Point every app replica and
+daemon at the same LOWCODE_SNAPSHOTS_DIR: files are written atomically, a file
+lock lets only one daemon crawl at a time, and after each refresh the reload
+marker tells running apps to load the new snapshot (see snapshot_utils.py).
 """
 
+import argparse
 import os
+import signal
 import sys
+import threading
+import time
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime
+import crawl_journal
+import search_profiles
 import snapshot_utils
+from github_rate_limit import RateLimitExhausted
+
+GITHUB_API_URL = f"{snapshot_utils.GITHUB_API_BASE}/search/repositories"
+# GitHub only serves the first 1000 results of any search
+SEARCH_RESULT_CAP = 1000
+# Daemon mode: earliest retry after a failed or empty crawl
+RETRY_SECONDS = 15 * 60
+
+
+class IncompleteCrawl(Exception):
+    """The crawl stopped before its last page; the snapshot would be truncated."""
+
+    def __init__(self, stats):
+        super().__init__(f"crawl stopped at page {stats['failed_page']}: {stats['error']}")
+        self.stats = stats
+
 
-GITHUB_API_URL = "https://api.github.com/search/repositories"
-
-EXCLUDED_REPOS = {
-    "JeecgBoot", "supervision", "amis", "APIJSON", "awesome-lowcode", "LoRA", "activepieces",
-    "gop", "pycaret", "viztracer", "joint", "mometa", "asmjit", "NullAway",
-    "self-hosted-ai-starter-kit", "sparrow", "smart-admin", "tracecat", "dooringx",
-    "Genie.jl", "instill-core", "metarank", "dataprep", "hyperlight", "go-streams",
-    "dashpress", "lowcode-demo", "diboot", "steedos-platform", "opsli-boot",
-    "PiML-Toolbox", "marsview", "openDataV",
-    "Awesome-CVPR2024-CVPR2021-CVPR2020-Low-Level-Vision", "dart_native",
-    "low-level-programming", "vue-component-creater-ui", "ovine", "vlife", "beelzebub",
-    "mtbird", "Awesome-CVPR2024-Low-Level-Vision", "create-chart", "crusher",
-    "yuzi-generator", "pc-Dooring", "citrus", "Conduit", "react-admin-firebase",
-    "apex", "fire-hpp", "awesome-lowcode", "karamel", "flowpipe", "fast-trade", "pd",
-    "MetaLowCode", "vue-low-code", "css-text-portrait-builder", "awesome-low-code",
-    "langwatch", "web-builder", "awesome-nocode-lowcode", "LLFlow", "AS-Editor",
-    "mfish-nocode", "naas", "Awesome-ECCV2024-ECCV2020-Low-Level-Vision", "dataCompare",
-    "AIVoiceChat", "illa", "praxis-ide", "low-level-design", "HuggingFists", "dagr",
-    "pddon-win", "all-classification-templetes-for-ML", "node-red-dashboard", "Palu"
-    "Liuma-platform", "crudapi-admin-web", "Awesome-ICCV2023-Low-Level-Vision", "pocketblocks"
-    "plugins", "LLFormer", "vue-admin", "Low-Code", "FTC-Skystone-Dark-Angels-Romania-2020",
-    "WrldTmpl8", "daas-start-kit", "Meta3D", "css-selector-tool", "corebos", "wave-apps",
-    "self-hosted", "Automation-workflow", "banglanmt", "Nalu", "no-code-architects-toolkit",
-    "MasteringMCU2", "Liuma-engine", "lowcode-tools", "Diff-Plugin", "mfish-nocode-view",
-    "backroad", "zcbor", "powerfx-samples", "MemoryNet", "igop", "underTheHoodOfExecutables",
-    "StringReloads", "lowcode-b", "EigenTrajectory", "pluto", "pixiebrix-extension", "dozer",
-    "vite-vue3-lowcode",
-    "qLDPC", "Visio", "Hack-SQL", "cow-Low-code", "LoRA-Pro", "OTE-GAN", "opsli-ui", "three-editor",
-    "lowcode-code-generator-demo", "QuadPrior", "UIGO", "SoRA", "grid-form", "CcView", "verus",
-    "fastgraphml", "arcane.cpp", "lowcode-engine-ext", "Liuma-platform", "lowcode-plugins", "turbo",
-    "DegAE_DegradationAutoencoder", "www-project-top-10-low-code-no-code-security-risks", "lowcode-materials",
-    "Vibration-Based-Fault-Diagnosis-with-Low-Delay", "alignment-attribution-code", "VideoUIKit-Web-React",
-    "ReGitLint", "pandas-gpt", "yao-knowledge", "snac", "relora", "mettle", "Tenon",
-    "noncode-projects-2024", "EvLight",
-}
-
-
-def fetch_repos(query="low-code", sort="stars", order="desc", per_page=100, max_pages=10):
-    cutoff = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
-    full_query = f"{query} stars:>=50 pushed:>={cutoff}"
-    all_repos = []
+def search_query(query=None):
+    """*query* (default: the default profile's first query) with the default profile's qualifiers."""
+    profile = search_profiles.load_profiles()[0]
+    return profile.full_query(query or profile.queries[0])
+
+
+def crawl(full_query, sort="stars", order="desc", per_page=100, max_pages=10, journal=None, gate=None):
+    """Walk the search pages of *full_query*. Returns (repos, stats).
+
+    Pages already in *journal* (a crawl_journal.CrawlJournal) are not requested again, and
+    every newly fetched page is recorded there. Requests wait on *gate* (a
+    github_rate_limit.RateLimitGate shared by concurrent crawls) when given. The crawl stops
+    at the first failing page; stats["complete"] is True only if it reached the last page.
+    """
+    stats = {"pages": 0, "resumed": 0, "repos": 0, "duplicates": 0, "total_count": None,
+             "failed_page": None, "error": None, "complete": False}
+    all_repos, seen = [], set()
 
     for page in range(1, max_pages + 1):
-        params = {"q": full_query, "sort": sort, "order": order,
-                  "per_page": per_page, "page": page}
-        try:
-            response = requests.get(GITHUB_API_URL, params=params, timeout=15)
-            response.raise_for_status()
-            items = response.json().get("items", [])
-            if not items:
+        entry = journal.page(page) if journal else None
+        from_journal = entry is not None
+        if from_journal:
+            stats["resumed"] += 1
+        else:
+            params = {"q": full_query, "sort": sort, "order": order,
+                      "per_page": per_page, "page": page}
+            try:
+                if gate:
+                    gate.wait()
+                response = requests.get(GITHUB_API_URL, params=params, timeout=15)
+                if gate:
+                    gate.update(response)
+                response.raise_for_status()
+                body = response.json()
+            except (requests.exceptions.RequestException, RateLimitExhausted) as e:
+                print(f"  ERROR on page {page}: {e}", file=sys.stderr)
+                stats["failed_page"], stats["error"] = page, str(e)
+                break
+            if body.get("incomplete_results"):
+                # GitHub timed out part of the search: don't checkpoint a page with holes
+                print(f"  ERROR on page {page}: GitHub reported incomplete results", file=sys.stderr)
+                stats["failed_page"], stats["error"] = page, "incomplete_results"
                 break
-            all_repos.extend(items)
-            print(f"  page {page}: +{len(items)} repos (total {len(all_repos)})")
-        except requests.exceptions.RequestException as e:
-            print(f"  ERROR on page {page}: {e}", file=sys.stderr)
+            entry = {"page": page, "total_count": body.get("total_count", 0), "items": body.get("items", [])}
+            if journal:
+                journal.record(page, entry["total_count"], entry["items"])
+            stats["pages"] += 1
+        items = entry["items"]
+        stats["total_count"] = entry["total_count"]
+        for item in items:
+            # Rankings can shift between a crawl and its resumption: keep each repo once
+            key = item.get("id", item["html_url"])
+            if key in seen:
+                stats["duplicates"] += 1
+                continue
+            seen.add(key)
+            all_repos.append(item)
+        print(f"  page {page}: +{len(items)} repos (total {len(all_repos)})" + (" [journal]" if from_journal else ""))
+        if len(items) < per_page or page * per_page >= min(entry["total_count"], SEARCH_RESULT_CAP):
             break
 
-    return all_repos
+    stats["repos"] = len(all_repos)
+    stats["complete"] = stats["failed_page"] is None
+    return all_repos, stats
 
 
-def main():
+def fetch_repos(query=None, sort="stars", order="desc", per_page=100, max_pages=10):
+    """Repos of one search crawl, without checkpoints (pages up to the first error)."""
+    return crawl(search_query(query), sort, order, per_page, max_pages)[0]
+
+
+def format_crawl_stats(stats):
+    expected = "?" if stats["total_count"] is None else min(stats["total_count"], SEARCH_RESULT_CAP)
+    line = (f"Crawl {'complete' if stats['complete'] else 'INCOMPLETE'}: {stats['repos']} of {expected} repos, "
+            f"{stats['pages']} pages fetched, {stats['resumed']} resumed from the journal")
+    if stats["duplicates"]:
+        line += f", {stats['duplicates']} duplicates dropped"
+    if stats["failed_page"]:
+        line += f"; stopped at page {stats['failed_page']} ({stats['error']})"
+    return line
+
+
+def take_snapshot(directory=None, overwrite=False, journal_dir=None):
+    """Crawl and write today's snapshot and the static report.
+
+    Returns the snapshot path, or None if nothing was written (today's file exists and
+    *overwrite* is False, or the crawl returned no repos). Raises IncompleteCrawl rather
+    than write a truncated snapshot; the fetched pages stay in the crawl journal
+    (*journal_dir*, default crawl_journal.JOURNAL_DIR) and a rerun resumes after them.
+    """
+    directory = directory or snapshot_utils.SNAPSHOTS_DIR
     today = datetime.now().strftime("%Y-%m-%d")
-    output_path = os.path.join(snapshot_utils.SNAPSHOTS_DIR, f"snapshot-{today}.csv")
+    output_path = os.path.join(directory, f"snapshot-{today}.csv")
 
-    if os.path.exists(output_path):
+    if os.path.exists(output_path) and not overwrite:
         print(f"Snapshot for today already exists: {output_path}")
         print("Delete it first if you want to regenerate.")
-        sys.exit(0)
+        return None
 
     print("Fetching repos from GitHub API...")
-    repos = fetch_repos()
-    print(f"Fetched {len(repos)} repos total")
+    crawl_journal.prune(journal_dir)
+    profiles = search_profiles.load_profiles()
+    journals = []
+
+    def crawl_query(full_query, gate):
+        # One journal per search: each resumes on its own
+        journal = crawl_journal.CrawlJournal(
+            {"q": full_query, "sort": "stars", "order": "desc", "per_page": 100}, journal_dir)
+        journals.append(journal)
+        return crawl(full_query, journal=journal, gate=gate)
 
-    filtered = [r for r in repos if r["name"] not in EXCLUDED_REPOS]
+    filtered, crawls = search_profiles.crawl_profiles(profiles, crawl_query)
+    for full_query, stats in crawls.items():
+        print(f"{full_query}\n  {format_crawl_stats(stats)}")
+    incomplete = [stats for stats in crawls.values() if not stats["complete"]]
+    if incomplete:
+        raise IncompleteCrawl(incomplete[0])
+    if not filtered:
+        print("Nothing fetched; keeping the previous snapshot", file=sys.stderr)
+        return None
+
+    import graphql_enrichment
+    if graphql_enrichment.ENABLED:
+        stats = graphql_enrichment.enrich_metrics(filtered, token=os.environ.get("GITHUB_TOKEN"))
+        print("GraphQL metrics: " + ", ".join(f"{n} {outcome}" for outcome, n in sorted(stats.items())))
     count = snapshot_utils.repos_to_csv(filtered, output_path)
-    print(f"After exclusions: {count} repos")
+    print(f"After exclusions: {count} repos (" + ", ".join(
+        f"{profile.name} {len(search_profiles.members(filtered, profile.name))}" for profile in profiles) + ")")
     print(f"Snapshot saved: {output_path}")
 
+    # Pre-render the default view from the saved file, i.e. exactly what a snapshot-backed app session
+    # loads (the default profile's repos)
+    import static_report
+    saved = search_profiles.apply_profiles(snapshot_utils.load_snapshot_repos(output_path), profiles)
+    report_path = static_report.generate_report(search_profiles.members(saved, profiles[0].name), source=output_path)
+    print(f"Static report saved: {os.path.dirname(report_path)}")
+
+    for journal in journals:
+        journal.discard()
+    return output_path
+
+
+def run_daemon(interval, directory=None, stop=None, poll=60.0):
+    """Refresh the snapshot every *interval* seconds until *stop* (a threading.Event) is set.
+
+    Several daemons may share *directory*: each *poll* seconds the daemon holding the crawl
+    lock crawls if no refresh happened within the last *interval* seconds. After each refresh
+    the reload marker tells running apps to load the new snapshot; a one-shot take_snapshot()
+    leaves it alone, so apps keep crawling GitHub when no daemon runs. A failed crawl is
+    retried after RETRY_SECONDS at the earliest.
+    """
+    directory = directory or snapshot_utils.SNAPSHOTS_DIR
+    stop = stop or threading.Event()
+    retry_at = 0.0
+    while not stop.is_set():
+        with snapshot_utils.crawl_lock(directory) as acquired:
+            # Checked under the lock: another replica may have just finished a crawl
+            marker = snapshot_utils.reload_marker(directory)
+            due = marker is None or time.time() - marker[0] >= interval
+            if acquired and due and time.time() >= retry_at:
+                try:
+                    saved = take_snapshot(directory, overwrite=True)
+                except Exception as e:  # keep the daemon alive
+                    print(f"Refresh failed: {e}", file=sys.stderr)
+                    saved = None
+                if saved:
+                    # Last, once every artifact is in place: running apps load the new snapshot
+                    snapshot_utils.signal_reload(saved, directory, interval)
+                else:
+                    retry_at = time.time() + min(interval, RETRY_SECONDS)
+        stop.wait(poll)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Save today's snapshot of low-code repos on GitHub")
+    parser.add_argument("--daemon", action="store_true", help="keep running and refresh on a schedule")
+    parser.add_argument("--interval-hours", type=float, default=24.0, help="refresh interval in daemon mode")
+    parser.add_argument("--snapshots-dir", default=snapshot_utils.SNAPSHOTS_DIR,
+                        help="snapshot directory, shared by the app replicas (default: LOWCODE_SNAPSHOTS_DIR "
+                             "or snapshots/)")
+    args = parser.parse_args()
+
+    if not args.daemon:
+        with snapshot_utils.crawl_lock(args.snapshots_dir) as acquired:
+            if not acquired:
+                print("Another crawl is running for this snapshot directory", file=sys.stderr)
+                sys.exit(1)
+            try:
+                take_snapshot(args.snapshots_dir)
+            except IncompleteCrawl:
+                print("Snapshot not written: the crawl is incomplete. Rerun to resume it.", file=sys.stderr)
+                sys.exit(1)
+        return
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    print(f"Refreshing {args.snapshots_dir} every {args.interval_hours:g}h (Ctrl+C to stop)")
+    run_daemon(args.interval_hours * 3600, args.snapshots_dir, stop)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,84 @@
+"""
+Tests for the benchmark suite of the Low-Code Tools Dashboard.
+
+This module tests:
+1. Synthetic repo generation (deterministic, GitHub API format)
+2. Snapshot CSV round trip of synthetic data
+3. Dashboard data helpers on synthetic data
+4. Baseline comparison / regression flagging
+
+Usage:
+    python tests/test_benchmarks.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dashboard_data
+import snapshot_utils
+from run_benchmarks import bench_scale, compare
+from synthetic_repos import generate_repos
+
+
+class TestSyntheticRepos(unittest.TestCase):
+    """Synthetic dataset checks."""
+
+    def setUp(self):
+        self.today = datetime(2026, 4, 19)
+        self.repos = generate_repos(500, seed=1, today=self.today)
+
+    def test_deterministic(self):
+        """Same seed and date give the same dataset."""
+        self.assertEqual(self.repos, generate_repos(500, seed=1, today=self.today))
+
+    def test_api_format(self):
+        """Every repo has the fields the dashboard reads."""
+        for repo in self.repos:
+            self.assertGreaterEqual(repo["stargazers_count"], 50)
+            self.assertTrue(repo["html_url"].startswith("https://github.com/"))
+            self.assertIsInstance(repo["topics"], list)
+        self.assertEqual(len({r["html_url"] for r in self.repos}), len(self.repos))
+
+    def test_csv_round_trip(self):
+        """repos_to_csv followed by load_snapshot_repos keeps table rows unchanged."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "snapshot-test.csv")
+            count = snapshot_utils.repos_to_csv(self.repos, path)
+            loaded = snapshot_utils.load_snapshot_repos(path)
+        self.assertEqual(count, len(loaded))
+        self.assertEqual([r["html_url"] for r in loaded], [r["html_url"] for r in self.repos])
+        self.assertEqual([r["topics"] for r in loaded], [r["topics"] for r in self.repos])
+
+    def test_filter_drops_inactive(self):
+        """Default slider filter drops repos pushed more than a year ago."""
+        filtered = dashboard_data.filter_repos(self.repos, 50, self.today - timedelta(days=365))
+        self.assertLess(len(filtered), len(self.repos))
+        self.assertGreater(len(filtered), 0)
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    """Benchmark runner checks."""
+
+    def test_bench_scale_covers_hot_paths(self):
+        """A small run times every hot path."""
+        timings = bench_scale(200, repeat=1)
+        for name in ("repos_to_csv", "snapshot_load", "slider_filter",
+                     "stats_aggregation", "analysis_modeling"):
+            self.assertIn(name, timings)
+
+    def test_compare_flags_regressions(self):
+        """Only slowdowns beyond the tolerance and above the noise floor are flagged."""
+        baseline = {"results": {"1000": {"a": 0.010, "b": 0.010, "c": 0.0001}}}
+        current = {"results": {"1000": {"a": 0.020, "b": 0.011, "c": 0.001}}}
+        self.assertEqual(compare(current, baseline, tolerance=0.25),
+                         [("1000", "a", 0.010, 0.020)])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
@@ -0,0 +1,122 @@
+"""
+Tests for the checkpointed search crawl (crawl_journal.py, take_snapshot.crawl).
+
+This module tests:
+1. Journaled pages survive a reload; a torn last line is ignored
+2. A crawl that fails part-way raises IncompleteCrawl and writes no snapshot
+3. The rerun resumes after the journaled pages and publishes the full snapshot
+4. Completeness stats and pruning of abandoned journals
+
+Usage:
+    python tests/test_crawl_journal.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from unittest.mock import patch
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import crawl_journal
+import snapshot_utils
+import static_report
+import take_snapshot
+from github_stub_server import start_stub_server
+from synthetic_repos import generate_repos
+
+
+class TestCrawlJournal(unittest.TestCase):
+    """CrawlJournal on its own."""
+
+    def test_round_trip_and_torn_line(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            journal = crawl_journal.CrawlJournal({"q": "low-code"}, tmp)
+            journal.record(1, 250, [{"id": 1}])
+            journal.record(2, 250, [{"id": 2}])
+            with open(journal.path, "a", encoding="utf-8") as f:
+                f.write('{"page": 3, "total_count": 250, "ite')  # crash mid-write
+
+            reloaded = crawl_journal.CrawlJournal({"q": "low-code"}, tmp)
+            self.assertEqual(sorted(reloaded.pages), [1, 2])
+            self.assertEqual(reloaded.page(2)["items"], [{"id": 2}])
+            self.assertEqual(crawl_journal.CrawlJournal({"q": "other"}, tmp).pages, {})
+
+            reloaded.discard()
+            self.assertFalse(os.path.exists(journal.path))
+
+    def test_prune(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            old = crawl_journal.CrawlJournal({"q": "old"}, tmp)
+            old.record(1, 10, [])
+            fresh = crawl_journal.CrawlJournal({"q": "fresh"}, tmp)
+            fresh.record(1, 10, [])
+            past = time.time() - crawl_journal.JOURNAL_MAX_AGE - 60
+            os.utime(old.path, (past, past))
+            self.assertEqual(crawl_journal.prune(tmp), 1)
+            self.assertEqual(os.listdir(tmp), [os.path.basename(fresh.path)])
+
+
+class TestResumableCrawl(unittest.TestCase):
+    """take_snapshot() against github_stub_server.py with an injected failure."""
+
+    def setUp(self):
+        self.server, base = start_stub_server(repos=generate_repos(800, seed=8), search_limit=1000)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.journal_dir = os.path.join(self.tmp.name, "journal")
+        self.patches = [
+            patch.object(take_snapshot, "GITHUB_API_URL", f"{base}/search/repositories"),
+            patch.object(static_report, "REPORT_DIR", os.path.join(self.tmp.name, "report")),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def _take(self):
+        with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+            return take_snapshot.take_snapshot(self.tmp.name, journal_dir=self.journal_dir)
+
+    def _requested_pages(self):
+        return [int(path.rsplit("page=", 1)[1]) for _, path, _ in self.server.state.request_log
+                if path.startswith("/search/")]
+
+    def test_resume_after_failure(self):
+        self.server.state.update_config({"error_pages": {"4": 403}})
+        with self.assertRaises(take_snapshot.IncompleteCrawl) as failure:
+            self._take()
+        stats = failure.exception.stats
+        self.assertFalse(stats["complete"])
+        self.assertEqual((stats["pages"], stats["failed_page"], stats["repos"]), (3, 4, 300))
+        self.assertEqual(snapshot_utils.list_snapshots(self.tmp.name), [])  # nothing published
+        self.assertIsNone(snapshot_utils.reload_marker(self.tmp.name))
+
+        self.server.state.update_config({"error_pages": {}})
+        path = self._take()
+        self.assertEqual(self._requested_pages(), [1, 2, 3, 4, 4, 5, 6, 7, 8])  # 1-3 came from the journal
+        expected = self.server.state.search(take_snapshot.search_query())
+        self.assertEqual(len(snapshot_utils.load_snapshot_repos(path)), len(expected))
+        self.assertEqual(os.listdir(self.journal_dir), [])  # discarded once published
+
+    def test_complete_stats(self):
+        with redirect_stdout(StringIO()):
+            repos, stats = take_snapshot.crawl(take_snapshot.search_query())
+        self.assertTrue(stats["complete"])
+        self.assertEqual(stats["repos"], len(repos))
+        self.assertEqual(stats["total_count"], len(repos))
+        self.assertEqual(stats["resumed"], 0)
+        self.assertIn("Crawl complete", take_snapshot.format_crawl_stats(stats))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
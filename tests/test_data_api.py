@@ -0,0 +1,161 @@
+"""
+Tests for the read-only JSON data API (data_api.py).
+
+This module tests:
+1. Slider-equivalent filtering, category flags and pagination
+2. ETag / 304 and gzip responses
+3. A new snapshot is picked up with a new dataset version
+4. Invalid parameters are rejected with 400
+5. Search profile exclusions and membership apply as in the dashboard, following profile edits
+
+Usage:
+    python tests/test_data_api.py
+"""
+
+import gzip
+import json
+import os
+import sys
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dashboard_data
+import data_api
+import search_profiles
+import snapshot_utils
+from keyword_analysis import categorize_repos
+from synthetic_repos import generate_repos
+
+
+def _get(url, headers=None):
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+class TestDataAPI(unittest.TestCase):
+    """API served from a temporary snapshots directory."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        today = datetime.now()
+        snapshot_utils.repos_to_csv(generate_repos(300, seed=5, today=today),
+                                    os.path.join(self.tmp.name, f"snapshot-{today:%Y-%m-%d}.csv"))
+        # What the API serves: the snapshot as the app would load it
+        self.repos = search_profiles.apply_profiles(
+            snapshot_utils.load_snapshot_repos(snapshot_utils.list_snapshots(self.tmp.name)[-1][1]),
+            search_profiles.load_profiles())
+        self.server, self.base = data_api.start_data_api(snapshots_dir=self.tmp.name)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def _json(self, path):
+        status, headers, body = _get(self.base + path)
+        self.assertEqual(status, 200, body)
+        return json.loads(body), headers
+
+    def test_filters_match_sliders(self):
+        cutoff = datetime.now() - timedelta(days=90)
+        expected = dashboard_data.filter_repos(self.repos, 500, cutoff)
+        data, _ = self._json(f"/v1/repos?min_stars=500&min_date={cutoff:%Y-%m-%d}&per_page=1000")
+        self.assertEqual(data["total_count"], len(expected))
+        self.assertEqual([i["url"] for i in data["items"]], [r["html_url"] for r in expected])
+
+    def test_category_flags(self):
+        view = dashboard_data.filter_repos(self.repos, 50, datetime.now() - timedelta(days=365))
+        expected = [r["html_url"] for r in categorize_repos(view, "no-code")[0]]
+        data, _ = self._json("/v1/repos?category=no-code&per_page=1000")
+        self.assertEqual([i["url"] for i in data["items"]], expected)
+        self.assertTrue(all("no-code" in i["categories"] for i in data["items"]))
+
+    def test_pagination(self):
+        data, headers = self._json("/v1/repos?per_page=10&page=2")
+        self.assertEqual(len(data["items"]), 10)
+        self.assertIn('page=3>; rel="next"', headers["Link"])
+        self.assertIn('page=1>; rel="prev"', headers["Link"])
+
+    def test_etag_and_gzip(self):
+        status, headers, _ = _get(self.base + "/v1/repos")
+        self.assertEqual(status, 200)
+        status, _, body = _get(self.base + "/v1/repos", {"If-None-Match": headers["ETag"]})
+        self.assertEqual((status, body), (304, b""))
+
+        status, gz_headers, gz_body = _get(self.base + "/v1/repos", {"Accept-Encoding": "gzip"})
+        self.assertEqual(gz_headers["Content-Encoding"], "gzip")
+        self.assertNotEqual(gz_headers["ETag"], headers["ETag"])
+        self.assertEqual(json.loads(gzip.decompress(gz_body))["total_count"],
+                         self._json("/v1/repos")[0]["total_count"])
+
+    def test_new_snapshot_changes_version(self):
+        version = self._json("/v1/dataset")[0]["version"]
+        status, headers, _ = _get(self.base + "/v1/repos")
+        tomorrow = datetime.now() + timedelta(days=1)
+        snapshot_utils.repos_to_csv(generate_repos(50, seed=6),
+                                    os.path.join(self.tmp.name, f"snapshot-{tomorrow:%Y-%m-%d}.csv"))
+        with patch.object(data_api, "RELOAD_INTERVAL", 0):
+            meta = self._json("/v1/dataset")[0]
+            status, _, _ = _get(self.base + "/v1/repos", {"If-None-Match": headers["ETag"]})
+        self.assertNotEqual(meta["version"], version)
+        self.assertEqual(meta["repos"], 50)
+        self.assertEqual(status, 200)
+
+    def test_bad_requests(self):
+        for query in ("category=nope", "per_page=0", "page=0", "min_stars=x", "min_date=yesterday"):
+            self.assertEqual(_get(self.base + "/v1/repos?" + query)[0], 400, query)
+        self.assertEqual(_get(self.base + "/v2/repos")[0], 404)
+
+    def test_search_profiles(self):
+        path = os.path.join(self.tmp.name, "profiles.toml")
+        repos = generate_repos(300, seed=7)
+        excluded, top = repos[3], repos[0]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"""
+[profiles.low-code]
+queries = ['"low-code"']
+exclude = ["{excluded['name']}"]
+
+[profiles.popular]
+queries = ['"low-code"']
+min_stars = 500
+""")
+        profiles = search_profiles.load_profiles(path)
+        popular_repos = [r for r in repos if r["stargazers_count"] >= 500]
+        tomorrow = datetime.now() + timedelta(days=1)
+        merged = search_profiles.merge_profiles(profiles, {"low-code": repos, "popular": popular_repos})
+        snapshot_utils.repos_to_csv(merged, os.path.join(self.tmp.name, f"snapshot-{tomorrow:%Y-%m-%d}.csv"))
+        all_repos = "/v1/repos?min_stars=0&min_date=2000-01-01&per_page=1000"
+        with patch.object(search_profiles, "PROFILES_PATH", path), patch.object(data_api, "RELOAD_INTERVAL", 0):
+            meta = self._json("/v1/dataset")[0]
+            low_code = [i["url"] for i in self._json(all_repos)[0]["items"]]
+            popular = [i["url"] for i in self._json(all_repos + "&profile=popular")[0]["items"]]
+            unknown = _get(self.base + all_repos + "&profile=nope")[0]
+            # Excluding a repo in the profile file takes effect without a new snapshot
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(f'exclude = ["{top["name"]}"]\n')
+            os.utime(path, (0, 1))
+            popular_after_edit = [i["url"] for i in self._json(all_repos + "&profile=popular")[0]["items"]]
+
+        self.assertEqual(meta["profiles"], ["low-code", "popular"])
+        self.assertEqual(meta["repos"], 300)  # the excluded repo is still a popular one
+        self.assertEqual(len(low_code), 299)
+        self.assertNotIn(excluded["html_url"], low_code)
+        self.assertEqual(sorted(popular), sorted(r["html_url"] for r in popular_repos))
+        self.assertEqual(unknown, 400)
+        self.assertEqual(len(popular_after_edit), len(popular) - 1)
+        self.assertNotIn(top["html_url"], popular_after_edit)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
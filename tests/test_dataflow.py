@@ -0,0 +1,177 @@
+"""
+Tests for the memoized dependency graph (dataflow.py).
+
+This module tests:
+1. Nodes are computed lazily, memoized, and recomputed only downstream of a changed input
+2. Inputs set again with an equal value or key invalidate nothing
+3. In the dashboard graph, moving the date slider reuses the search results and default view
+4. The app keeps one graph per session and reuses it across slider reruns
+5. A reloaded snapshot that only changes star counts refreshes the table
+
+Usage:
+    python tests/test_dataflow.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dataflow
+import snapshot_utils
+from synthetic_repos import generate_repos
+
+TODAY = datetime(2026, 1, 1)
+
+
+class TestFlow(unittest.TestCase):
+    """Flow memoization and invalidation."""
+
+    def setUp(self):
+        self.flow = dataflow.Flow()
+        self.flow.node("double", ("a",), lambda a: a * 2)
+        self.flow.node("total", ("double", "b"), lambda d, b: d + b)
+        self.flow.node("b_only", ("b",), lambda b: -b)
+        self.flow.set("a", 1)
+        self.flow.set("b", 10)
+
+    def test_lazy_and_memoized(self):
+        self.assertEqual(self.flow.recomputed, {})
+        self.assertEqual(self.flow.get("total"), 12)
+        self.assertEqual(self.flow.get("total"), 12)
+        self.assertEqual(self.flow.recomputed, {"double": 1, "total": 1})
+
+    def test_only_downstream_recomputed(self):
+        self.flow.get("total")
+        self.flow.get("b_only")
+        self.flow.set("b", 20)
+        self.assertEqual(self.flow.get("total"), 22)
+        self.assertEqual(self.flow.get("b_only"), -20)
+        self.assertEqual(self.flow.recomputed, {"double": 1, "total": 2, "b_only": 2})
+
+    def test_unchanged_input(self):
+        self.flow.node("size", ("items",), len)
+        self.flow.set("items", [0], key="v1")
+        self.flow.get("total")
+        self.flow.get("size")
+        self.flow.set("a", 1)
+        self.flow.set("items", [1], key="v1")  # same key: the new object replaces the value, nothing is stale
+        self.assertEqual(self.flow.get("items"), [1])
+        self.flow.get("total")
+        self.flow.get("size")
+        self.assertEqual(self.flow.recomputed, {"double": 1, "total": 1, "size": 1})
+
+    def test_errors(self):
+        with self.assertRaises(KeyError):
+            self.flow.get("missing")
+        with self.assertRaises(ValueError):
+            self.flow.node("total", ("a",), abs)
+
+
+class TestDashboardFlow(unittest.TestCase):
+    """The dashboard graph from dashboard_flow()."""
+
+    def setUp(self):
+        self.repos = generate_repos(2000, seed=13, today=TODAY)
+        self.flow = dataflow.dashboard_flow()
+        for name, value in (("dataset_version", "v1"), ("today", TODAY), ("min_stars", 50),
+                            ("min_date", TODAY - timedelta(days=365)), ("search_query", "workflow"),
+                            ("collapse_duplicates", False)):
+            self.flow.set(name, value)
+        self.flow.set("repos", self.repos, key="v1")
+
+    def _render(self):
+        for name in ("table_rows", "stats.first_commit_years", "stats.languages", "stats.stars",
+                     "stats.stars_vs_age", "analysis.no-code", "default_view_filter"):
+            self.flow.get(name)
+
+    def test_date_slider(self):
+        self._render()
+        self.flow.set("min_date", TODAY - timedelta(days=90))
+        self._render()
+        self.assertEqual(self.flow.recomputed["search"], 1)
+        self.assertEqual(self.flow.recomputed["default_view_filter"], 1)
+        self.assertEqual(self.flow.recomputed["table_rows"], 2)
+        self.assertEqual(self.flow.recomputed["analysis.no-code"], 2)
+        self.assertNotIn("stats.stars_vs_last_push", self.flow.recomputed)  # never asked for
+        cutoff = (TODAY - timedelta(days=90)).strftime("%Y-%m-%d")
+        self.assertTrue(all(r["pushed_at"][:10] >= cutoff for r in self.flow.get("filtered")))
+
+    def test_new_dataset(self):
+        self._render()
+        self.flow.set("dataset_version", "v2")
+        self.flow.set("repos", self.repos[:500], key="v2")
+        self.assertLessEqual(len(self.flow.get("filtered")), 500)
+        self.assertEqual(self.flow.recomputed["search"], 2)
+
+    def test_collapse(self):
+        top = max(self.repos, key=lambda r: r["stargazers_count"])
+        repos = self.repos + [dict(top, html_url=top["html_url"] + "-mirror", stargazers_count=60)]
+        self.flow.set("dataset_version", "mirror")
+        self.flow.set("repos", repos, key="mirror")
+        self.flow.set("search_query", "")
+        self.flow.set("collapse_duplicates", True)
+        self.assertGreaterEqual(self.flow.get("hidden_duplicates"), 1)
+        self.assertEqual(len(self.flow.get("table_rows")), len(self.flow.get("filtered")))
+
+
+class TestAppFlow(unittest.TestCase):
+    """app.py serves reruns from the session's graph."""
+
+    def test_slider_rerun(self):
+        from streamlit.testing.v1 import AppTest
+
+        app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+        with patch.object(snapshot_utils, "GITHUB_API_BASE", "http://127.0.0.1:9"):
+            at = AppTest.from_file(app_path, default_timeout=60)
+            at.session_state.today = datetime(2025, 6, 7)  # the bundled snapshot's default view
+            at.run()
+            at.slider[0].set_value(100).run()
+            flow = at.session_state.dataflow
+            table_rows = flow.recomputed["table_rows"]
+            shown = len(at.dataframe[0].value)
+            at.slider[1].set_value(datetime(2025, 3, 1)).run()
+
+        self.assertFalse(at.exception)
+        self.assertIs(at.session_state.dataflow, flow)
+        self.assertEqual(flow.recomputed["default_view_filter"], 1)
+        self.assertEqual(flow.recomputed["search"], 1)
+        self.assertEqual(flow.recomputed["table_rows"], table_rows + 1)
+        self.assertLessEqual(len(at.dataframe[0].value), shown)
+
+    def test_reload_with_new_stars(self):
+        from streamlit.testing.v1 import AppTest
+
+        app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+        repos = generate_repos(150, seed=20)
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(snapshot_utils, "GITHUB_API_BASE", "http://127.0.0.1:9"), \
+                patch.object(snapshot_utils, "SNAPSHOTS_DIR", tmp):
+            first = os.path.join(tmp, "snapshot-2026-01-01.csv")
+            snapshot_utils.repos_to_csv(repos, first)
+            snapshot_utils.signal_reload(first, tmp)
+            at = AppTest.from_file(app_path, default_timeout=60)
+            at.run()
+            before = int(at.dataframe[0].value["Stars⭐"].sum())
+
+            # Same names, descriptions and topics; only the star counts move
+            second = os.path.join(tmp, "snapshot-2026-01-02.csv")
+            snapshot_utils.repos_to_csv([dict(r, stargazers_count=r["stargazers_count"] + 1000) for r in repos], second)
+            marker = snapshot_utils.signal_reload(second, tmp)
+            later = time.time() + 10
+            os.utime(marker, (later, later))  # a distinct mtime even on coarse-grained filesystems
+            at.run()
+
+        self.assertFalse(at.exception)
+        after = at.dataframe[0].value["Stars⭐"]
+        self.assertEqual(int(after.sum()), before + 1000 * len(after))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
@@ -0,0 +1,105 @@
+"""
+Tests for the local GitHub API stand-in (github_stub_server.py).
+
+This module tests:
+1. Search pagination and the 1000-result cap
+2. Rate-limit headers and 403 once exhausted
+3. ETag / 304 conditional requests
+4. Injected page errors
+5. commit_snapshot_to_github against the Contents API stand-in
+
+Usage:
+    python tests/test_github_stub.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import requests
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import snapshot_utils
+import take_snapshot
+from github_stub_server import start_stub_server
+from synthetic_repos import generate_repos
+
+
+class TestGitHubStub(unittest.TestCase):
+    """Search and Contents API behaviour of the stand-in."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.repos = generate_repos(1500, seed=2, today=datetime.now())
+        cls.server, cls.base_url = start_stub_server(cls.repos, search_limit=1000)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.state.update_config({"search_limit": 1000, "error_pages": {}})
+        self.search_url = f"{self.base_url}/search/repositories"
+
+    def test_fetch_repos_paginates(self):
+        """take_snapshot.fetch_repos walks every page up to the 1000-result cap."""
+        with patch.object(take_snapshot, "GITHUB_API_URL", self.search_url):
+            repos = take_snapshot.fetch_repos(max_pages=12)
+        self.assertEqual(len(repos), 1000)
+        stars = [r["stargazers_count"] for r in repos]
+        self.assertEqual(stars, sorted(stars, reverse=True))
+
+    def test_result_cap_returns_422(self):
+        """Pages beyond the first 1000 results are rejected like on GitHub."""
+        response = requests.get(self.search_url, params={"q": "low-code", "per_page": 100, "page": 11})
+        self.assertEqual(response.status_code, 422)
+
+    def test_rate_limit(self):
+        """Rate-limit headers count down and the request after the last one gets a 403."""
+        self.server.state.update_config({"search_limit": 2})
+        params = {"q": "low-code", "per_page": 10}
+        first = requests.get(self.search_url, params=params)
+        self.assertEqual(first.headers["X-RateLimit-Remaining"], "1")
+        requests.get(self.search_url, params=params)
+        third = requests.get(self.search_url, params=params)
+        self.assertEqual(third.status_code, 403)
+        self.assertEqual(third.headers["X-RateLimit-Remaining"], "0")
+        self.assertIn("Retry-After", third.headers)
+
+    def test_etag_not_modified(self):
+        """A matching If-None-Match gets a 304 that does not use up the rate limit."""
+        params = {"q": "low-code", "per_page": 10}
+        first = requests.get(self.search_url, params=params)
+        second = requests.get(self.search_url, params=params,
+                              headers={"If-None-Match": first.headers["ETag"]})
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.headers["X-RateLimit-Used"], first.headers["X-RateLimit-Used"])
+
+    def test_injected_page_error(self):
+        """An injected error stops the crawl at that page."""
+        self.server.state.update_config({"error_pages": {"3": 403}})
+        with patch.object(take_snapshot, "GITHUB_API_URL", self.search_url):
+            repos = take_snapshot.fetch_repos(max_pages=10)
+        self.assertEqual(len(repos), 200)
+
+    def test_commit_snapshot(self):
+        """Create, then update (with the stored sha), a snapshot via the Contents API."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(snapshot_utils, "GITHUB_API_BASE", self.base_url):
+            path = os.path.join(tmp, "snapshot-2026-01-01.csv")
+            snapshot_utils.repos_to_csv(self.repos[:10], path)
+            self.assertEqual(snapshot_utils.commit_snapshot_to_github(path, "token", "me/repo"), (True, None))
+            snapshot_utils.repos_to_csv(self.repos[:20], path)
+            self.assertEqual(snapshot_utils.commit_snapshot_to_github(path, "token", "me/repo"), (True, None))
+        stored = self.server.state.files[("me/repo", "main", "snapshots/snapshot-2026-01-01.csv")]
+        self.assertEqual(stored["content"].decode("utf-8").count("\n"), 21)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
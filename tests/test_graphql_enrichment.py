@@ -0,0 +1,162 @@
+"""
+Tests for the batched GraphQL metrics stage (graphql_enrichment.py).
+
+This module tests:
+1. Metrics for many repos are fetched with a few aliased GraphQL queries from the local stand-in
+2. Cached metrics are reused within the TTL and fetched again after it
+3. Repos GitHub can't resolve are counted as missing and cached as such
+4. Running out of GraphQL points skips the remaining batches instead of failing
+5. Metric columns round-trip through snapshot CSVs, and old snapshots still load
+6. The app's auto-snapshot skips batches past the point budget instead of waiting for the reset
+
+Usage:
+    python tests/test_graphql_enrichment.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import graphql_enrichment
+import snapshot_utils
+import static_report
+from github_stub_server import start_stub_server
+from synthetic_repos import generate_repos
+
+
+class TestGraphQLEnrichment(unittest.TestCase):
+    """Enrichment against github_stub_server.py."""
+
+    def setUp(self):
+        self.repos = generate_repos(120, seed=5)
+        self.server, self.base = start_stub_server(repos=self.repos)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp.name, "metrics.json")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def _enrich(self, repos, **kwargs):
+        return graphql_enrichment.enrich_metrics(repos, api_base=self.base, cache_path=self.cache_path, **kwargs)
+
+    def _graphql_requests(self):
+        return [entry for entry in self.server.state.request_log if entry[1] == "/graphql"]
+
+    def test_batched_fetch(self):
+        repos = [dict(r) for r in self.repos]
+        stats = self._enrich(repos, batch_size=50)
+        self.assertEqual(stats["fetched"], 120)
+        self.assertEqual(stats["queries"], 3)
+        self.assertEqual(len(self._graphql_requests()), 3)
+        self.assertEqual(stats["points"], 2 + 2 + 1)  # 150, 150 and 60 connections
+        for repo in repos:
+            for key in graphql_enrichment.METRIC_KEYS:
+                self.assertIn(key, repo)
+            self.assertGreaterEqual(repo["contributor_count"], 1)
+            self.assertEqual(repo["latest_release"] is None, repo["release_count"] == 0)
+        # Deterministic stand-in: the same repo always gets the same numbers
+        expected = self.server.state.repo_metrics(self.repos[0]["full_name"], "")
+        self.assertEqual(repos[0]["release_count"], expected["releases"]["totalCount"])
+
+    def test_cache_ttl(self):
+        self._enrich([dict(r) for r in self.repos], now=1_000_000)
+        repos = [dict(r) for r in self.repos]
+        stats = self._enrich(repos, now=1_000_000 + 3600)
+        self.assertEqual(stats["cached"], 120)
+        self.assertEqual(len(self._graphql_requests()), 3)
+        self.assertTrue(all("commits_last_year" in r for r in repos))
+
+        stats = self._enrich([dict(r) for r in self.repos], now=1_000_000 + graphql_enrichment.CACHE_TTL + 1)
+        self.assertEqual(stats["fetched"], 120)
+
+    def test_missing_repos(self):
+        gone = dict(self.repos[0], full_name="someone/deleted-repo", html_url="https://github.com/someone/deleted-repo")
+        repos = [gone] + [dict(r) for r in self.repos[1:10]]
+        stats = self._enrich(repos)
+        self.assertEqual(stats["missing"], 1)
+        self.assertEqual(stats["fetched"], 9)
+        self.assertNotIn("release_count", gone)
+        # Not asked again within the TTL
+        self.assertEqual(self._enrich([dict(gone)])["missing"], 1)
+        self.assertEqual(len(self._graphql_requests()), 1)
+
+    def test_point_budget_skips(self):
+        # 4 points: the first two 50-repo batches fit, the third doesn't and the reset is a minute away
+        self.server.state.update_config({"graphql_limit": 4})
+        stats = self._enrich([dict(r) for r in self.repos], batch_size=50, max_workers=1, max_wait=0)
+        self.assertEqual(stats["fetched"], 100)
+        self.assertEqual(stats["skipped"], 20)
+
+    def test_snapshot_round_trip(self):
+        repos = [dict(r) for r in self.repos[:20]]
+        self._enrich(repos)
+        repos[0]["latest_release"] = None  # no releases: blank cell
+        del repos[1]["commits_last_year"]  # not fetched: blank cell
+        path = os.path.join(self.tmp.name, "snapshot-2026-01-01.csv")
+        snapshot_utils.repos_to_csv(repos, path)
+        with open(path, encoding="utf-8") as f:
+            header = f.readline().strip().split(",")
+        self.assertEqual(header[-4:], list(snapshot_utils.METRIC_COLUMNS))
+
+        loaded = snapshot_utils.load_snapshot_repos(path)
+        self.assertEqual(loaded[0]["latest_release"], None)
+        self.assertIsNone(loaded[1]["commits_last_year"])
+        for original, row in zip(repos[2:], loaded[2:]):
+            self.assertEqual(row["release_count"], original["release_count"])
+            self.assertEqual(row["contributor_count"], original["contributor_count"])
+            self.assertEqual(row["commits_last_year"], original["commits_last_year"])
+            if original["latest_release"]:
+                self.assertEqual(row["latest_release"][:10], original["latest_release"][:10])
+
+        # Without metrics the file keeps the original columns
+        plain = os.path.join(self.tmp.name, "snapshot-2026-01-02.csv")
+        snapshot_utils.repos_to_csv(self.repos[:5], plain)
+        with open(plain, encoding="utf-8") as f:
+            self.assertEqual(f.readline().strip().split(","), snapshot_utils.SNAPSHOT_COLUMNS)
+        self.assertNotIn("release_count", snapshot_utils.load_snapshot_repos(plain)[0])
+
+
+class TestAppEnrichment(unittest.TestCase):
+    """GraphQL enrichment during the app's auto-snapshot."""
+
+    def test_point_budget_does_not_block(self):
+        from streamlit.testing.v1 import AppTest
+
+        app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+        # Four points a minute: a few batches fit, the rest would wait for the reset
+        server, base = start_stub_server(repos=generate_repos(1500, seed=22), graphql_limit=4, window_seconds=60)
+        try:
+            with tempfile.TemporaryDirectory() as tmp, \
+                    patch.object(snapshot_utils, "GITHUB_API_BASE", base), \
+                    patch.object(snapshot_utils, "SNAPSHOTS_DIR", tmp), \
+                    patch.object(static_report, "REPORT_DIR", os.path.join(tmp, "report")), \
+                    patch.object(static_report, "REPORT_JSON", os.path.join(tmp, "report", "report.json")), \
+                    patch.object(graphql_enrichment, "ENABLED", True), \
+                    patch.object(graphql_enrichment, "CACHE_PATH", os.path.join(tmp, "metrics.json")):
+                at = AppTest.from_file(app_path, default_timeout=300)
+                start = time.monotonic()
+                at.run()
+                elapsed = time.monotonic() - start
+                [(_, saved_path)] = snapshot_utils.list_snapshots(tmp)
+                saved = snapshot_utils.load_snapshot_repos(saved_path)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertFalse(at.exception)
+        self.assertTrue(at.session_state.snapshot_taken)
+        self.assertLess(elapsed, 30)  # the reset is a minute away
+        enriched = [repo for repo in saved if any(repo.get(key) is not None for key in graphql_enrichment.METRIC_KEYS)]
+        self.assertTrue(0 < len(enriched) < len(saved))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
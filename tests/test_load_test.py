@@ -0,0 +1,43 @@
+"""
+Smoke test for the concurrent-session load test harness (load_test.py).
+
+This module tests:
+1. Two concurrent sessions load the app from snapshot data and move the sliders
+2. The report contains latency percentiles, memory figures and counters
+
+Usage:
+    python tests/test_load_test.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import snapshot_utils
+from load_test import run_load_test
+
+
+class TestLoadTestHarness(unittest.TestCase):
+    """End-to-end run of the harness on a tiny load."""
+
+    def test_small_run(self):
+        """2 sessions x 2 interactions against the snapshot fallback."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(snapshot_utils, "SNAPSHOTS_DIR", tmp), \
+                patch.object(snapshot_utils, "GITHUB_API_BASE", "http://127.0.0.1:9"):
+            report = run_load_test(sessions=2, interactions=2, think_time=0)
+        self.assertEqual(report["errors"], [])
+        self.assertEqual(report["rerun_ms"]["count"], 4)
+        self.assertIsNotNone(report["rerun_ms"]["p95"])
+        self.assertGreater(report["peak_rss_mb"], 0)
+        self.assertEqual(report["counters"].get("snapshot_fallbacks"), 2)
+        print(f"[OK] rerun p50 {report['rerun_ms']['p50']} ms, p95 {report['rerun_ms']['p95']} ms")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
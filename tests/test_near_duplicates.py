@@ -0,0 +1,129 @@
+"""
+Tests for near-duplicate detection (near_duplicates.py).
+
+This module tests:
+1. Features ignore the search-query words; MinHash agreement estimates Jaccard similarity
+2. Planted mirrors among thousands of synthetic repos are clustered, without false clusters
+3. Signatures of separately hashed shards stack to the same result
+4. collapse() keeps the most-starred repo of each cluster and the list order
+5. The app's "Collapse near-duplicates" option hides cluster members in the table
+
+Usage:
+    python tests/test_near_duplicates.py
+"""
+
+import os
+import random
+import sys
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import near_duplicates
+import snapshot_utils
+from synthetic_repos import generate_repos
+
+
+def _mirror(repo, suffix):
+    """A copy of *repo* under another owner with a slightly edited description."""
+    words = (repo["description"] or "").split()
+    return dict(repo, name=f"{repo['name']}-{suffix}", stargazers_count=1,
+                html_url=f"https://github.com/mirror-{suffix}/{repo['name']}",
+                description=" ".join(words[:-1] if len(words) > 6 else words))
+
+
+class TestSignatures(unittest.TestCase):
+    """feature_set() and minhash_signatures()."""
+
+    def test_features(self):
+        a = {"name": "pc-Dooring", "topics": ["low-code", "h5"], "description": "A low-code H5 page editor"}
+        b = {"name": "dooring", "topics": ["h5"], "description": "H5 page editor"}
+        self.assertEqual(near_duplicates.feature_set({"name": "lowcode"}), frozenset())
+        self.assertGreater(near_duplicates.jaccard(near_duplicates.feature_set(a), near_duplicates.feature_set(b)), 0.5)
+
+    def test_estimate(self):
+        repos = generate_repos(200, seed=9)
+        features = [near_duplicates.feature_set(r) for r in repos]
+        signatures = near_duplicates.minhash_signatures(features)
+        self.assertEqual(signatures.shape, (200, near_duplicates.NUM_PERM))
+        for i in range(0, 200, 2):
+            true = near_duplicates.jaccard(features[i], features[i + 1])
+            estimate = float(np.mean(signatures[i] == signatures[i + 1]))
+            self.assertAlmostEqual(estimate, true, delta=0.2)
+
+
+class TestClusters(unittest.TestCase):
+    """find_clusters() on synthetic data with planted mirrors."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.repos = generate_repos(5000, seed=10)
+        rng = random.Random(0)
+        cls.planted = []
+        for k, i in enumerate(rng.sample(range(5000), 40)):
+            mirror = _mirror(cls.repos[i], k)
+            cls.repos.append(mirror)
+            cls.planted.append((cls.repos[i]["html_url"], mirror["html_url"]))
+
+    def test_planted_mirrors_found(self):
+        clusters = near_duplicates.find_clusters(self.repos)
+        ids = near_duplicates.cluster_ids(self.repos, clusters)
+        found = sum(1 for a, b in self.planted if a in ids and ids[a] == ids.get(b))
+        self.assertGreaterEqual(found, 38)
+        planted_urls = {url for pair in self.planted for url in pair}
+        self.assertLessEqual(len(set(ids) - planted_urls), 4)  # (almost) no unrelated repos pulled in
+        for cluster in clusters:
+            self.assertEqual(cluster.similarity[0], 1.0)
+            stars = [self.repos[i]["stargazers_count"] for i in cluster.members]
+            self.assertEqual(stars, sorted(stars, reverse=True))
+
+    def test_shards_stack(self):
+        features = [near_duplicates.feature_set(r) for r in self.repos]
+        whole = near_duplicates.minhash_signatures(features)
+        stacked = np.vstack([near_duplicates.minhash_signatures(features[:2000]),
+                             near_duplicates.minhash_signatures(features[2000:])])
+        np.testing.assert_array_equal(whole, stacked)
+        self.assertEqual(
+            [c.members for c in near_duplicates.find_clusters(self.repos, signatures=stacked)],
+            [c.members for c in near_duplicates.find_clusters(self.repos)],
+        )
+
+    def test_collapse(self):
+        repos = [{"html_url": u, "stargazers_count": s} for u, s in
+                 [("a", 5), ("b", 50), ("c", 7), ("d", 1), ("e", 3)]]
+        kept, hidden = near_duplicates.collapse(repos, {"a": 0, "b": 0, "d": 1, "e": 1})
+        self.assertEqual([r["html_url"] for r in kept], ["b", "c", "e"])
+        self.assertEqual(hidden, 2)
+
+
+class TestAppCollapse(unittest.TestCase):
+    """The table option in app.py."""
+
+    def test_collapse_option(self):
+        from streamlit.testing.v1 import AppTest
+
+        app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+        with patch.object(snapshot_utils, "GITHUB_API_BASE", "http://127.0.0.1:9"):
+            at = AppTest.from_file(app_path, default_timeout=60)
+            at.session_state.today = datetime(2025, 6, 7)  # the bundled snapshot's default view
+            at.run()
+            repos = at.session_state.repos
+            shown = len(at.dataframe[0].value)
+            # Add a mirror of the most-starred repo so the dataset is guaranteed to have a cluster
+            top = max(repos, key=lambda r: r["stargazers_count"])
+            at.session_state.repos = repos + [dict(_mirror(top, "x"), pushed_at=top["pushed_at"], stargazers_count=60)]
+            at.session_state.repos_version = "with-mirror"
+            at.checkbox[0].check().run()
+
+        self.assertFalse(at.exception)
+        self.assertTrue(any("near-duplicates hidden" in c.value for c in at.caption))
+        self.assertLessEqual(len(at.dataframe[0].value), shown)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
@@ -0,0 +1,126 @@
+"""
+Tests for the timing instrumentation (perf_metrics.py).
+
+This module tests:
+1. No-op behaviour when collection is disabled
+2. Span / counter aggregation when enabled
+3. Per-run recording for the admin debug panel
+4. Prometheus text export
+5. Single-rerun profile capture (profile_capture.py), including reruns cut short
+
+Usage:
+    python tests/test_perf_metrics.py
+"""
+
+import marshal
+import os
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import perf_metrics
+import profile_capture
+
+
+class TestPerfMetrics(unittest.TestCase):
+    """Span and counter behaviour."""
+
+    def setUp(self):
+        self._was_enabled = perf_metrics.ENABLED
+        perf_metrics.ENABLED = False
+        perf_metrics.reset()
+
+    def tearDown(self):
+        perf_metrics.ENABLED = self._was_enabled
+        perf_metrics.reset()
+
+    def test_disabled_is_noop(self):
+        """With collection off, spans are the shared no-op and nothing is recorded."""
+        self.assertIs(perf_metrics.span("a"), perf_metrics.span("b"))
+        with perf_metrics.span("a"):
+            perf_metrics.incr("api_calls")
+        self.assertEqual(perf_metrics.snapshot(), {"spans": {}, "counters": {}})
+
+    def test_enabled_aggregates(self):
+        """Spans are counted and counters summed."""
+        perf_metrics.ENABLED = True
+        for _ in range(3):
+            with perf_metrics.span("fetch.api_page"):
+                perf_metrics.incr("api_calls")
+        data = perf_metrics.snapshot()
+        self.assertEqual(data["spans"]["fetch.api_page"]["count"], 3)
+        self.assertEqual(data["counters"]["api_calls"], 3)
+
+    def test_forced_run(self):
+        """A forced run records spans for the debug panel even when collection is off."""
+        perf_metrics.begin_run(force=True)
+        with perf_metrics.span("slider_filter"):
+            pass
+        perf_metrics.incr("session_cache_hits")
+        run = perf_metrics.end_run()
+        self.assertEqual([s["name"] for s in run["spans"]], ["slider_filter", "app.run"])
+        self.assertEqual(run["counters"], {"session_cache_hits": 1})
+        self.assertFalse(perf_metrics.is_active())
+
+    def test_prometheus_export(self):
+        """Prometheus text has one sample per span and counter."""
+        perf_metrics.ENABLED = True
+        with perf_metrics.span("table_rows"):
+            perf_metrics.incr("snapshot_fallbacks")
+        text = perf_metrics.prometheus_text()
+        self.assertIn('lowcode_span_count_total{span="table_rows"} 1', text)
+        self.assertIn('lowcode_events_total{event="snapshot_fallbacks"} 1', text)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lowcode.prom")
+            perf_metrics.write_prometheus(path)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), text)
+
+
+class TestProfileCapture(unittest.TestCase):
+    """Profile capture for one rerun."""
+
+    def test_capture_is_loadable(self):
+        """The .prof bytes load as pstats data and include the profiled function."""
+        def busy():
+            return sum(i * i for i in range(1000))
+
+        profiler = profile_capture.start()
+        busy()
+        capture = profile_capture.finish(profiler)
+        stats = marshal.loads(capture.prof_bytes)
+        self.assertTrue(any(func[2] == "busy" for func in stats))
+        self.assertIn("cumulative", capture.summary)
+        self.assertTrue(capture.file_name.endswith(".prof"))
+
+    def test_unfinished_capture_is_stopped(self):
+        """A rerun that never reached finish() doesn't leak into the next capture."""
+        def interrupted():
+            return sum(range(1000))
+
+        def busy():
+            return sum(i * i for i in range(1000))
+
+        leftover = profile_capture.start()
+        interrupted()
+        profiler = profile_capture.start()
+        busy()
+        stats = marshal.loads(profile_capture.finish(profiler).prof_bytes)
+        self.assertTrue(any(func[2] == "busy" for func in stats))
+        self.assertFalse(any(func[2] == "interrupted" for func in stats))
+        self.assertIsNone(sys.getprofile())
+        leftover.create_stats()
+        self.assertFalse(any(func[2] == "busy" for func in leftover.stats))
+
+        # An unprofiled rerun stops it too
+        profile_capture.start()
+        interrupted()
+        profile_capture.stop_unfinished()
+        self.assertIsNone(sys.getprofile())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
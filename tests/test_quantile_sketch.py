@@ -0,0 +1,123 @@
+"""
+Tests for the star box plot statistics (quantile_sketch.py, dashboard_figures.star_box_plot).
+
+This module tests:
+1. Exact statistics match numpy's quartiles and Tukey's whiskers, with capped outliers
+2. A t-digest of 200k star counts estimates the quartiles within 2%
+3. Digests of shards merge to the digest of the whole and survive a JSON round trip, also for
+   shards smaller than MAX_OUTLIERS
+4. The box plot carries only precomputed statistics, so its size does not grow with repo count
+
+Usage:
+    python tests/test_quantile_sketch.py
+"""
+
+import json
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dashboard_figures
+import quantile_sketch
+from synthetic_repos import generate_repos
+
+
+def _stars(n, seed=0):
+    return np.array([repo["stargazers_count"] for repo in generate_repos(n, seed=seed)])
+
+
+class TestExact(unittest.TestCase):
+    """box_stats()."""
+
+    def test_small(self):
+        stats = quantile_sketch.box_stats([1, 2, 3, 4, 5, 6, 7, 8, 100, 200])
+        self.assertEqual((stats["q1"], stats["median"], stats["q3"]), (3.25, 5.5, 7.75))
+        self.assertEqual((stats["lowerfence"], stats["upperfence"]), (1.0, 8.0))
+        self.assertEqual(stats["outliers"], [100.0, 200.0])
+        self.assertTrue(stats["exact"])
+        self.assertEqual(quantile_sketch.box_stats([])["count"], 0)
+
+    def test_outliers_capped(self):
+        stars = _stars(20_000, seed=1)
+        stats = quantile_sketch.box_stats(stars, max_outliers=50)
+        self.assertGreater(stats["outliers_total"], 50)
+        self.assertEqual(len(stats["outliers"]), 50)
+        self.assertEqual(stats["outliers"][-1], stars.max())  # the most extreme are kept
+
+
+class TestDigest(unittest.TestCase):
+    """TDigest estimates, merging and serialisation."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.stars = _stars(200_000, seed=2)
+        cls.exact = quantile_sketch.box_stats(cls.stars)
+
+    def assertClose(self, estimate, exact):
+        for key in ("q1", "median", "q3", "upperfence"):
+            self.assertAlmostEqual(estimate[key], exact[key], delta=0.02 * exact[key], msg=key)
+
+    def test_accuracy(self):
+        digest = quantile_sketch.TDigest.of(self.stars)
+        self.assertLessEqual(len(digest.means), quantile_sketch.COMPRESSION)
+        estimate = digest.box_stats()
+        self.assertFalse(estimate["exact"])
+        self.assertEqual(estimate["count"], len(self.stars))
+        self.assertClose(estimate, self.exact)
+        self.assertAlmostEqual(estimate["outliers_total"], self.exact["outliers_total"],
+                               delta=0.05 * self.exact["outliers_total"])
+        self.assertEqual(max(estimate["outliers"]), self.stars.max())
+
+    def test_merge_shards(self):
+        shuffled = np.random.default_rng(0).permutation(self.stars)
+        shards = [quantile_sketch.TDigest.of(part) for part in np.array_split(shuffled, 16)]
+        restored = [quantile_sketch.TDigest.from_dict(json.loads(json.dumps(d.to_dict()))) for d in shards]
+        merged = quantile_sketch.merge_all(restored)
+        self.assertEqual(merged.count, len(self.stars))
+        self.assertClose(merged.box_stats(), self.exact)
+        np.testing.assert_array_equal(merged.high, np.sort(self.stars)[-quantile_sketch.MAX_OUTLIERS:])
+
+    def test_merge_small_shards(self):
+        stars = _stars(370, seed=4)
+        shards = [quantile_sketch.TDigest.of(part) for part in np.array_split(stars, [170])]
+        merged = quantile_sketch.merge_all(shards)
+        self.assertEqual(merged.box_stats(), quantile_sketch.box_stats(stars))  # all values are stored
+        many = _stars(3000, seed=5)
+        merged = quantile_sketch.merge_all(quantile_sketch.TDigest.of(part) for part in np.array_split(many, 60))
+        np.testing.assert_array_equal(merged.low, np.sort(many)[:quantile_sketch.MAX_OUTLIERS])
+        np.testing.assert_array_equal(merged.high, np.sort(many)[-quantile_sketch.MAX_OUTLIERS:])
+
+    def test_star_box_stats_switches(self):
+        small = quantile_sketch.star_box_stats(self.stars[:1000])
+        self.assertTrue(small["exact"])
+        self.assertFalse(quantile_sketch.star_box_stats(self.stars[:1000], exact_limit=500)["exact"])
+
+
+class TestFigure(unittest.TestCase):
+    """star_box_plot() from precomputed statistics."""
+
+    def test_payload_bounded(self):
+        sizes = []
+        for n in (10_000, 200_000):
+            fig = dashboard_figures.star_box_plot(quantile_sketch.star_box_stats(_stars(n, seed=3)))
+            box = fig.data[0]
+            self.assertEqual(box.type, "box")
+            self.assertIsNone(box.y)  # no raw values, only the statistics
+            self.assertLessEqual(len(fig.data[1].y), 2 * quantile_sketch.MAX_OUTLIERS)
+            sizes.append(len(fig.to_json()))
+        self.assertLess(sizes[1], 2 * sizes[0])
+        self.assertLess(sizes[1], 30_000)
+        self.assertIn("t-digest", fig.layout.annotations[0].text)
+
+    def test_empty(self):
+        fig = dashboard_figures.star_box_plot(quantile_sketch.box_stats([]))
+        self.assertEqual(len(fig.data), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
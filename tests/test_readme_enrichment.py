@@ -0,0 +1,140 @@
+"""
+Tests for the optional README enrichment stage (readme_enrichment.py).
+
+This module tests:
+1. READMEs are fetched concurrently from the local GitHub stand-in and cached by blob SHA
+2. Later runs send no request for unchanged repos and conditional requests (304) otherwise
+3. A changed README is downloaded again
+4. Running out of rate limit skips the remaining repos instead of failing
+5. The classifier picks up categories mentioned only in the README
+6. The app's page load skips repos past the rate limit instead of waiting for the reset
+
+Usage:
+    python tests/test_readme_enrichment.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import readme_enrichment
+import snapshot_utils
+from github_stub_server import start_stub_server
+from keyword_analysis import categorize_repos
+from synthetic_repos import generate_repos
+
+
+class TestReadmeEnrichment(unittest.TestCase):
+    """Enrichment against github_stub_server.py."""
+
+    def setUp(self):
+        self.repos = generate_repos(60, seed=4)
+        self.server, self.base = start_stub_server(repos=self.repos, core_limit=10**6)
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def _enrich(self, repos, **kwargs):
+        return readme_enrichment.enrich_repos(repos, api_base=self.base, cache_dir=self.tmp.name, **kwargs)
+
+    def _readme_requests(self):
+        return [entry for entry in self.server.state.request_log if entry[1].endswith("/readme")]
+
+    def test_fetch_and_cache(self):
+        repos = [dict(r) for r in self.repos]
+        stats = self._enrich(repos)
+        self.assertEqual(stats["downloaded"], 60)
+        self.assertTrue(all(r["readme_excerpt"] for r in repos))
+        self.assertNotIn("npm install", repos[0]["readme_excerpt"])  # code blocks are dropped
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "index.json")))
+
+        # Same pushed_at: no requests at all
+        requests_before = len(self._readme_requests())
+        repos = [dict(r) for r in self.repos]
+        self.assertEqual(self._enrich(repos)["cached"], 60)
+        self.assertEqual(len(self._readme_requests()), requests_before)
+        self.assertTrue(all(r["readme_excerpt"] for r in repos))
+
+        # New pushes but unchanged READMEs: conditional requests, nothing downloaded
+        pushed = [dict(r, pushed_at="2099-01-01T00:00:00Z") for r in self.repos]
+        self.assertEqual(self._enrich(pushed)["not_modified"], 60)
+        self.assertTrue(all(status == 304 for _, _, status in self._readme_requests()[requests_before:]))
+
+    def test_changed_readme_is_downloaded(self):
+        self._enrich([dict(r) for r in self.repos])
+        target = self.repos[0]
+        self.server.state.files[(target["full_name"], "main", "README.md")] = {
+            "sha": "x", "content": b"# New\n\nNow with UML class diagrams.", "message": "update"}
+        repos = [dict(r, pushed_at="2099-01-01T00:00:00Z") for r in self.repos]
+        stats = self._enrich(repos)
+        self.assertEqual(stats["downloaded"], 1)
+        self.assertEqual(stats["not_modified"], 59)
+        self.assertIn("UML class diagrams", repos[0]["readme_excerpt"])
+
+    def test_rate_limit_skips(self):
+        self.server.state.update_config({"core_limit": 10})
+        stats = self._enrich([dict(r) for r in self.repos], max_wait=0, max_workers=4)
+        self.assertEqual(stats["downloaded"], 10)
+        self.assertEqual(stats["skipped"], 50)
+
+    def test_missing_readme(self):
+        repos = [{"name": "ghost", "html_url": "https://github.com/nobody/ghost", "pushed_at": "2025-01-01"}]
+        self.assertEqual(self._enrich(repos)["missing"], 1)
+        self.assertNotIn("readme_excerpt", repos[0])
+
+
+class TestClassifierUsesExcerpt(unittest.TestCase):
+    """README text feeds the keyword analysis."""
+
+    def test_uml_from_readme(self):
+        repo = {"name": "designer", "description": "A visual app builder", "topics": [],
+                "html_url": "https://github.com/o/designer"}
+        self.assertEqual(categorize_repos([repo], "uml")[0], [])
+        repo["readme_excerpt"] = readme_enrichment.readme_excerpt(
+            "# Designer\n\n![badge](https://img.shields.io/x.svg)\n\nDraw UML diagrams and generate code.")
+        self.assertEqual(categorize_repos([repo], "uml")[0], [repo])
+        self.assertNotIn("shields", repo["readme_excerpt"])
+
+
+class TestAppEnrichment(unittest.TestCase):
+    """README enrichment during an app page load."""
+
+    def test_rate_limit_does_not_block(self):
+        from streamlit.testing.v1 import AppTest
+
+        app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+        # Ten README requests a minute for a few hundred repos
+        server, base = start_stub_server(repos=generate_repos(300, seed=21), core_limit=10, window_seconds=60)
+        try:
+            with tempfile.TemporaryDirectory() as tmp, \
+                    patch.object(snapshot_utils, "GITHUB_API_BASE", base), \
+                    patch.object(snapshot_utils, "SNAPSHOTS_DIR", tmp), \
+                    patch.object(readme_enrichment, "ENABLED", True), \
+                    patch.object(readme_enrichment, "CACHE_DIR", tmp):
+                at = AppTest.from_file(app_path, default_timeout=300)
+                at.session_state.snapshot_taken = True
+                start = time.monotonic()
+                at.run()
+                elapsed = time.monotonic() - start
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertFalse(at.exception)
+        self.assertTrue(at.session_state.data_from_live_api)
+        self.assertLess(elapsed, 30)  # the reset is a minute away
+        excerpts = [repo for repo in at.session_state.repos if repo.get("readme_excerpt")]
+        self.assertTrue(0 < len(excerpts) <= 10)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
@@ -0,0 +1,145 @@
+"""
+Tests for the chunked repo export (repo_export.py), its data API endpoint and the app's export control.
+
+This module tests:
+1. Rows use the snapshot columns plus category flags that match the Repository Analysis
+2. CSV reads back as a snapshot and does not depend on the chunk size; JSONL and Parquet keep types
+3. Exports are produced lazily, one chunk of repos at a time
+4. /v1/export streams the filtered list and rejects unknown formats
+5. The app builds the export only when "Prepare export" is clicked
+
+Usage:
+    python tests/test_repo_export.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+from datetime import datetime
+from unittest.mock import patch
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repo_export
+import snapshot_utils
+from data_api import start_data_api
+from keyword_analysis import categorize_repos
+from synthetic_repos import generate_repos
+
+
+class TestRows(unittest.TestCase):
+    """export_chunks() and export_columns()."""
+
+    def test_columns_and_flags(self):
+        repos = generate_repos(500, seed=14)
+        repos[3]["release_count"] = 7
+        rows = [row for chunk in repo_export.export_chunks(repos, chunk_rows=64) for row in chunk]
+        self.assertEqual(list(rows[0]), repo_export.export_columns(repos))
+        self.assertIn("Releases", rows[0])
+        self.assertEqual((rows[3]["Releases"], rows[0]["Releases"]), (7, ""))
+        for category, column in repo_export.CATEGORY_COLUMNS.items():
+            members = {r["html_url"] for r in categorize_repos(repos, category)[0]}
+            self.assertEqual({row["URL"] for row in rows if row[column]}, members)
+
+
+class TestFormats(unittest.TestCase):
+    """iter_export() in each format."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.repos = generate_repos(1200, seed=15)
+
+    def _export(self, fmt, chunk_rows=repo_export.CHUNK_ROWS):
+        return b"".join(repo_export.iter_export(self.repos, fmt, chunk_rows=chunk_rows))
+
+    def test_csv(self):
+        data = self._export("csv", chunk_rows=100)
+        self.assertEqual(data, self._export("csv"))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "export.csv")
+            with open(path, "wb") as f:
+                f.write(data)
+            back = snapshot_utils.load_snapshot_repos(path)
+        self.assertEqual([(r["name"], r["stargazers_count"]) for r in back],
+                         [(r["name"], r["stargazers_count"]) for r in self.repos])
+
+    def test_jsonl(self):
+        lines = self._export("jsonl", chunk_rows=500).decode("utf-8").splitlines()
+        self.assertEqual(len(lines), len(self.repos))
+        first = json.loads(lines[0])
+        self.assertEqual(first["Stars⭐"], self.repos[0]["stargazers_count"])
+        self.assertIsInstance(first["Mentions ai"], bool)
+
+    def test_parquet(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(io.BytesIO(self._export("parquet", chunk_rows=500)))
+        self.assertEqual(parquet.metadata.num_rows, len(self.repos))
+        self.assertEqual(parquet.num_row_groups, 3)
+        self.assertEqual(parquet.schema_arrow.field("Stars⭐").type, pa.int64())
+        self.assertEqual(parquet.schema_arrow.field("Mentions uml").type, pa.bool_())
+
+    def test_lazy(self):
+        with patch.object(snapshot_utils, "repo_to_row", wraps=snapshot_utils.repo_to_row) as to_row:
+            chunks = repo_export.iter_export(self.repos, "jsonl", chunk_rows=100)
+            self.assertEqual(to_row.call_count, 0)
+            next(chunks)
+            self.assertEqual(to_row.call_count, 100)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            repo_export.iter_export(self.repos, "xml")
+
+
+class TestExportEndpoint(unittest.TestCase):
+    """/v1/export in data_api.py."""
+
+    def test_stream(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "snapshot-2026-01-01.csv")
+            snapshot_utils.repos_to_csv(generate_repos(300, seed=16), path)
+            server, base = start_data_api(snapshot_path=path)
+            try:
+                with urllib.request.urlopen(f"{base}/v1/export?format=jsonl&min_stars=500&min_date=2000-01-01") as r:
+                    lines = r.read().decode("utf-8").splitlines()
+                    self.assertEqual(r.headers["Content-Type"], "application/x-ndjson")
+                    self.assertEqual(int(r.headers["X-Total-Count"]), len(lines))
+                with self.assertRaises(urllib.error.HTTPError) as e:
+                    urllib.request.urlopen(f"{base}/v1/export?format=xml")
+                self.assertEqual(e.exception.code, 400)
+            finally:
+                server.shutdown()
+                server.server_close()
+        self.assertTrue(lines)
+        self.assertTrue(all(json.loads(line)["Stars⭐"] >= 500 for line in lines))
+
+
+class TestAppExport(unittest.TestCase):
+    """The export control under the repository table."""
+
+    def test_prepare_export(self):
+        from streamlit.testing.v1 import AppTest
+
+        app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+        with patch.object(snapshot_utils, "GITHUB_API_BASE", "http://127.0.0.1:9"):
+            at = AppTest.from_file(app_path, default_timeout=60)
+            at.session_state.today = datetime(2025, 6, 7)  # the bundled snapshot's default view
+            at.run()
+            self.assertEqual(len(at.get("download_button")), 0)
+            at.selectbox(key="export_format").set_value("parquet")
+            at.button(key="prepare_export").click().run()
+
+        self.assertFalse(at.exception)
+        [button] = at.get("download_button")
+        self.assertEqual(button.proto.label, f"Download {len(at.dataframe[0].value)} repositories (.parquet)")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
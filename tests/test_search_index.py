@@ -0,0 +1,103 @@
+"""
+Tests for the full-text search index (search_index.py).
+
+This module tests:
+1. Word-boundary tokenization (no match inside longer words), also for topics
+2. BM25 ranking: all terms must match, name hits outrank description hits
+3. Dataset versions change when indexed fields change
+4. Query latency on 100k synthetic repos
+
+Usage:
+    python tests/test_search_index.py
+"""
+
+import os
+import sys
+import time
+import unittest
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search_index import SearchIndex, dataset_version, tokenize
+from synthetic_repos import generate_repos
+
+
+def _repo(name, description="", topics=()):
+    return {"name": name, "description": description, "topics": list(topics),
+            "html_url": f"https://github.com/o/{name}"}
+
+
+REPOS = [
+    _repo("home-remodel", "Plan a house remodel"),
+    _repo("modeler", "A UML model editor", ["uml", "model-driven"]),
+    _repo("flowy", "Workflow automation for teams", ["low-code", "workflow"]),
+    _repo("workflow-engine", "Runs jobs"),
+]
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Matching and ranking on a hand-made dataset."""
+
+    def setUp(self):
+        self.index = SearchIndex(REPOS)
+
+    def _names(self, query):
+        positions, _ = self.index.search(query)
+        return [REPOS[p]["name"] for p in positions]
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("No-Code UML_tool, v2"), ["no", "code", "uml_tool", "v2"])
+
+    def test_word_boundaries(self):
+        self.assertEqual(self._names("model"), ["modeler"])
+        self.assertEqual(self._names("remodel"), ["home-remodel"])
+
+    def test_topics(self):
+        self.assertEqual(self._names("model-driven"), ["modeler"])
+        self.assertEqual(self._names("driven"), ["modeler"])
+        self.assertEqual(self._names("low-code"), ["flowy"])
+        # A topic is only its words: "low-code" and "low", "code" index (and score) the same
+        repos = [_repo("a", "", ["low-code"]), _repo("b", "", ["low", "code"]), _repo("c", "A low code tool")]
+        positions, scores = SearchIndex(repos).search("low-code")
+        self.assertEqual(sorted(positions.tolist()), [0, 1, 2])
+        self.assertEqual(scores[0], scores[1])
+
+    def test_all_terms_required(self):
+        self.assertEqual(self._names("workflow automation"), ["flowy"])
+        self.assertEqual(self._names("workflow nonexistent"), [])
+        self.assertEqual(self._names("   "), [])
+
+    def test_name_outranks_description(self):
+        names = self._names("workflow")
+        self.assertEqual(names[0], "workflow-engine")
+        self.assertIn("flowy", names)
+
+    def test_limit(self):
+        positions, scores = self.index.search("workflow", limit=1)
+        self.assertEqual(len(positions), 1)
+        self.assertEqual(len(scores), 1)
+
+    def test_dataset_version(self):
+        self.assertEqual(dataset_version(REPOS), dataset_version([dict(r) for r in REPOS]))
+        changed = [dict(r) for r in REPOS]
+        changed[0]["description"] = "Something else"
+        self.assertNotEqual(dataset_version(REPOS), dataset_version(changed))
+
+
+class TestSearchLatency(unittest.TestCase):
+    """Queries stay in the millisecond range at 100k repos."""
+
+    def test_100k_queries(self):
+        repos = generate_repos(100_000, seed=1)
+        index = SearchIndex(repos)
+        for query in ("low code", "workflow automation", "uml"):
+            start = time.perf_counter()
+            index.search(query)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.assertLess(elapsed_ms, 100, query)
+            print(f"[OK] {query!r}: {elapsed_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
@@ -0,0 +1,255 @@
+"""
+Tests for the search profiles (search_profiles.py, search_profiles.toml) and their use in
+take_snapshot.py and the app.
+
+This module tests:
+1. Profiles load in file order with defaults; the bundled file holds the app's quoted low-code query
+2. Merged results keep each repo once, with per-profile membership and exclusions
+3. Memberships round-trip through the snapshot's Profiles column; older snapshots join the default profile
+4. Concurrent crawls of two profiles request each distinct search once and take_snapshot stores both
+5. The app switches profiles without new API calls; ?search_profile= preselects one
+6. An exhausted search rate limit sends the app to the snapshot at once instead of waiting for the reset
+
+Usage:
+    python tests/test_search_profiles.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from unittest.mock import patch
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import crawl_journal
+import search_profiles
+import snapshot_utils
+import static_report
+import take_snapshot
+from github_stub_server import start_stub_server
+from synthetic_repos import generate_repos
+
+TWO_PROFILES = """
+[profiles.low-code]
+title = "Low-code tools"
+queries = ['"low-code"', 'lowcode']
+exclude = ["{excluded}"]
+
+[profiles.popular]
+title = "Popular tools"
+queries = ['"low-code"', 'nocode']
+min_stars = 500
+"""
+
+
+def _write_profiles(directory, excluded="none"):
+    path = os.path.join(directory, "profiles.toml")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(TWO_PROFILES.replace("{excluded}", excluded))
+    return path
+
+
+class TestLoad(unittest.TestCase):
+    """load_profiles()."""
+
+    def test_two_profiles(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            low_code, popular = search_profiles.load_profiles(_write_profiles(tmp))
+        self.assertEqual((low_code.name, popular.name), ("low-code", "popular"))
+        self.assertEqual((low_code.min_stars, low_code.active_days, popular.min_stars), (50, 365, 500))
+        self.assertEqual(popular.title, "Popular tools")
+        self.assertRegex(popular.full_query("nocode"), r"^nocode stars:>=500 pushed:>=\d{4}-\d{2}-\d{2}$")
+
+    def test_invalid(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "profiles.toml")
+            for config in ("[profiles.x]\nqueries = ['a']\nstars = 5\n", "[profiles.x]\ntitle = 'X'\n", ""):
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(config)
+                os.utime(path, (0, len(config)))  # a new mtime per config, however fast the writes
+                with self.assertRaises(ValueError):
+                    search_profiles.load_profiles(path)
+
+    def test_bundled(self):
+        [profile] = search_profiles.load_profiles()
+        self.assertEqual(profile.queries, ('"low-code" OR "lowcode" OR "low code"',))
+        self.assertTrue({"JeecgBoot", "Palu", "Liuma-platform", "pocketblocks", "plugins"} <= profile.exclude)
+        self.assertEqual(take_snapshot.search_query(), profile.full_query(profile.queries[0]))
+
+
+class TestMembership(unittest.TestCase):
+    """merge_profiles(), apply_profiles() and the Profiles column."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repos = generate_repos(40, seed=17)
+        self.profiles = search_profiles.load_profiles(_write_profiles(self.tmp.name, self.repos[0]["name"]))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_merge(self):
+        copies = [dict(repo) for repo in self.repos[:20]]  # the same repos, as found by another search
+        merged = search_profiles.merge_profiles(
+            self.profiles, {"low-code": self.repos[:30], "popular": copies + self.repos[30:]})
+        self.assertEqual(len(merged), 40)
+        self.assertEqual(len({repo["id"] for repo in merged}), 40)
+        by_id = {repo["id"]: repo["profiles"] for repo in merged}
+        self.assertEqual(by_id[self.repos[0]["id"]], ["popular"])  # excluded from low-code only
+        self.assertEqual(by_id[self.repos[5]["id"]], ["low-code", "popular"])
+        self.assertEqual(by_id[self.repos[25]["id"]], ["low-code"])
+        stars = [repo["stargazers_count"] for repo in merged]
+        self.assertEqual(stars, sorted(stars, reverse=True))
+        self.assertEqual(search_profiles.merge_profiles(self.profiles[:1], {"low-code": self.repos[:1]}), [])
+
+    def test_snapshot_round_trip(self):
+        merged = search_profiles.merge_profiles(
+            self.profiles, {"low-code": self.repos[:30], "popular": self.repos[20:]})
+        path = os.path.join(self.tmp.name, "snapshot-2026-01-01.csv")
+        snapshot_utils.repos_to_csv(merged, path)
+        loaded = snapshot_utils.load_snapshot_repos(path)
+        self.assertEqual([repo["profiles"] for repo in loaded], [repo["profiles"] for repo in merged])
+        self.assertEqual(len(search_profiles.members(loaded, "popular")), 20)
+
+    def test_old_snapshot(self):
+        path = os.path.join(self.tmp.name, "snapshot-2025-01-01.csv")
+        snapshot_utils.repos_to_csv(self.repos, path)
+        loaded = snapshot_utils.load_snapshot_repos(path)
+        self.assertNotIn("profiles", loaded[0])
+        applied = search_profiles.apply_profiles(loaded, self.profiles)
+        self.assertEqual(len(applied), 39)  # repos[0] is excluded from the default profile
+        self.assertTrue(all(repo["profiles"] == ["low-code"] for repo in applied))
+
+
+class TestCrawl(unittest.TestCase):
+    """crawl_profiles() and take_snapshot() against github_stub_server.py."""
+
+    def setUp(self):
+        self.repos = generate_repos(400, seed=18)
+        self.server, base = start_stub_server(repos=self.repos)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.patches = [
+            patch.object(take_snapshot, "GITHUB_API_URL", f"{base}/search/repositories"),
+            patch.object(search_profiles, "PROFILES_PATH", _write_profiles(self.tmp.name)),
+            patch.object(static_report, "REPORT_DIR", os.path.join(self.tmp.name, "report")),
+            patch.object(crawl_journal, "JOURNAL_DIR", os.path.join(self.tmp.name, "journal")),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def _first_pages(self):
+        return [path for _, path, _ in self.server.state.request_log if path.endswith("&page=1")]
+
+    def test_crawl_profiles(self):
+        profiles = search_profiles.load_profiles()
+        with redirect_stdout(StringIO()):
+            repos, crawls = search_profiles.crawl_profiles(
+                profiles, lambda q, gate: take_snapshot.crawl(q, gate=gate))
+        self.assertEqual(len(crawls), 4)  # '"low-code"' at two thresholds, lowcode, nocode
+        self.assertEqual(len(self._first_pages()), 4)
+        self.assertTrue(all(stats["complete"] for stats in crawls.values()))
+        self.assertEqual(len({repo["id"] for repo in repos}), len(repos))
+        found = self.server.state.search(profiles[0].full_query("x"))
+        self.assertEqual(len(repos), len(found))
+        for repo in repos:
+            self.assertEqual(repo["profiles"], ["low-code", "popular"] if repo["stargazers_count"] >= 500
+                             else ["low-code"])
+
+    def test_take_snapshot(self):
+        with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+            path = take_snapshot.take_snapshot(self.tmp.name)
+        saved = snapshot_utils.load_snapshot_repos(path)
+        popular = search_profiles.members(saved, "popular")
+        self.assertTrue(0 < len(popular) < len(saved))
+        report = static_report.load_report_for(static_report.view_digest(static_report.default_view(
+            search_profiles.members(saved, "low-code"))), os.path.join(self.tmp.name, "report", "report.json"))
+        self.assertIsNotNone(report)
+        self.assertEqual(os.listdir(os.path.join(self.tmp.name, "journal")), [])  # every journal discarded
+
+
+class TestAppProfiles(unittest.TestCase):
+    """The Profile selector in app.py."""
+
+    def test_switch_without_api_calls(self):
+        from streamlit.testing.v1 import AppTest
+
+        app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+        server, base = start_stub_server(repos=generate_repos(300, seed=19))
+        try:
+            with tempfile.TemporaryDirectory() as tmp, \
+                    patch.object(snapshot_utils, "GITHUB_API_BASE", base), \
+                    patch.object(snapshot_utils, "SNAPSHOTS_DIR", tmp), \
+                    patch.object(search_profiles, "PROFILES_PATH", _write_profiles(tmp)):
+                at = AppTest.from_file(app_path, default_timeout=60)
+                at.session_state.snapshot_taken = True  # keep the live crawl out of snapshots/
+                at.run()
+                self.assertTrue(at.session_state.data_from_live_api)
+                requests_made = len(server.state.request_log)
+                everything = len(at.dataframe[0].value)
+                at.selectbox(key="search_profile").set_value("popular").run()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertFalse(at.exception)
+        self.assertEqual(len(server.state.request_log), requests_made)
+        popular = at.dataframe[0].value
+        self.assertTrue(0 < len(popular) < everything)
+        self.assertTrue((popular["Stars⭐"] >= 500).all())
+
+    def test_query_param(self):
+        from streamlit.testing.v1 import AppTest
+
+        app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(snapshot_utils, "GITHUB_API_BASE", "http://127.0.0.1:9"), \
+                patch.object(snapshot_utils, "SNAPSHOTS_DIR", tmp), \
+                patch.object(search_profiles, "PROFILES_PATH", _write_profiles(tmp)):
+            at = AppTest.from_file(app_path, default_timeout=60)
+            at.query_params["search_profile"] = "popular"
+            at.query_params["profile"] = "popular"  # the admin profiler switch stays off without ADMIN_SECRET
+            at.run()
+
+        self.assertFalse(at.exception)
+        self.assertEqual(at.selectbox(key="search_profile").value, "popular")
+
+    def test_rate_limit_falls_back_without_waiting(self):
+        from streamlit.testing.v1 import AppTest
+
+        app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+        # Two searches a minute: the crawl runs out long before the four searches are done
+        server, base = start_stub_server(repos=generate_repos(300, seed=20), search_limit=2, window_seconds=60)
+        try:
+            with tempfile.TemporaryDirectory() as tmp, \
+                    patch.object(snapshot_utils, "GITHUB_API_BASE", base), \
+                    patch.object(snapshot_utils, "SNAPSHOTS_DIR", tmp), \
+                    patch.object(search_profiles, "PROFILES_PATH", _write_profiles(tmp)):
+                at = AppTest.from_file(app_path, default_timeout=120)
+                at.session_state.snapshot_taken = True
+                start = time.monotonic()
+                at.run()
+                elapsed = time.monotonic() - start
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertFalse(at.exception)
+        self.assertFalse(at.session_state.data_from_live_api)
+        self.assertTrue(any("rate limit" in error.value for error in at.error))
+        self.assertLess(elapsed, 30)  # the reset is a minute away
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
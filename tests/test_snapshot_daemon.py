@@ -0,0 +1,160 @@
+"""
+Tests for the scheduled refresh daemon (take_snapshot.py --daemon) and its helpers in snapshot_utils.py.
+
+This module tests:
+1. The crawl lock is exclusive and released on exit
+2. The reload marker announces a snapshot, ignores removed ones and expires without refreshes
+3. Two daemons sharing a directory crawl once, write the snapshot and report, and signal a reload;
+   a one-shot snapshot signals nothing
+4. A running app session loads the announced snapshot and reloads when a new one is signalled
+
+Usage:
+    python tests/test_snapshot_daemon.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import patch
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import crawl_journal
+import snapshot_utils
+import static_report
+import take_snapshot
+from github_stub_server import start_stub_server
+from synthetic_repos import generate_repos
+
+
+class TestLockAndMarker(unittest.TestCase):
+    """crawl_lock(), signal_reload() and reload_marker()."""
+
+    def test_crawl_lock_is_exclusive(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with snapshot_utils.crawl_lock(tmp) as first:
+                with snapshot_utils.crawl_lock(tmp) as second:
+                    self.assertTrue(first)
+                    self.assertFalse(second)
+            with snapshot_utils.crawl_lock(tmp) as again:
+                self.assertTrue(again)
+
+    def test_reload_marker(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(snapshot_utils.reload_marker(tmp))
+            path = os.path.join(tmp, "snapshot-2026-01-01.csv")
+            snapshot_utils.repos_to_csv(generate_repos(5), path)
+            snapshot_utils.signal_reload(path, tmp)
+            mtime, announced = snapshot_utils.reload_marker(tmp)
+            self.assertEqual(announced, path)
+            self.assertAlmostEqual(mtime, time.time(), delta=5)
+            self.assertEqual(sorted(os.listdir(tmp)), [".reload", "snapshot-2026-01-01.csv"])  # no temp files left
+            os.remove(path)
+            self.assertIsNone(snapshot_utils.reload_marker(tmp))
+
+    def test_reload_marker_expires(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "snapshot-2026-01-01.csv")
+            snapshot_utils.repos_to_csv(generate_repos(5), path)
+            marker = snapshot_utils.signal_reload(path, tmp, interval=60)
+            self.assertIsNotNone(snapshot_utils.reload_marker(tmp))
+            earlier = time.time() - 60 * snapshot_utils.MARKER_TTL_INTERVALS - 5
+            os.utime(marker, (earlier, earlier))  # the daemon stopped refreshing
+            self.assertIsNone(snapshot_utils.reload_marker(tmp))
+            with open(marker, "w", encoding="utf-8") as f:
+                json.dump({"snapshot": os.path.basename(path)}, f)  # written before markers had an interval
+            self.assertIsNone(snapshot_utils.reload_marker(tmp))
+
+
+class TestDaemon(unittest.TestCase):
+    """run_daemon() against github_stub_server.py."""
+
+    def setUp(self):
+        self.server, base = start_stub_server(repos=generate_repos(250, seed=6))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.patches = [
+            patch.object(take_snapshot, "GITHUB_API_URL", f"{base}/search/repositories"),
+            patch.object(static_report, "REPORT_DIR", os.path.join(self.tmp.name, "report")),
+            patch.object(crawl_journal, "JOURNAL_DIR", os.path.join(self.tmp.name, "journal")),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def test_replicas_crawl_once(self):
+        stop = threading.Event()
+        daemons = [threading.Thread(target=take_snapshot.run_daemon, args=(3600, self.tmp.name, stop),
+                                    kwargs={"poll": 0.1}) for _ in range(2)]
+        with redirect_stdout(StringIO()):
+            for daemon in daemons:
+                daemon.start()
+            deadline = time.time() + 30
+            while snapshot_utils.reload_marker(self.tmp.name) is None and time.time() < deadline:
+                time.sleep(0.1)
+            time.sleep(0.5)  # both daemons have seen the fresh marker by now
+            stop.set()
+            for daemon in daemons:
+                daemon.join(10)
+
+        marker = snapshot_utils.reload_marker(self.tmp.name)
+        self.assertIsNotNone(marker)
+        saved = snapshot_utils.load_snapshot_repos(marker[1])
+        self.assertTrue(saved)
+        self.assertTrue(all(repo["stargazers_count"] >= 50 for repo in saved))  # the crawl's stars:>=50
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "report", "report.json")))
+        first_pages = [path for _, path, _ in self.server.state.request_log if path.endswith("&page=1")]
+        self.assertEqual(len(first_pages), 1)  # one crawl between the two daemons
+
+    def test_one_shot_does_not_signal(self):
+        with redirect_stdout(StringIO()):
+            path = take_snapshot.take_snapshot(self.tmp.name)
+        self.assertTrue(os.path.exists(path))
+        self.assertIsNone(snapshot_utils.reload_marker(self.tmp.name))
+
+
+class TestAppReload(unittest.TestCase):
+    """An app session follows the reload marker instead of crawling."""
+
+    def test_session_reloads(self):
+        from streamlit.testing.v1 import AppTest
+
+        app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+        repos = generate_repos(120, seed=7)
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(snapshot_utils, "GITHUB_API_BASE", "http://127.0.0.1:9"), \
+                patch.object(snapshot_utils, "SNAPSHOTS_DIR", tmp):
+            first = os.path.join(tmp, "snapshot-2026-01-01.csv")
+            snapshot_utils.repos_to_csv(repos, first)
+            snapshot_utils.signal_reload(first, tmp)
+
+            at = AppTest.from_file(app_path, default_timeout=60)
+            at.run()
+            self.assertFalse(at.exception)
+            self.assertEqual(len(at.session_state.repos), 120)
+            self.assertFalse(at.session_state.data_from_live_api)
+
+            second = os.path.join(tmp, "snapshot-2026-01-02.csv")
+            snapshot_utils.repos_to_csv(repos[:80], second)
+            marker = snapshot_utils.signal_reload(second, tmp)
+            later = time.time() + 10
+            os.utime(marker, (later, later))  # a distinct mtime even on coarse-grained filesystems
+            at.run()
+            self.assertFalse(at.exception)
+            self.assertEqual(len(at.session_state.repos), 80)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
@@ -0,0 +1,90 @@
+"""
+Tests for the snapshot diff (snapshot_diff.py).
+
+This module tests:
+1. Added, removed, renamed (same URL / moved URL) and star-jump records
+2. Star-jump thresholds
+3. The bundled snapshots: repos that moved to a new owner are reported as renamed
+
+Usage:
+    python tests/test_snapshot_diff.py
+"""
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import snapshot_utils
+from snapshot_diff import diff_rows, diff_snapshots
+
+
+def _row(name, url, stars, first_commit="2020-01-01"):
+    return {"Name": name, "URL": url, "Stars⭐": str(stars), "First Commit": first_commit}
+
+
+class TestDiffRows(unittest.TestCase):
+    """Change records on small hand-made inputs."""
+
+    def test_change_types(self):
+        old = [
+            _row("keep", "https://github.com/o/keep", 1000),
+            _row("jump", "https://github.com/o/jump", 1000),
+            _row("oldname", "https://github.com/o/same-url", 500),
+            _row("mover", "https://github.com/old-owner/mover", 700, "2019-05-05"),
+            _row("gone", "https://github.com/o/gone", 300),
+        ]
+        new = [
+            _row("keep", "https://github.com/O/Keep/", 1010),
+            _row("jump", "https://github.com/o/jump", 2000),
+            _row("newname", "https://github.com/o/same-url", 500),
+            _row("mover", "https://github.com/new-owner/mover", 720, "2019-05-05"),
+            _row("fresh", "https://github.com/o/fresh", 50),
+        ]
+        changes = list(diff_rows(old, new))
+        by_kind = {}
+        for change in changes:
+            by_kind.setdefault(change["change"], []).append(change)
+
+        self.assertEqual([c["name"] for c in by_kind["added"]], ["fresh"])
+        self.assertEqual([c["name"] for c in by_kind["removed"]], ["gone"])
+        renamed = {c["old_name"]: c for c in by_kind["renamed"]}
+        self.assertEqual(renamed["oldname"]["name"], "newname")
+        self.assertEqual(renamed["mover"]["old_url"], "https://github.com/old-owner/mover")
+        self.assertEqual(renamed["mover"]["url"], "https://github.com/new-owner/mover")
+        self.assertEqual([(c["name"], c["star_delta"]) for c in by_kind["stars"]], [("jump", 1000)])
+
+    def test_same_identity_new_repo_is_added(self):
+        """A new URL only counts as a move if the old URL is gone."""
+        old = [_row("tool", "https://github.com/a/tool", 100)]
+        new = [_row("tool", "https://github.com/b/tool", 100), _row("tool", "https://github.com/a/tool", 100)]
+        kinds = sorted(c["change"] for c in diff_rows(old, new))
+        self.assertEqual(kinds, ["added"])
+
+    def test_star_thresholds(self):
+        old = [_row("big", "https://github.com/o/big", 100000), _row("small", "https://github.com/o/small", 10)]
+        new = [_row("big", "https://github.com/o/big", 100500), _row("small", "https://github.com/o/small", 60)]
+        self.assertEqual(list(diff_rows(old, new)), [])
+        names = [c["name"] for c in diff_rows(old, new, min_delta=50, min_pct=0)]
+        self.assertEqual(sorted(names), ["big", "small"])
+
+
+class TestBundledSnapshots(unittest.TestCase):
+    """Diff of the snapshots shipped in snapshots/."""
+
+    def test_latest_pair(self):
+        snapshots = snapshot_utils.list_snapshots()
+        if len(snapshots) < 2:
+            self.skipTest("fewer than two bundled snapshots")
+        (_, old_path), (_, new_path) = snapshots[-2:]
+        changes = list(diff_snapshots(old_path, new_path))
+        self.assertTrue(changes)
+        urls = [c["url"] for c in changes if c["change"] in ("added", "removed")]
+        self.assertEqual(len(urls), len(set(urls)))
+        print(f"[OK] {len(changes)} changes between the two latest snapshots")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
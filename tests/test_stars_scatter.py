@@ -0,0 +1,99 @@
+"""
+Tests for the stars scatter (dashboard_data.scatter_points / dashboard_figures.stars_scatter).
+
+This module tests:
+1. Small lists are plotted point for point, with days counted from today
+2. 100k repos are binned to at most SCATTER_MAX_POINTS points that still account for every repo
+3. The figure is a WebGL trace on log axes and its JSON stays small at 100k repos
+4. The app draws the scatter from the filtered repos and switches its x axis
+
+Usage:
+    python tests/test_stars_scatter.py
+"""
+
+import json
+import os
+import sys
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dashboard_data
+import dashboard_figures
+import snapshot_utils
+from synthetic_repos import generate_repos
+
+TODAY = datetime(2026, 1, 1)
+
+
+class TestScatterPoints(unittest.TestCase):
+    """scatter_points() with and without binning."""
+
+    def test_small_list_unbinned(self):
+        repos = [
+            {"name": "a", "stargazers_count": 120, "created_at": "2025-12-01T10:00:00Z",
+             "pushed_at": "2026-01-01T08:00:00Z"},
+            {"name": "b", "stargazers_count": 0, "created_at": "2016-01-01T00:00:00Z",
+             "pushed_at": "2025-12-22T00:00:00Z"},
+        ]
+        points = dashboard_data.scatter_points(repos, TODAY)
+        self.assertEqual(points, {"days": [31, 3653], "stars": [120, 0], "names": ["a", "b"],
+                                  "count": [1, 1], "total": 2})
+        self.assertEqual(dashboard_data.scatter_points(repos, TODAY, "last_push")["days"], [1, 10])
+
+    def test_large_list_binned(self):
+        repos = generate_repos(100_000, seed=11, today=TODAY)
+        points = dashboard_data.scatter_points(repos, TODAY)
+        self.assertLessEqual(len(points["days"]), dashboard_data.SCATTER_MAX_POINTS)
+        self.assertEqual(sum(points["count"]), 100_000)
+        self.assertEqual(points["total"], 100_000)
+        top = max(repos, key=lambda r: r["stargazers_count"])
+        self.assertIn(top["name"], points["names"])  # outliers survive binning
+        self.assertEqual(max(points["stars"]), top["stargazers_count"])
+
+
+class TestFigure(unittest.TestCase):
+    """stars_scatter()."""
+
+    def test_webgl_log_axes(self):
+        fig = dashboard_figures.stars_scatter(dashboard_data.scatter_points(generate_repos(300), TODAY))
+        self.assertEqual(fig.data[0].type, "scattergl")
+        self.assertEqual((fig.layout.xaxis.type, fig.layout.yaxis.type), ("log", "log"))
+        self.assertEqual(len(fig.data[0].x), 300)
+        self.assertFalse(fig.layout.annotations)
+
+    def test_payload_bounded(self):
+        points = dashboard_data.scatter_points(generate_repos(100_000, seed=12, today=TODAY), TODAY, "last_push")
+        fig = dashboard_figures.stars_scatter(points, "last_push")
+        self.assertLess(len(fig.to_json()), 1_000_000)
+        self.assertIn("binned", fig.layout.annotations[0].text)
+        self.assertIn("most starred of", fig.data[0].hovertemplate)
+
+
+class TestAppScatter(unittest.TestCase):
+    """The scatter in app.py's stats section."""
+
+    def test_axis_toggle(self):
+        from streamlit.testing.v1 import AppTest
+
+        app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+        with patch.object(snapshot_utils, "GITHUB_API_BASE", "http://127.0.0.1:9"):
+            at = AppTest.from_file(app_path, default_timeout=60)
+            at.session_state.today = datetime(2025, 6, 7)  # the bundled snapshot's default view
+            at.run()
+            self.assertFalse(at.exception)
+            charts = [json.loads(c.proto.spec) for c in at.get("plotly_chart")]
+            scatter = next(c for c in charts if c["data"][0]["type"] == "scattergl")
+            self.assertEqual(len(scatter["data"][0]["y"]), len(at.dataframe[0].value))
+
+            at.radio[0].set_value("last_push").run()
+            self.assertFalse(at.exception)
+            titles = [json.loads(c.proto.spec)["layout"]["title"]["text"] for c in at.get("plotly_chart")]
+            self.assertIn("Stars vs. Time Since Last Push", titles)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
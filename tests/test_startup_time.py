@@ -0,0 +1,58 @@
+"""
+Startup-time budget for the Low-Code Tools Dashboard.
+
+This module tests:
+1. Cold import of the app modules stays under a time budget
+2. pandas, plotly, requests, numpy and scipy are not loaded by our modules until first use
+3. The measured modules are the ones app.py imports at the top level
+
+The budget defaults to 2000 ms and can be overridden with the
+STARTUP_BUDGET_MS environment variable (e.g. on slow CI runners).
+
+Usage:
+    python tests/test_startup_time.py
+"""
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from profile_imports import APP_MODULES, cold_import
+
+STARTUP_BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", "2000"))
+
+
+class TestStartupTime(unittest.TestCase):
+    """Cold import checks, each run in a fresh interpreter."""
+
+    def test_cold_import_within_budget(self):
+        """Importing the app modules must fit in the startup budget."""
+        # Best of three so a single noisy run on a shared machine doesn't fail the build
+        best = min(cold_import(APP_MODULES)[0] for _ in range(3)) * 1000
+        print(f"[OK] Cold import of {', '.join(APP_MODULES)}: {best:.0f} ms")
+        self.assertLess(best, STARTUP_BUDGET_MS,
+                        f"Cold import took {best:.0f} ms (budget {STARTUP_BUDGET_MS:.0f} ms)")
+
+    def test_heavy_modules_loaded_lazily(self):
+        """pandas, plotly, requests, numpy and scipy are imported on first use only."""
+        # Streamlit itself may preload some of these (it registers a plotly theme at import);
+        # only modules our own imports add on top of Streamlit count.
+        _, streamlit_heavy = cold_import(("streamlit",))
+        _, heavy = cold_import(APP_MODULES)
+        added = sorted(set(heavy) - set(streamlit_heavy))
+        self.assertEqual(added, [], f"Loaded at import: {', '.join(added)}")
+
+    def test_app_modules_follow_app_py(self):
+        """APP_MODULES is read from app.py, so new top-level imports are measured too."""
+        self.assertEqual(APP_MODULES[:3], ("datetime", "hmac", "streamlit"))
+        self.assertIn("keyword_analysis", APP_MODULES)  # imported after set_page_config
+        self.assertIn("static_report", APP_MODULES)
+        self.assertNotIn("requests", APP_MODULES)  # imported inside fetch_low_code_repos
+        self.assertNotIn("search_index", APP_MODULES)  # numpy-backed, imported inside get_search_index
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
@@ -0,0 +1,114 @@
+"""
+Tests for the pre-rendered default-view report (static_report.py).
+
+This module tests:
+1. The report holds the default-view table, stats, classifications and figures
+2. The bundle (report.json + index.html) is written and loaded back
+3. Reports are only served for data with the same digest
+4. The app serves the report for the default filter state
+
+Usage:
+    python tests/test_static_report.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dashboard_data
+import perf_metrics
+import snapshot_utils
+import static_report
+from keyword_analysis import KEYWORD_SETS
+from synthetic_repos import generate_repos
+
+TODAY = datetime(2026, 4, 20, 12)
+
+
+class TestBuildReport(unittest.TestCase):
+    """Report contents and the written bundle."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.repos = generate_repos(300, seed=3, today=TODAY)
+        cls.report = static_report.build_report(cls.repos, today=TODAY, source="synthetic")
+
+    def test_contents(self):
+        view = static_report.default_view(self.repos, TODAY)
+        self.assertEqual(self.report["meta"]["repos"], len(view))
+        self.assertEqual(self.report["table"], dashboard_data.table_rows(view))
+        self.assertEqual(set(self.report["analysis"]), set(KEYWORD_SETS))
+        self.assertEqual(self.report["meta"]["digest"], static_report.view_digest(view))
+        self.assertIn("data", self.report["figures"]["stars"])
+
+    def test_digest_tracks_content(self):
+        view = static_report.default_view(self.repos, TODAY)
+        changed = [dict(r) for r in view]
+        changed[0]["stargazers_count"] += 1
+        self.assertNotEqual(static_report.view_digest(view), static_report.view_digest(changed))
+
+    def test_bundle_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = static_report.write_bundle(self.report, tmp)
+            with open(os.path.join(tmp, "index.html"), encoding="utf-8") as f:
+                page = f.read()
+            self.assertIn("Repository Analysis", page)
+            self.assertIn(self.report["table"][0]["URL"], page)
+            with open(json_path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["meta"], self.report["meta"])
+
+            loaded = static_report.load_report_for(self.report["meta"]["digest"], json_path)
+            self.assertIsNotNone(loaded)
+            self.assertEqual(loaded["figures"]["stars"].layout.title.text,
+                             "Distribution of Repositories by Star Count")
+            self.assertIsNone(static_report.load_report_for("other-data", json_path))
+        self.assertIsNone(static_report.load_report_for("anything", os.path.join(tmp, "missing.json")))
+
+
+class TestAppServesReport(unittest.TestCase):
+    """A default-view visit renders from the report instead of recomputing."""
+
+    def test_default_view_uses_report(self):
+        from streamlit.testing.v1 import AppTest
+
+        app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(snapshot_utils, "GITHUB_API_BASE", "http://127.0.0.1:9"), \
+                patch.object(snapshot_utils, "SNAPSHOTS_DIR", tmp), \
+                patch.object(static_report, "REPORT_JSON", os.path.join(tmp, "report.json")):
+            at = AppTest.from_file(app_path, default_timeout=60)
+            at.session_state.today = TODAY
+            at.run()
+            # Build the report from exactly what this session loaded
+            static_report.write_bundle(static_report.build_report(at.session_state.repos, today=TODAY), tmp)
+
+            was_enabled = perf_metrics.ENABLED
+            perf_metrics.enable(log=False)
+            perf_metrics.reset()
+            try:
+                at = AppTest.from_file(app_path, default_timeout=60)
+                at.session_state.today = TODAY
+                at.run()
+                default_counters = perf_metrics.snapshot()["counters"]
+                spans = perf_metrics.snapshot()["spans"]
+                at.slider[0].set_value(100).run()
+                after_slider = perf_metrics.snapshot()["counters"]
+            finally:
+                perf_metrics.enable(was_enabled, log=False)
+
+        self.assertFalse(at.exception)
+        self.assertEqual(default_counters.get("static_report_hits"), 1)
+        self.assertNotIn("table_rows", spans)
+        self.assertNotIn("stats.figures", spans)
+        self.assertEqual(after_slider.get("static_report_hits"), 1)  # filtered views are computed live
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
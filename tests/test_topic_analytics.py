@@ -0,0 +1,75 @@
+"""
+Tests for the sparse topic analytics (topic_analytics.py).
+
+This module tests:
+1. Matrix construction (normalised, de-duplicated topics) and topic counts
+2. Co-occurrence pairs and related-topic ranking
+3. Row subsets and merging matrices built from separate shards
+
+Usage:
+    python tests/test_topic_analytics.py
+"""
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import topic_analytics as ta
+
+
+def _repo(name, topics):
+    return {"name": name, "html_url": f"https://github.com/o/{name}", "topics": topics}
+
+
+REPOS = [
+    _repo("a", ["low-code", "workflow", "ai"]),
+    _repo("b", ["Low-Code", "workflow", "workflow "]),
+    _repo("c", ["uml", "modeling"]),
+    _repo("d", ["uml", "modeling", "workflow"]),
+    _repo("e", []),
+]
+
+
+class TestTopicMatrix(unittest.TestCase):
+    """Sparse matrix and the statistics derived from it."""
+
+    def setUp(self):
+        self.tm = ta.build_topic_matrix(REPOS)
+
+    def test_shape_and_counts(self):
+        self.assertEqual(self.tm.matrix.shape, (5, 5))
+        self.assertEqual(ta.top_topics(self.tm, n=2), [("workflow", 3), ("low-code", 2)])
+        counts = dict(zip(self.tm.topics, ta.topic_counts(self.tm)))
+        self.assertEqual(counts["low-code"], 2)  # case and whitespace normalised, counted once per repo
+
+    def test_pairs(self):
+        pairs = ta.top_pairs(self.tm, n=2)
+        self.assertEqual({frozenset(p[:2]) for p in pairs},
+                         {frozenset({"low-code", "workflow"}), frozenset({"uml", "modeling"})})
+        self.assertTrue(all(p[2] == 2 for p in pairs))
+        excluded = ta.top_pairs(self.tm, exclude=frozenset({"low-code"}))
+        self.assertFalse(any("low-code" in p[:2] for p in excluded))
+
+    def test_related(self):
+        related = ta.related_topics(self.tm, "UML", min_count=1)
+        self.assertEqual(related[0][:2], ("modeling", 2))
+        self.assertAlmostEqual(related[0][2], 1.0)
+        self.assertEqual(ta.related_topics(self.tm, "unknown"), [])
+
+    def test_subset(self):
+        sub = self.tm.subset([REPOS[2], REPOS[3], _repo("not-indexed", ["x"])])
+        self.assertEqual(sub.matrix.shape[0], 2)
+        self.assertEqual(ta.top_topics(sub, n=2), [("uml", 2), ("modeling", 2)])
+
+    def test_merge_shards(self):
+        merged = ta.merge_topic_matrices([ta.build_topic_matrix(REPOS[:2]), ta.build_topic_matrix(REPOS[2:])])
+        self.assertEqual(merged.matrix.shape, self.tm.matrix.shape)
+        self.assertEqual(merged.urls, self.tm.urls)
+        self.assertEqual(ta.top_topics(merged), ta.top_topics(self.tm))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
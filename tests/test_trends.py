@@ -0,0 +1,93 @@
+"""
+Tests for star-growth trend analytics between snapshots (trends.py).
+
+This module tests:
+1. Growth columns (delta, per day, percent) on a small hand-made pair of snapshots
+2. Repos missing from either snapshot are left out; URLs join case-insensitively
+3. The bundled snapshots compare without errors
+
+Usage:
+    python tests/test_trends.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import snapshot_utils
+import trends
+
+HEADER = "Name,Stars⭐,Forks,Issues,Last Updated,First Commit,URL,Language,Description\n"
+
+
+def _write(directory, day, rows):
+    path = os.path.join(directory, f"snapshot-{day}.csv")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(HEADER)
+        for name, stars, forks, issues, url in rows:
+            f.write(f"{name},{stars},{forks},{issues},2025-01-01,2020-01-01,{url},Python,\n")
+    return path
+
+
+class TestSnapshotGrowth(unittest.TestCase):
+    """Growth between two synthetic snapshots ten days apart."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.old = _write(self.tmp.name, "2025-01-01", [
+            ("alpha", 100, 10, 0, "https://github.com/o/alpha"),
+            ("beta", 200, 20, 5, "https://github.com/o/beta"),
+            ("gone", 300, 1, 1, "https://github.com/o/gone"),
+        ])
+        self.new = _write(self.tmp.name, "2025-01-11", [
+            ("alpha", 150, 12, 2, "https://github.com/O/Alpha/"),
+            ("beta", 190, 20, 5, "https://github.com/o/beta"),
+            ("fresh", 999, 9, 9, "https://github.com/o/fresh"),
+        ])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_growth_columns(self):
+        growth = trends.snapshot_growth(self.old, self.new).set_index("Name")
+        self.assertEqual(sorted(growth.index), ["alpha", "beta"])
+        self.assertEqual(growth.attrs["days"], 10)
+        alpha = growth.loc["alpha"]
+        self.assertEqual(alpha["star_delta"], 50)
+        self.assertAlmostEqual(alpha["stars_per_day"], 5.0)
+        self.assertAlmostEqual(alpha["star_growth_pct"], 50.0)
+        # Zero issues before: percentage is relative to 1
+        self.assertAlmostEqual(alpha["issue_growth_pct"], 200.0)
+        self.assertEqual(growth.loc["beta", "star_delta"], -10)
+
+    def test_rank_trending(self):
+        rising, declining = trends.rank_trending(trends.snapshot_growth(self.old, self.new), n=1)
+        self.assertEqual(list(rising["Name"]), ["alpha"])
+        self.assertEqual(list(declining["Name"]), ["beta"])
+
+    def test_rejects_undated_files(self):
+        with self.assertRaises(ValueError):
+            trends.snapshot_growth(self.old, __file__)
+
+
+class TestBundledSnapshots(unittest.TestCase):
+    """The snapshots shipped in snapshots/ compare cleanly."""
+
+    def test_latest_pair(self):
+        snapshots = snapshot_utils.list_snapshots()
+        if len(snapshots) < 2:
+            self.skipTest("fewer than two bundled snapshots")
+        (old_date, old_path), (new_date, new_path) = snapshots[-2:]
+        growth = trends.snapshot_growth(old_path, new_path)
+        self.assertGreater(len(growth), 0)
+        self.assertEqual(growth.attrs["days"], (new_date - old_date).days)
+        self.assertFalse(growth["URL"].duplicated().any())
+        print(f"[OK] {len(growth)} repos in both snapshots over {growth.attrs['days']} days")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
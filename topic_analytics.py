@@ -0,0 +1,136 @@
+"""
+topic_analytics.py – GitHub topic statistics from a sparse repo × topic matrix.
+
+The matrix is built once per dataset (CSR, one row per repo, one column per
+distinct topic, 1 where the repo has the topic). Everything else is a sparse
+product or reduction over it:
+
+    topic counts       column sums
+    co-occurrence      Mᵀ·M (topic × topic, diagonal = topic counts)
+    related topics     one row of Mᵀ·M, ranked by Jaccard similarity
+
+so the cost follows the number of (repo, topic) pairs, not the vocabulary
+squared. Matrices built from separate shards of a crawl can be combined with
+merge_topic_matrices(), which unions the vocabularies.
+
+scipy is imported lazily so the dashboard only pays for it when the Topics
+section runs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+def _normalize(topic: str) -> str:
+    return topic.strip().lower()
+
+
+@dataclass
+class TopicMatrix:
+    matrix: object                 # scipy.sparse.csr_matrix, repos × topics
+    topics: list[str]              # column labels
+    urls: list[str]                # row labels (repository URLs)
+    _row_of: dict = field(default=None, repr=False)
+
+    @property
+    def row_of(self) -> dict[str, int]:
+        """URL -> row position."""
+        if self._row_of is None:
+            self._row_of = {url: i for i, url in enumerate(self.urls)}
+        return self._row_of
+
+    def subset(self, repos: list[dict]) -> TopicMatrix:
+        """The rows of *repos* (matched by html_url; unknown repos are skipped)."""
+        rows = [self.row_of[r["html_url"]] for r in repos if r["html_url"] in self.row_of]
+        return TopicMatrix(self.matrix[rows], self.topics, [self.urls[i] for i in rows])
+
+
+def build_topic_matrix(repos: list[dict]) -> TopicMatrix:
+    """Sparse repo × topic matrix for *repos* (GitHub API format)."""
+    from scipy import sparse
+
+    vocabulary: dict[str, int] = {}
+    indices, indptr = [], [0]
+    for repo in repos:
+        # dict.fromkeys: a topic listed twice still counts once per repo
+        columns = [vocabulary.setdefault(t, len(vocabulary))
+                   for t in dict.fromkeys(_normalize(t) for t in repo.get("topics") or []) if t]
+        indices += columns
+        indptr.append(len(indices))
+    matrix = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.int32), np.asarray(indices, dtype=np.int32), np.asarray(indptr)),
+        shape=(len(repos), len(vocabulary)),
+    )
+    return TopicMatrix(matrix, list(vocabulary), [repo["html_url"] for repo in repos])
+
+
+def merge_topic_matrices(parts: list[TopicMatrix]) -> TopicMatrix:
+    """Stack matrices built from different shards into one over the union of their topics."""
+    from scipy import sparse
+
+    vocabulary: dict[str, int] = {}
+    blocks = []
+    for part in parts:
+        remap = np.asarray([vocabulary.setdefault(t, len(vocabulary)) for t in part.topics], dtype=np.int32)
+        coo = part.matrix.tocoo()
+        blocks.append((coo.row, remap[coo.col], part.matrix.shape[0]))
+    offsets = np.cumsum([0] + [n for _, _, n in blocks])
+    rows = np.concatenate([r + off for (r, _, _), off in zip(blocks, offsets)]) if blocks else np.zeros(0, int)
+    cols = np.concatenate([c for _, c, _ in blocks]) if blocks else np.zeros(0, int)
+    matrix = sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)),
+                               shape=(int(offsets[-1]), len(vocabulary)))
+    return TopicMatrix(matrix, list(vocabulary), [url for part in parts for url in part.urls])
+
+
+def topic_counts(tm: TopicMatrix) -> np.ndarray:
+    """Number of repos per topic, aligned with tm.topics."""
+    return np.asarray(tm.matrix.sum(axis=0)).ravel()
+
+
+def top_topics(tm: TopicMatrix, n: int = 20) -> list[tuple[str, int]]:
+    """The *n* most used topics with their repo counts."""
+    counts = topic_counts(tm)
+    order = np.argsort(-counts, kind="stable")[:n]
+    return [(tm.topics[i], int(counts[i])) for i in order if counts[i] > 0]
+
+
+def cooccurrence(tm: TopicMatrix):
+    """Topic × topic CSR matrix: entry (a, b) is the number of repos tagged with both a and b."""
+    return (tm.matrix.T @ tm.matrix).tocsr()
+
+
+def top_pairs(tm: TopicMatrix, n: int = 20, exclude: frozenset[str] = frozenset()) -> list[tuple[str, str, int]]:
+    """The *n* topic pairs that appear together on the most repos."""
+    from scipy import sparse
+
+    upper = sparse.triu(cooccurrence(tm), k=1).tocoo()
+    keep = np.ones(upper.nnz, dtype=bool)
+    if exclude:
+        excluded = np.zeros(len(tm.topics), dtype=bool)
+        excluded[[i for i, t in enumerate(tm.topics) if t in exclude]] = True
+        keep = ~(excluded[upper.row] | excluded[upper.col])
+    rows, cols, counts = upper.row[keep], upper.col[keep], upper.data[keep]
+    order = np.argsort(-counts, kind="stable")[:n]
+    return [(tm.topics[rows[i]], tm.topics[cols[i]], int(counts[i])) for i in order]
+
+
+def related_topics(tm: TopicMatrix, topic: str, n: int = 10, min_count: int = 2) -> list[tuple[str, int, float]]:
+    """Topics that co-occur with *topic*: (topic, shared repos, Jaccard similarity), most similar first.
+
+    Only one row of the co-occurrence matrix is computed (Mᵀ·M[:, topic]).
+    """
+    topic = _normalize(topic)
+    try:
+        column = tm.topics.index(topic)
+    except ValueError:
+        return []
+    counts = topic_counts(tm)
+    shared = np.asarray((tm.matrix.T @ tm.matrix[:, column]).todense()).ravel()
+    shared[column] = 0
+    candidates = np.flatnonzero(shared >= min_count)
+    jaccard = shared[candidates] / (counts[column] + counts[candidates] - shared[candidates])
+    order = np.argsort(-jaccard, kind="stable")[:n]
+    return [(tm.topics[candidates[i]], int(shared[candidates[i]]), float(jaccard[i])) for i in order]
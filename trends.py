@@ -0,0 +1,83 @@
+"""
+trends.py – Star / fork / issue growth between two dated snapshots.
+
+Snapshots are joined on repository URL (case-insensitive) with a pandas hash
+join, so a comparison is linear in the number of repos, and every growth
+metric is a vectorized column operation. Loaded snapshots are memoized by
+(path, mtime), so comparing many pairs reads each CSV once.
+
+Growth columns (new minus old, per day of the interval between snapshot dates):
+    star_delta, stars_per_day, star_growth_pct
+    fork_delta, forks_per_day, fork_growth_pct
+    issue_delta, issues_per_day, issue_growth_pct
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import date
+from functools import lru_cache
+
+import snapshot_utils
+
+_METRICS = (("Stars⭐", "star", "stars"), ("Forks", "fork", "forks"), ("Issues", "issue", "issues"))
+
+
+def url_key(urls):
+    """Join key for a pandas Series of repository URLs: lower-case, no trailing slash."""
+    return urls.str.strip().str.rstrip("/").str.lower()
+
+
+def url_key_str(url: str) -> str:
+    """url_key() for a single URL."""
+    return url.strip().rstrip("/").lower()
+
+
+@lru_cache(maxsize=32)
+def _load_frame(path: str, mtime: float):
+    import pandas as pd
+
+    df = pd.read_csv(path, encoding="utf-8", keep_default_na=False,
+                     usecols=["Name", "URL", "Stars⭐", "Forks", "Issues", "Language"])
+    df["key"] = url_key(df["URL"])
+    # A URL listed twice would fan out the join; keep the first (highest-starred) row
+    return df.drop_duplicates("key").set_index("key")
+
+
+def load_snapshot_frame(path: str):
+    """Snapshot CSV as a DataFrame indexed by URL key (cached until the file changes)."""
+    return _load_frame(os.path.abspath(path), os.path.getmtime(path))
+
+
+def compute_growth(old, new, old_date: date, new_date: date):
+    """Per-repo growth between snapshot frames *old* and *new* (repos present in both)."""
+    days = max((new_date - old_date).days, 1)
+    joined = old.join(new, how="inner", lsuffix="_old", rsuffix="_new")
+    out = joined[["Name_new", "URL_new", "Language_new"]].rename(
+        columns={"Name_new": "Name", "URL_new": "URL", "Language_new": "Language"}
+    )
+    for column, singular, plural in _METRICS:
+        before = joined[f"{column}_old"].astype("int64")
+        after = joined[f"{column}_new"].astype("int64")
+        delta = after - before
+        out[f"{plural}_old"] = before
+        out[f"{plural}_new"] = after
+        out[f"{singular}_delta"] = delta
+        out[f"{plural}_per_day"] = delta / days
+        # clip(lower=1): growth from zero forks/issues is reported relative to 1
+        out[f"{singular}_growth_pct"] = 100.0 * delta / before.clip(lower=1)
+    out.attrs["days"] = days
+    return out.reset_index(drop=True)
+
+
+def snapshot_growth(old_path: str, new_path: str):
+    """compute_growth() for two snapshot files named snapshot-YYYY-MM-DD.csv."""
+    old_date, new_date = snapshot_utils.snapshot_date(old_path), snapshot_utils.snapshot_date(new_path)
+    if old_date is None or new_date is None:
+        raise ValueError(f"Not snapshot files (snapshot-YYYY-MM-DD.csv): {old_path}, {new_path}")
+    return compute_growth(load_snapshot_frame(old_path), load_snapshot_frame(new_path), old_date, new_date)
+
+
+def rank_trending(growth, n: int = 10, by: str = "stars_per_day"):
+    """Return (rising, declining): the *n* repos with the highest and lowest *by*."""
+    return growth.nlargest(n, by), growth.nsmallest(n, by)